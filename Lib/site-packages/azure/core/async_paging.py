@@ -23,6 +23,7 @@
 # IN THE SOFTWARE.
 #
 # --------------------------------------------------------------------------
+import asyncio
 import collections.abc
 import logging
 from typing import (
@@ -44,7 +45,7 @@ _LOGGER = logging.getLogger(__name__)
 ReturnType = TypeVar("ReturnType")
 ResponseType = TypeVar("ResponseType")
 
-__all__ = ["AsyncPageIterator", "AsyncItemPaged"]
+__all__ = ["AsyncPageIterator", "AsyncItemPaged", "AsyncPrefetchPageIterator"]
 
 
 class AsyncList(AsyncIterator[ReturnType]):
@@ -108,18 +109,146 @@ class AsyncPageIterator(AsyncIterator[AsyncIterator[ReturnType]]):
         return self._current_page
 
 
+_END_OF_PAGES = object()
+
+
+async def _prefetch_pages(
+    pages: AsyncIterator[AsyncIterator[ReturnType]],
+    fetched: "asyncio.Queue[Tuple[Any, Optional[BaseException]]]",
+    slots: asyncio.Semaphore,
+) -> None:
+    # Runs in the prefetch task. It must not reference the AsyncPrefetchPageIterator,
+    # so that an abandoned one can be collected and cancel it in __del__.
+    try:
+        while True:
+            await slots.acquire()
+            try:
+                page = await pages.__anext__()
+            except StopAsyncIteration:
+                fetched.put_nowait((_END_OF_PAGES, None))
+                return
+            fetched.put_nowait((page, None))
+    except asyncio.CancelledError:
+        raise
+    except BaseException as error:  # pylint: disable=broad-except
+        fetched.put_nowait((None, error))
+
+
+class AsyncPrefetchPageIterator(AsyncIterator[AsyncIterator[ReturnType]]):
+    def __init__(self, pages: AsyncIterator[AsyncIterator[ReturnType]], prefetch_pages: int) -> None:
+        """Return an async iterator of pages that fetches pages ahead in a background task.
+
+        The first page is fetched by the caller. After that, up to prefetch_pages pages
+        are requested in a task while the current one is consumed. Fetched pages wait in
+        memory until they are consumed, so at most prefetch_pages pages are buffered.
+        The task stops when the pages are exhausted, on the first error (raised to the
+        caller by the next call) or when this iterator is closed or collected.
+
+        The wrapped iterator is advanced by the task, so it must not be used directly
+        once this iterator is.
+
+        :param pages: An async iterator of pages, such as an AsyncPageIterator
+        :param int prefetch_pages: The maximum number of pages fetched ahead, at least 1
+        """
+        self._task: Optional["asyncio.Task[None]"] = None
+        if prefetch_pages < 1:
+            raise ValueError("prefetch_pages must be at least 1")
+        self._pages = pages
+        self._prefetch_pages = prefetch_pages
+        self._fetched: Optional["asyncio.Queue[Tuple[Any, Optional[BaseException]]]"] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._done = False
+
+    async def __anext__(self) -> AsyncIterator[ReturnType]:
+        if self._done:
+            raise StopAsyncIteration("End of paging")
+        if self._task is None:
+            try:
+                page = await self._pages.__anext__()
+            except BaseException:
+                self._done = True
+                raise
+            # Created here rather than in __init__, to bind them to the running loop
+            self._fetched = asyncio.Queue()
+            self._slots = asyncio.Semaphore(self._prefetch_pages)
+            self._task = asyncio.ensure_future(_prefetch_pages(self._pages, self._fetched, self._slots))
+            return page
+
+        assert self._slots is not None  # Hint for mypy
+        page, error = await self._next_fetched()
+        self._slots.release()
+        if error is not None:
+            self._done = True
+            raise error
+        if page is _END_OF_PAGES:
+            self._done = True
+            raise StopAsyncIteration("End of paging")
+        return page
+
+    async def _next_fetched(self) -> Tuple[Any, Optional[BaseException]]:
+        assert self._fetched is not None and self._task is not None  # Hint for mypy
+        if self._fetched.empty() and not self._task.done():
+            # Wait for the task too: if it is cancelled from outside, nothing is ever queued
+            getter = asyncio.ensure_future(self._fetched.get())
+            try:
+                await asyncio.wait([getter, self._task], return_when=asyncio.FIRST_COMPLETED)
+            except BaseException:
+                getter.cancel()
+                raise
+            if getter.done():
+                return getter.result()
+            getter.cancel()
+        if not self._fetched.empty():
+            return self._fetched.get_nowait()
+        self._done = True
+        raise RuntimeError("The page prefetch task ended without a result")
+
+    async def aclose(self) -> None:
+        """Stop fetching pages."""
+        self._done = True
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def __del__(self) -> None:
+        if self._task is not None and not self._task.done():
+            try:
+                self._task.cancel()
+            except RuntimeError:
+                # Event loop already closed
+                pass
+
+
 class AsyncItemPaged(AsyncIterator[ReturnType]):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Return an async iterator of items.
 
         args and kwargs will be passed to the AsyncPageIterator constructor directly,
-        except page_iterator_class
+        except page_iterator_class and prefetch_pages.
+
+        :keyword int prefetch_pages: When iterating items, fetch up to this many pages
+         ahead in a background task (see AsyncPrefetchPageIterator). Default is 0, fetching
+         the next page only once the current one is consumed.
+        :raises ValueError: If prefetch_pages is negative.
         """
         self._args = args
         self._kwargs = kwargs
         self._page_iterator: Optional[AsyncIterator[AsyncIterator[ReturnType]]] = None
         self._page: Optional[AsyncIterator[ReturnType]] = None
         self._page_iterator_class = self._kwargs.pop("page_iterator_class", AsyncPageIterator)
+        self.prefetch_pages: int = self._kwargs.pop("prefetch_pages", 0)
+        if self.prefetch_pages < 0:
+            raise ValueError("prefetch_pages must not be negative")
+
+    def _iter_pages(
+        self, pages: AsyncIterator[AsyncIterator[ReturnType]]
+    ) -> AsyncIterator[AsyncIterator[ReturnType]]:
+        if self.prefetch_pages:
+            return AsyncPrefetchPageIterator(pages, self.prefetch_pages)
+        return pages
 
     def by_page(
         self,
@@ -138,7 +267,7 @@ class AsyncItemPaged(AsyncIterator[ReturnType]):
 
     async def __anext__(self) -> ReturnType:
         if self._page_iterator is None:
-            self._page_iterator = self.by_page()
+            self._page_iterator = self._iter_pages(self.by_page())
             return await self.__anext__()
         if self._page is None:
             # Let it raise StopAsyncIteration
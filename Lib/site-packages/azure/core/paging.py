@@ -23,7 +23,10 @@
 # IN THE SOFTWARE.
 #
 # --------------------------------------------------------------------------
+import contextvars
 import itertools
+import queue
+import threading
 from typing import (
     Callable,
     Optional,
@@ -87,17 +90,128 @@ class PageIterator(Iterator[Iterator[ReturnType]]):
     next = __next__  # Python 2 compatibility. Can't be removed as some people are using ".next()" even in Py3
 
 
+_END_OF_PAGES = object()
+
+
+def _prefetch_pages(
+    pages: Iterator[Iterator[ReturnType]],
+    fetched: "queue.SimpleQueue[Tuple[Any, Optional[BaseException]]]",
+    slots: threading.Semaphore,
+    stop: threading.Event,
+) -> None:
+    # Runs in the prefetch thread. It must not reference the PrefetchPageIterator,
+    # so that an abandoned one can be collected and stop it in __del__.
+    try:
+        while True:
+            while not slots.acquire(timeout=0.1):
+                if stop.is_set():
+                    return
+            if stop.is_set():
+                return
+            try:
+                page = next(pages)
+            except StopIteration:
+                fetched.put((_END_OF_PAGES, None))
+                return
+            fetched.put((page, None))
+    except BaseException as error:  # pylint: disable=broad-except
+        fetched.put((None, error))
+
+
+class PrefetchPageIterator(Iterator[Iterator[ReturnType]]):
+    def __init__(self, pages: Iterator[Iterator[ReturnType]], prefetch_pages: int) -> None:
+        """Return an iterator of pages that fetches pages ahead in a background thread.
+
+        The first page is fetched by the caller. After that, up to prefetch_pages pages
+        are requested in a daemon thread while the current one is consumed. Fetched pages
+        wait in memory until they are consumed, so at most prefetch_pages pages are buffered.
+        The thread stops when the pages are exhausted, on the first error (raised to the
+        caller by the next call) or when this iterator is closed or collected.
+
+        The wrapped iterator is advanced by the thread, so it must not be used directly
+        once this iterator is.
+
+        :param pages: An iterator of pages, such as a PageIterator
+        :param int prefetch_pages: The maximum number of pages fetched ahead, at least 1
+        """
+        self._stop = threading.Event()
+        if prefetch_pages < 1:
+            raise ValueError("prefetch_pages must be at least 1")
+        self._pages = pages
+        self._fetched: "queue.SimpleQueue[Tuple[Any, Optional[BaseException]]]" = queue.SimpleQueue()
+        self._slots = threading.Semaphore(prefetch_pages)
+        self._thread: Optional[threading.Thread] = None
+        self._done = False
+
+    def __iter__(self) -> Iterator[Iterator[ReturnType]]:
+        return self
+
+    def __next__(self) -> Iterator[ReturnType]:
+        if self._done:
+            raise StopIteration("End of paging")
+        if self._thread is None:
+            try:
+                page = next(self._pages)
+            except BaseException:
+                self._done = True
+                raise
+            # Copy the context so that tracing spans and other context variables apply to
+            # the requests made by the thread
+            context = contextvars.copy_context()
+            self._thread = threading.Thread(
+                target=context.run,
+                args=(_prefetch_pages, self._pages, self._fetched, self._slots, self._stop),
+                name="azure-core-prefetch",
+                daemon=True,
+            )
+            self._thread.start()
+            return page
+
+        page, error = self._fetched.get()
+        self._slots.release()
+        if error is not None:
+            self._done = True
+            raise error
+        if page is _END_OF_PAGES:
+            self._done = True
+            raise StopIteration("End of paging")
+        return page
+
+    next = __next__
+
+    def close(self) -> None:
+        """Stop fetching pages."""
+        self._done = True
+        self._stop.set()
+
+    def __del__(self) -> None:
+        self._stop.set()
+
+
 class ItemPaged(Iterator[ReturnType]):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Return an iterator of items.
 
         args and kwargs will be passed to the PageIterator constructor directly,
-        except page_iterator_class
+        except page_iterator_class and prefetch_pages.
+
+        :keyword int prefetch_pages: When iterating items, fetch up to this many pages
+         ahead in a background thread (see PrefetchPageIterator). Default is 0, fetching
+         the next page only once the current one is consumed.
+        :raises ValueError: If prefetch_pages is negative.
         """
         self._args = args
         self._kwargs = kwargs
         self._page_iterator: Optional[Iterator[ReturnType]] = None
         self._page_iterator_class = self._kwargs.pop("page_iterator_class", PageIterator)
+        self.prefetch_pages: int = self._kwargs.pop("prefetch_pages", 0)
+        if self.prefetch_pages < 0:
+            raise ValueError("prefetch_pages must not be negative")
+
+    def _iter_pages(self, pages: Iterator[Iterator[ReturnType]]) -> Iterator[Iterator[ReturnType]]:
+        if self.prefetch_pages:
+            return PrefetchPageIterator(pages, self.prefetch_pages)
+        return pages
 
     def by_page(self, continuation_token: Optional[str] = None) -> Iterator[Iterator[ReturnType]]:
         """Get an iterator of pages of objects, instead of an iterator of objects.
@@ -119,7 +233,7 @@ class ItemPaged(Iterator[ReturnType]):
 
     def __next__(self) -> ReturnType:
         if self._page_iterator is None:
-            self._page_iterator = itertools.chain.from_iterable(self.by_page())
+            self._page_iterator = itertools.chain.from_iterable(self._iter_pages(self.by_page()))
         return next(self._page_iterator)
 
     next = __next__  # Python 2 compatibility. Can't be removed as some people are using ".next()" even in Py3
@@ -1354,6 +1354,104 @@ def xml_key_extractor(attr, attr_desc, data):
     return children[0]
 
 
+def _rest_key_path(key):
+    """Split an attribute map key into the JSON keys "rest_key_extractor" follows.
+
+    :param str key: The attribute map key, e.g. "properties.name".
+    :rtype: list[str]
+    """
+    path = []
+    while "." in key:
+        dict_keys = _FLATTEN.split(key)
+        if len(dict_keys) == 1:
+            key = _decode_attribute_map_key(dict_keys[0])
+            break
+        path.append(_decode_attribute_map_key(dict_keys[0]))
+        key = ".".join(dict_keys[1:])
+    path.append(key)
+    return path
+
+
+def _identity(value):
+    return value
+
+
+def _deserialize_str(value):
+    if type(value) is str:  # pylint: disable=unidiomatic-typecheck
+        return value
+    return Deserializer.deserialize_unicode(value)
+
+
+class _DeserializationPlan(object):
+    """How to deserialize JSON data into one model class.
+
+    Compiled once per class from its _attribute_map and _validation, so that
+    deserializing an instance does no per-attribute type string parsing,
+    dependency lookup or key extractor dispatch.
+
+    :param Deserializer deserializer: The deserializer compiling the plan.
+    :param type model: The model class.
+    """
+
+    def __init__(self, deserializer, model):
+        attribute_map = model._attribute_map
+        self.model = model
+        self.class_name = model.__class__.__name__
+        # Polymorphic classes go through _classify for every instance
+        self.classify = bool(model.__dict__.get("_subtype_map"))
+        # (attr, key if not flattened, key path, type, converter, wrap errors)
+        self.attributes = []
+        for attr, attr_desc in attribute_map.items():
+            # Check empty string. If it's not empty, someone has a real "additionalProperties"...
+            if attr == "additional_properties" and attr_desc["key"] == "":
+                continue
+            path = _rest_key_path(attr_desc["key"])
+            data_type = attr_desc["type"]
+            # deserialize_data lets the errors of a nested model through as they are
+            obj_type = deserializer.dependencies.get(data_type)
+            self.attributes.append(
+                (
+                    attr,
+                    path[0] if len(path) == 1 else None,
+                    path,
+                    data_type,
+                    deserializer._compile_converter(data_type),  # pylint: disable=protected-access
+                    obj_type is None or issubclass(obj_type, Enum),
+                )
+            )
+
+        # Same rules as Deserializer._build_additional_properties
+        self.additional_properties = not (
+            "additional_properties" in attribute_map and attribute_map["additional_properties"].get("key") != ""
+        )
+        self.known_keys = frozenset(
+            _decode_attribute_map_key(_FLATTEN.split(desc["key"])[0])
+            for desc in attribute_map.values()
+            if desc["key"] != ""
+        )
+
+        # Same rules as Deserializer._instantiate_model
+        subtype = getattr(model, "_subtype_map", {})
+        self.readonly = [k for k, v in model._validation.items() if v.get("readonly")]
+        const = [k for k, v in model._validation.items() if v.get("constant")]
+        self.init_attrs = [
+            attr for attr, _, _, _, _, _ in self.attributes if attr not in subtype and attr not in self.readonly + const
+        ]
+
+
+def _follow_rest_key_path(path, data):
+    # Same walk as rest_key_extractor
+    working_data = data
+    for working_key in path[:-1]:
+        working_data = working_data.get(working_key, data)
+        if working_data is None:
+            return None
+    return working_data.get(path[-1])
+
+
+_DEFAULT_KEY_EXTRACTORS = [rest_key_extractor, xml_key_extractor]
+
+
 class Deserializer(object):
     """Response object model deserializer.
 
@@ -1394,6 +1492,8 @@ class Deserializer(object):
         # used if your expect the deserialization to NOT come from a JSON REST syntax.
         # Otherwise, result are unexpected
         self.additional_properties_detection = True
+        # Compiled _DeserializationPlan of each model class, see _get_plan
+        self._plans: Dict[type, _DeserializationPlan] = {}
 
     def __call__(self, target_obj, response_data, content_type=None):
         """Call the deserializer to process a REST response.
@@ -1445,6 +1545,12 @@ class Deserializer(object):
 
         if data is None or data is CoreNull:
             return data
+        if (
+            isinstance(data, dict)
+            and isinstance(response, type)
+            and self.key_extractors == _DEFAULT_KEY_EXTRACTORS
+        ):
+            return self._deserialize_with_plan(self._get_plan(response), data)
         try:
             attributes = response._attribute_map  # type: ignore
             d_attrs = {}
@@ -1480,6 +1586,133 @@ class Deserializer(object):
             additional_properties = self._build_additional_properties(attributes, data)
             return self._instantiate_model(response, d_attrs, additional_properties)
 
+    def _get_plan(self, model):
+        """Get the compiled deserialization plan of a model class.
+
+        Plans are compiled on first use from the class attribute map and
+        this deserializer's dependencies and deserialize_type.
+
+        :param type model: The model class.
+        :rtype: _DeserializationPlan
+        """
+        try:
+            return self._plans[model]
+        except KeyError:
+            plan = self._plans[model] = _DeserializationPlan(self, model)
+            return plan
+
+    def _deserialize_with_plan(self, plan, data):
+        """Deserialize JSON data with a compiled plan.
+
+        Equivalent to the generic path of _deserialize with the default key
+        extractors, which is what REST responses use.
+
+        :param _DeserializationPlan plan: The plan of the target class.
+        :param dict data: The JSON object to deserialize.
+        :raises: DeserializationError if deserialization fails.
+        :return: Deserialized object.
+        """
+        d_attrs = {}
+        try:
+            for attr, key, path, data_type, convert, wrap_errors in plan.attributes:
+                raw_value = data.get(key) if key is not None else _follow_rest_key_path(path, data)
+                if raw_value is None:
+                    d_attrs[attr] = None
+                    continue
+                try:
+                    d_attrs[attr] = convert(raw_value)
+                except (ValueError, TypeError, AttributeError) as err:
+                    if not wrap_errors:
+                        raise
+                    msg = "Unable to deserialize response data."
+                    msg += " Data: {}, {}".format(raw_value, data_type)
+                    raise DeserializationError(msg) from err
+        except (AttributeError, TypeError, KeyError) as err:
+            msg = "Unable to deserialize to object: " + plan.class_name
+            raise DeserializationError(msg) from err
+
+        additional_properties = None
+        if plan.additional_properties and self.additional_properties_detection:
+            known_keys = plan.known_keys
+            additional_properties = {key: value for key, value in data.items() if key not in known_keys}
+
+        kwargs = {attr: d_attrs[attr] for attr in plan.init_attrs}
+        try:
+            response_obj = plan.model(**kwargs)
+            for attr in plan.readonly:
+                setattr(response_obj, attr, d_attrs.get(attr))
+            if additional_properties:
+                response_obj.additional_properties = additional_properties
+            return response_obj
+        except TypeError as err:
+            msg = "Unable to deserialize {} into model {}. ".format(kwargs, plan.model)
+            raise DeserializationError(msg + str(err))
+
+    def _compile_converter(self, data_type):
+        """Compile a function deserializing JSON data to a data type.
+
+        The function does what deserialize_data does for JSON data, minus
+        the dispatch on the type string. It is only called with data that
+        is not None.
+
+        :param str data_type: The type to deserialize to.
+        :rtype: callable
+        """
+        if not data_type:
+            return _identity
+        if data_type in self.basic_types.values():
+            if data_type == "str":
+                return _deserialize_str
+            if data_type == "bool":
+                return lambda value: self.deserialize_basic(value, "bool")
+            return int if data_type == "int" else float
+        if data_type in self.deserialize_type:
+            deserialize = self.deserialize_type[data_type]
+            expected_types = self.deserialize_expected_types.get(data_type)
+            if expected_types is None:
+                return deserialize
+            return lambda value: value if isinstance(value, expected_types) else deserialize(value)
+
+        iter_type = data_type[0] + data_type[-1]
+        if iter_type == "[]":
+            convert_item = self._compile_converter(data_type[1:-1])
+
+            def convert_list(value):
+                if not isinstance(value, (list, set)):
+                    raise DeserializationError(
+                        "Cannot deserialize as [{}] an object of type {}".format(data_type[1:-1], type(value))
+                    )
+                return [None if item is None else convert_item(item) for item in value]
+
+            return convert_list
+        if iter_type == "{}":
+            convert_item = self._compile_converter(data_type[1:-1])
+
+            def convert_dict(value):
+                if isinstance(value, list):
+                    return {x["key"]: None if x["value"] is None else convert_item(x["value"]) for x in value}
+                return {k: None if v is None else convert_item(v) for k, v in value.items()}
+
+            return convert_dict
+
+        obj_type = self.dependencies.get(data_type)
+        if obj_type is None:
+            # Unknown type, let deserialize_data raise as usual
+            return lambda value: self.deserialize_data(value, data_type)
+        if issubclass(obj_type, Enum):
+            return lambda value: self.deserialize_enum(value, obj_type)
+        if not hasattr(obj_type, "_attribute_map"):
+            return lambda value: self._deserialize(obj_type, value)
+
+        def convert_model(value):
+            # The plan is looked up on call, as models can be recursive
+            plan = self._get_plan(obj_type)
+            if plan.classify or not isinstance(value, dict):
+                return self._deserialize(obj_type, value)
+            return self._deserialize_with_plan(plan, value)
+
+        return convert_model
+
     def _build_additional_properties(self, attribute_map, data):
         if not self.additional_properties_detection:
             return None
@@ -3,14 +3,24 @@
 # Licensed under the MIT License. See License.txt in the project root for
 # license information.
 # --------------------------------------------------------------------------
-from typing import List, Optional, Dict, cast
+from typing import Any, Iterable, List, MutableMapping, Optional, Dict, Tuple, Type, cast
 
 import base64
 import itertools
 import json
 
+from azure.core.exceptions import (
+    ClientAuthenticationError,
+    HttpResponseError,
+    ResourceExistsError,
+    ResourceNotFoundError,
+    ResourceNotModifiedError,
+    map_error,
+)
 from azure.core.paging import ItemPaged, PageIterator, ReturnType
-from ._generated.models import SearchRequest, SearchDocumentsResult, QueryAnswerResult
+from azure.core.rest import HttpRequest
+from ._generated.models import ErrorResponse, SearchRequest, SearchDocumentsResult, QueryAnswerResult
+from ._generated.operations._documents_operations import build_search_post_request
 from ._api_versions import DEFAULT_VERSION
 
 
@@ -23,6 +33,84 @@ def convert_search_result(result):
     return ret
 
 
+def project_search_result(result: Dict, fields: List[str]) -> Dict:
+    return {field: result[field] for field in fields if field in result}
+
+
+def convert_search_results(
+    results: List[Any], raw_results: bool = False, result_fields: Optional[List[str]] = None
+) -> Iterable[Dict]:
+    """Turn the results of a page into the dicts returned to the user.
+
+    :param list results: SearchResult models, or the result dicts of the response
+        JSON with raw_results.
+    :param bool raw_results: Whether results are the dicts of the response JSON.
+    :param list[str] result_fields: Keys to keep in each result; all if None.
+    :return: The results, projected lazily when result_fields is set.
+    :rtype: iterable[dict]
+    """
+    if not raw_results:
+        results = [convert_search_result(r) for r in results]
+    if result_fields is None:
+        return results
+    return (project_search_result(r, result_fields) for r in results)
+
+
+def build_raw_search_request(
+    client, search_request: SearchRequest, kwargs: Dict[str, Any]
+) -> Tuple[HttpRequest, MutableMapping[int, Type[HttpResponseError]], Dict[str, Any]]:
+    """Build the request of ``client.documents.search_post`` for a raw_results search.
+
+    :return: The request, the error map and the remaining keyword arguments
+        for ``client._send_request``.
+    """
+    kwargs = dict(kwargs)
+    error_map: MutableMapping[int, Type[HttpResponseError]] = {
+        401: ClientAuthenticationError,
+        404: ResourceNotFoundError,
+        409: ResourceExistsError,
+        304: ResourceNotModifiedError,
+    }
+    error_map.update(kwargs.pop("error_map", {}) or {})
+    request = build_search_post_request(
+        api_version=client._config.api_version,  # pylint:disable=protected-access
+        content_type="application/json",
+        json=client._serialize.body(search_request, "SearchRequest"),  # pylint:disable=protected-access
+        headers=kwargs.pop("headers", None),
+    )
+    return request, error_map, kwargs
+
+
+def deserialize_raw_search_response(client, response, error_map) -> SearchDocumentsResult:
+    """Deserialize a search response read by a raw_results search.
+
+    Only the page metadata (count, facets, answers, continuation...) is
+    deserialized into models; ``results`` is the list of result dicts of
+    the response JSON.
+
+    :rtype: ~azure.search.documents.models.SearchDocumentsResult
+    """
+    # pylint:disable=protected-access
+    if response.status_code not in [200]:
+        map_error(status_code=response.status_code, response=response, error_map=error_map)
+        error = client._deserialize.failsafe_deserialize(
+            ErrorResponse, response.text(), content_type=response.headers.get("Content-Type")
+        )
+        raise HttpResponseError(response=response, model=error)
+
+    data = response.json()
+    results = data.pop("value", None) or []
+    deserialized = client._deserialize("SearchDocumentsResult", data)
+    deserialized.results = results
+    return deserialized
+
+
+def convert_facets(facets) -> Optional[Dict]:
+    if facets is None:
+        return None
+    return {k: [x.as_dict() for x in v] for k, v in facets.items()}
+
+
 def pack_continuation_token(response, api_version=DEFAULT_VERSION):
     if response.next_page_parameters is not None:
         token = {
@@ -50,7 +138,7 @@ class SearchItemPaged(ItemPaged[ReturnType]):
     def __next__(self) -> ReturnType:
         if self._page_iterator is None:
             first_iterator = self._first_iterator_instance()
-            self._page_iterator = itertools.chain.from_iterable(first_iterator)
+            self._page_iterator = itertools.chain.from_iterable(self._iter_pages(first_iterator))
         return next(self._page_iterator)
 
     def _first_iterator_instance(self) -> "SearchPageIterator":
@@ -58,12 +146,22 @@ class SearchItemPaged(ItemPaged[ReturnType]):
             self._first_page_iterator_instance = cast(SearchPageIterator, self.by_page())
         return self._first_page_iterator_instance
 
+    def _prefetched_response(self) -> Optional[SearchDocumentsResult]:
+        # With prefetch_pages, a thread advances the page iterator once the first page
+        # is fetched: read the first page's response instead of touching the iterator.
+        if not self.prefetch_pages:
+            return None
+        return self._first_iterator_instance().first_response
+
     def get_facets(self) -> Optional[Dict]:
         """Return any facet results if faceting was requested.
 
         :return: facet results
         :rtype: dict or None
         """
+        response = self._prefetched_response()
+        if response is not None:
+            return convert_facets(response.facets)
         return cast(Dict, self._first_iterator_instance().get_facets())
 
     def get_coverage(self) -> float:
@@ -73,6 +171,9 @@ class SearchItemPaged(ItemPaged[ReturnType]):
         :return: coverage percentage
         :rtype: float
         """
+        response = self._prefetched_response()
+        if response is not None:
+            return cast(float, response.coverage)
         return cast(float, self._first_iterator_instance().get_coverage())
 
     def get_count(self) -> int:
@@ -82,6 +183,9 @@ class SearchItemPaged(ItemPaged[ReturnType]):
         :return: count of results
         :rtype: int
         """
+        response = self._prefetched_response()
+        if response is not None:
+            return cast(int, response.count)
         return cast(int, self._first_iterator_instance().get_count())
 
     def get_answers(self) -> Optional[List[QueryAnswerResult]]:
@@ -91,6 +195,9 @@ class SearchItemPaged(ItemPaged[ReturnType]):
         :return: answers
         :rtype: list[~azure.search.documents.models.QueryAnswerResult] or None
         """
+        response = self._prefetched_response()
+        if response is not None:
+            return response.answers
         return cast(List[QueryAnswerResult], self._first_iterator_instance().get_answers())
 
 
@@ -108,7 +215,9 @@ def _ensure_response(f):
 
 
 class SearchPageIterator(PageIterator):
-    def __init__(self, client, initial_query, kwargs, continuation_token=None) -> None:
+    def __init__(
+        self, client, initial_query, kwargs, continuation_token=None, raw_results=False, result_fields=None
+    ) -> None:
         super(SearchPageIterator, self).__init__(
             get_next=self._get_next_cb,
             extract_data=self._extract_data_cb,
@@ -119,18 +228,33 @@ class SearchPageIterator(PageIterator):
         self._kwargs = kwargs
         self._facets = None
         self._api_version = kwargs.pop("api_version", DEFAULT_VERSION)
+        self._raw_results = raw_results
+        self._result_fields = result_fields
+        # Response of the first page fetched, kept for the getters of a prefetching SearchItemPaged
+        self.first_response: Optional[SearchDocumentsResult] = None
 
     def _get_next_cb(self, continuation_token):
         if continuation_token is None:
-            return self._client.documents.search_post(search_request=self._initial_query.request, **self._kwargs)
+            search_request = self._initial_query.request
+        else:
+            _next_link, search_request = unpack_continuation_token(continuation_token)
 
-        _next_link, next_page_request = unpack_continuation_token(continuation_token)
+        if self._raw_results:
+            return self._search_post_raw(search_request)
+        return self._client.documents.search_post(search_request=search_request, **self._kwargs)
 
-        return self._client.documents.search_post(search_request=next_page_request, **self._kwargs)
+    def _search_post_raw(self, search_request):
+        request, error_map, kwargs = build_raw_search_request(self._client, search_request, self._kwargs)
+        # stream so that the pipeline does not parse the JSON before response.json() does
+        response = self._client._send_request(request, stream=True, **kwargs)  # pylint:disable=protected-access
+        response.read()
+        return deserialize_raw_search_response(self._client, response, error_map)
 
     def _extract_data_cb(self, response):
+        if self.first_response is None:
+            self.first_response = response
         continuation_token = pack_continuation_token(response, api_version=self._api_version)
-        results = [convert_search_result(r) for r in response.results]
+        results = convert_search_results(response.results, self._raw_results, self._result_fields)
         return continuation_token, results
 
     @_ensure_response
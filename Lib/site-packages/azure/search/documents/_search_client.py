@@ -169,6 +169,9 @@ class SearchClient(HeadersMixin):
         vector_filter_mode: Optional[Union[str, VectorFilterMode]] = None,
         semantic_error_mode: Optional[Union[str, SemanticErrorMode]] = None,
         semantic_max_wait_in_milliseconds: Optional[int] = None,
+        raw_results: bool = False,
+        result_fields: Optional[List[str]] = None,
+        prefetch_pages: int = 0,
         **kwargs: Any
     ) -> SearchItemPaged[Dict]:
         # pylint:disable=too-many-locals, disable=redefined-builtin
@@ -269,6 +272,16 @@ class SearchClient(HeadersMixin):
         :keyword vector_filter_mode: Determines whether or not filters are applied before or after the
              vector search is performed. Default is 'preFilter'. Known values are: "postFilter" and "preFilter".
         :paramtype vector_filter_mode: str or VectorFilterMode
+        :keyword bool raw_results: Return each result as the dict sent by the service, without deserializing
+            it into a model first. Keys are as in the REST API, e.g. "@search.rerankerScore", and captions are
+            dicts. Default is False.
+        :keyword list[str] result_fields: Keys to keep in each returned result, e.g. ["title", "@search.score"].
+            Results are then projected one at a time as they are iterated. Unlike `select`, this does not change
+            the request. Default is None, keeping all keys.
+        :keyword int prefetch_pages: When iterating results, request up to this many pages ahead in the
+            background while the current page is consumed, so that request latency overlaps with the processing
+            of results. Fetched pages are kept in memory until consumed. Default is 0, requesting the next page
+            only once the current one is consumed.
         :return: List of search results.
         :rtype:  SearchItemPaged[dict]
 
@@ -350,7 +363,15 @@ class SearchClient(HeadersMixin):
 
         kwargs["headers"] = self._merge_client_headers(kwargs.get("headers"))
         kwargs["api_version"] = self._api_version
-        return SearchItemPaged(self._client, query, kwargs, page_iterator_class=SearchPageIterator)
+        return SearchItemPaged(
+            self._client,
+            query,
+            kwargs,
+            page_iterator_class=SearchPageIterator,
+            raw_results=raw_results,
+            result_fields=result_fields,
+            prefetch_pages=prefetch_pages,
+        )
 
     @distributed_trace
     def suggest(
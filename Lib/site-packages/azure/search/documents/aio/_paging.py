@@ -9,7 +9,10 @@ from azure.core.paging import ReturnType
 from azure.core.async_paging import AsyncItemPaged, AsyncPageIterator
 from .._generated.models import QueryAnswerResult, SearchDocumentsResult
 from .._paging import (
-    convert_search_result,
+    build_raw_search_request,
+    convert_facets,
+    convert_search_results,
+    deserialize_raw_search_response,
     pack_continuation_token,
     unpack_continuation_token,
 )
@@ -23,8 +26,8 @@ class AsyncSearchItemPaged(AsyncItemPaged[ReturnType]):
 
     async def __anext__(self) -> ReturnType:
         if self._page_iterator is None:
-            self._page_iterator = self.by_page()
-            self._first_page_iterator_instance = cast(AsyncSearchPageIterator, self._page_iterator)
+            self._first_page_iterator_instance = cast(AsyncSearchPageIterator, self.by_page())
+            self._page_iterator = self._iter_pages(self._first_page_iterator_instance)
             return await self.__anext__()
         if self._page is None:
             # Let it raise StopAsyncIteration
@@ -38,16 +41,26 @@ class AsyncSearchItemPaged(AsyncItemPaged[ReturnType]):
 
     def _first_iterator_instance(self) -> "AsyncSearchPageIterator":
         if self._first_page_iterator_instance is None:
-            self._page_iterator = cast(AsyncSearchPageIterator, self.by_page())
-            self._first_page_iterator_instance = self._page_iterator
+            self._first_page_iterator_instance = cast(AsyncSearchPageIterator, self.by_page())
+            self._page_iterator = self._iter_pages(self._first_page_iterator_instance)
         return self._first_page_iterator_instance
 
+    def _prefetched_response(self) -> Optional[SearchDocumentsResult]:
+        # With prefetch_pages, a task advances the page iterator once the first page
+        # is fetched: read the first page's response instead of touching the iterator.
+        if not self.prefetch_pages:
+            return None
+        return self._first_iterator_instance().first_response
+
     async def get_facets(self) -> Optional[Dict]:
         """Return any facet results if faceting was requested.
 
         :return: Facet results.
         :rtype: dict
         """
+        response = self._prefetched_response()
+        if response is not None:
+            return convert_facets(response.facets)
         return cast(Dict, await self._first_iterator_instance().get_facets())
 
     async def get_coverage(self) -> float:
@@ -57,6 +70,9 @@ class AsyncSearchItemPaged(AsyncItemPaged[ReturnType]):
         :return: Coverage percentage.
         :rtype: float
         """
+        response = self._prefetched_response()
+        if response is not None:
+            return cast(float, response.coverage)
         return cast(float, await self._first_iterator_instance().get_coverage())
 
     async def get_count(self) -> int:
@@ -66,6 +82,9 @@ class AsyncSearchItemPaged(AsyncItemPaged[ReturnType]):
         :return: Count of results.
         :rtype: int
         """
+        response = self._prefetched_response()
+        if response is not None:
+            return cast(int, response.count)
         return cast(int, await self._first_iterator_instance().get_count())
 
     async def get_answers(self) -> Optional[List[QueryAnswerResult]]:
@@ -75,6 +94,9 @@ class AsyncSearchItemPaged(AsyncItemPaged[ReturnType]):
         :return: Answers.
         :rtype: list[~azure.search.documents.QueryAnswerResult]
         """
+        response = self._prefetched_response()
+        if response is not None:
+            return response.answers
         return cast(List[QueryAnswerResult], await self._first_iterator_instance().get_answers())
 
 
@@ -92,7 +114,9 @@ def _ensure_response(f):
 
 
 class AsyncSearchPageIterator(AsyncPageIterator[ReturnType]):
-    def __init__(self, client, initial_query, kwargs, continuation_token=None) -> None:
+    def __init__(
+        self, client, initial_query, kwargs, continuation_token=None, raw_results=False, result_fields=None
+    ) -> None:
         super(AsyncSearchPageIterator, self).__init__(
             get_next=self._get_next_cb,
             extract_data=self._extract_data_cb,
@@ -103,18 +127,35 @@ class AsyncSearchPageIterator(AsyncPageIterator[ReturnType]):
         self._kwargs = kwargs
         self._facets = None
         self._api_version = kwargs.pop("api_version", DEFAULT_VERSION)
+        self._raw_results = raw_results
+        self._result_fields = result_fields
+        # Response of the first page fetched, kept for the getters of a prefetching AsyncSearchItemPaged
+        self.first_response: Optional[SearchDocumentsResult] = None
 
     async def _get_next_cb(self, continuation_token):
         if continuation_token is None:
-            return await self._client.documents.search_post(search_request=self._initial_query.request, **self._kwargs)
-
-        _next_link, next_page_request = unpack_continuation_token(continuation_token)
-
-        return await self._client.documents.search_post(search_request=next_page_request, **self._kwargs)
+            search_request = self._initial_query.request
+        else:
+            _next_link, search_request = unpack_continuation_token(continuation_token)
+
+        if self._raw_results:
+            return await self._search_post_raw(search_request)
+        return await self._client.documents.search_post(search_request=search_request, **self._kwargs)
+
+    async def _search_post_raw(self, search_request):
+        request, error_map, kwargs = build_raw_search_request(self._client, search_request, self._kwargs)
+        # stream so that the pipeline does not parse the JSON before response.json() does
+        response = await self._client._send_request(  # pylint:disable=protected-access
+            request, stream=True, **kwargs
+        )
+        await response.read()
+        return deserialize_raw_search_response(self._client, response, error_map)
 
     async def _extract_data_cb(self, response):
+        if self.first_response is None:
+            self.first_response = response
         continuation_token = pack_continuation_token(response, api_version=self._api_version)
-        results = [convert_search_result(r) for r in response.results]
+        results = convert_search_results(response.results, self._raw_results, self._result_fields)
         return continuation_token, results
 
     @_ensure_response
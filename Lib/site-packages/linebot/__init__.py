@@ -37,6 +37,7 @@ from .webhook import (  # noqa
     SignatureValidator,
     WebhookParser,
     WebhookHandler,
+    AsyncWebhookHandler,
     WebhookPayload,
 )
 
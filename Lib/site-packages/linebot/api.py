@@ -67,7 +67,10 @@ class LineBotApi(object):
             Default is linebot.http_client.HttpClient.DEFAULT_TIMEOUT
         :type timeout: float | tuple(float, float)
         :param http_client: (optional) Default is
-            :py:class:`linebot.http_client.RequestsHttpClient`
+            :py:class:`linebot.http_client.RequestsHttpClient`.
+            It is called with ``timeout``; pass e.g.
+            ``functools.partial(RequestsHttpClient, pool_maxsize=20)``
+            to size the connection pool
         :type http_client: T <= :py:class:`linebot.http_client.HttpClient`
         """
         self.data_endpoint = data_endpoint
@@ -82,6 +85,18 @@ class LineBotApi(object):
         else:
             self.http_client = RequestsHttpClient(timeout=timeout)
 
+    def close(self):
+        """Close the HTTP client and its pooled connections."""
+        self.http_client.close()
+
+    def __enter__(self):
+        """__enter__ method."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """__exit__ method."""
+        self.close()
+
     @deprecated(reason="Use 'from linebot.v3.messaging import MessagingApi' and 'MessagingApi(...).reply_message(...)' instead. See https://github.com/line/line-bot-sdk-python/blob/master/README.rst for more details.", version='3.0.0', category=LineBotSdkDeprecatedIn30)  # noqa: E501
     def reply_message(self, reply_token, messages, notification_disabled=False, timeout=None):
         """Call reply message API.
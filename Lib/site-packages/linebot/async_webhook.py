@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.async_webhook module.
+
+asyncio dispatch shared by ``linebot.webhook.AsyncWebhookHandler`` and
+``linebot.v3.webhook.AsyncWebhookHandler``. It only relies on the
+``_find_handler`` and ``_get_invoke_args`` methods of the WebhookHandler it
+is mixed into, so it is independent of the event models.
+"""
+
+import asyncio
+import functools
+import inspect
+
+
+class AsyncWebhookHandlerMixin(object):
+    """Mixin dispatching parsed events to coroutine or plain handlers.
+
+    Mix it in before a WebhookHandler and set ``self.executor``.
+    """
+
+    executor = None
+
+    async def dispatch(self, event, destination=None):
+        """Invoke the handler registered for a single parsed event.
+
+        :param event: Event to handle
+        :param str destination: (optional) User ID of the bot which received the event
+        """
+        func = self._find_handler(event)
+        if func is not None:
+            await self._invoke_func_async(func, event, destination)
+
+    async def _dispatch_payload(self, payload):
+        results = await asyncio.gather(
+            *[self.dispatch(event, payload.destination) for event in payload.events],
+            return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _invoke_func_async(self, func, event, destination):
+        args = self._get_invoke_args(func, event, destination)
+        if asyncio.iscoroutinefunction(func):
+            return await func(*args)
+
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            self.executor, functools.partial(func, *args))
+        if inspect.isawaitable(result):
+            result = await result
+        return result
@@ -15,10 +15,15 @@
 """linebot.http_client module."""
 
 
+import threading
+import weakref
 from abc import ABCMeta, abstractmethod, abstractproperty
 
+from http.cookiejar import DefaultCookiePolicy
+
 import requests
 from future.utils import with_metaclass
+from requests.adapters import HTTPAdapter
 
 
 class HttpClient(with_metaclass(ABCMeta)):
@@ -108,11 +113,28 @@ class HttpClient(with_metaclass(ABCMeta)):
         """
         raise NotImplementedError
 
+    def close(self):
+        """Release pooled connections. Does nothing by default."""
 
-class RequestsHttpClient(HttpClient):
-    """HttpClient implemented by requests."""
 
-    def __init__(self, timeout=HttpClient.DEFAULT_TIMEOUT):
+class RequestsHttpClient(HttpClient):
+    """HttpClient implemented by requests.
+
+    Requests go through pooled keep-alive connections, so consecutive API
+    calls to the same host reuse one TCP+TLS connection. The connection pool
+    is shared by all threads; each thread gets its own
+    :py:class:`requests.Session` mounted on it, because sessions are not
+    thread-safe themselves. A session lives as long as its thread. Cookies
+    set by responses are not kept, so each call is sent as it was with
+    ``requests.request``. Call :py:meth:`close` to release the connections.
+    """
+
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 10
+
+    def __init__(self, timeout=HttpClient.DEFAULT_TIMEOUT,
+                 pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                 pool_block=False, max_retries=0):
         """__init__ method.
 
         :param timeout: (optional) How long to wait for the server
@@ -120,9 +142,61 @@ class RequestsHttpClient(HttpClient):
             or a (connect timeout, read timeout) float tuple.
             Default is :py:attr:`DEFAULT_TIMEOUT`
         :type timeout: float | tuple(float, float)
+        :param int pool_connections: (optional) Number of hosts to keep
+            connection pools for. Default is :py:attr:`DEFAULT_POOL_CONNECTIONS`
+        :param int pool_maxsize: (optional) Maximum number of idle connections
+            kept per host; use at least the number of threads calling the API.
+            Default is :py:attr:`DEFAULT_POOL_MAXSIZE`
+        :param bool pool_block: (optional) Wait for a free connection instead of
+            opening one beyond ``pool_maxsize``. Default is False
+        :param max_retries: (optional) Retry configuration for failed
+            connections and, with a :py:class:`urllib3.util.retry.Retry`,
+            for status codes and methods it allows. Default is 0 (no retries)
+        :type max_retries: int | :py:class:`urllib3.util.retry.Retry`
         """
         super(RequestsHttpClient, self).__init__(timeout)
 
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+            max_retries=max_retries, pool_block=pool_block
+        )
+        self.__local = threading.local()
+        # weak, so that the session of a finished thread is freed with it
+        self.__sessions = weakref.WeakSet()
+        self.__lock = threading.Lock()
+
+    @property
+    def session(self):
+        """Get the :py:class:`requests.Session` of the calling thread."""
+        session = getattr(self.__local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            # no domain is allowed to set cookies
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            session.mount('https://', self.adapter)
+            session.mount('http://', self.adapter)
+            with self.__lock:
+                self.__sessions.add(session)
+            self.__local.session = session
+        return session
+
+    def close(self):
+        """Close the sessions and the pooled connections."""
+        with self.__lock:
+            sessions, self.__sessions = list(self.__sessions), weakref.WeakSet()
+        self.__local = threading.local()
+        for session in sessions:
+            session.close()
+        self.adapter.close()
+
+    def __enter__(self):
+        """__enter__ method."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """__exit__ method."""
+        self.close()
+
     def get(self, url, headers=None, params=None, stream=False, timeout=None):
         """GET request.
 
@@ -141,7 +215,7 @@ class RequestsHttpClient(HttpClient):
         if timeout is None:
             timeout = self.timeout
 
-        response = requests.get(
+        response = self.session.get(
             url, headers=headers, params=params, stream=stream, timeout=timeout
         )
 
@@ -164,7 +238,7 @@ class RequestsHttpClient(HttpClient):
         if timeout is None:
             timeout = self.timeout
 
-        response = requests.post(
+        response = self.session.post(
             url, headers=headers, data=data, timeout=timeout
         )
 
@@ -187,7 +261,7 @@ class RequestsHttpClient(HttpClient):
         if timeout is None:
             timeout = self.timeout
 
-        response = requests.delete(
+        response = self.session.delete(
             url, headers=headers, data=data, timeout=timeout
         )
 
@@ -210,7 +284,7 @@ class RequestsHttpClient(HttpClient):
         if timeout is None:
             timeout = self.timeout
 
-        response = requests.put(
+        response = self.session.put(
             url, headers=headers, data=data, timeout=timeout
         )
 
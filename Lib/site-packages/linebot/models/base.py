@@ -24,8 +24,31 @@ class Base(object):
     """Base class of model.
 
     Suitable for JSON base data.
+
+    Every subclass keeps its own snake_case <-> camelCase key maps, seeded
+    from its ``__init__`` parameters when the class is defined and extended
+    with any other key the first time it is seen, so serialization does not
+    convert key names on every call.
     """
 
+    _KEY_MAP_LIMIT = 1024
+
+    _camel_keys = {}
+    _snake_keys = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """__init_subclass__ method.
+
+        :param kwargs:
+        """
+        super(Base, cls).__init_subclass__(**kwargs)
+
+        code = cls.__init__.__code__
+        names = code.co_varnames[1:code.co_argcount + code.co_kwonlyargcount]
+        cls._camel_keys = {name: utils._to_camel_case(name) for name in names}
+        cls._snake_keys = {camel_key: utils._to_snake_case(camel_key)
+                           for camel_key in cls._camel_keys.values()}
+
     def __init__(self, **kwargs):
         """__init__ method.
 
@@ -67,16 +90,15 @@ class Base(object):
 
         :return: dict
         """
+        camel_keys = self._camel_keys
         data = {}
         for key, value in self.__dict__.items():
-            camel_key = utils.to_camel_case(key)
+            camel_key = camel_keys.get(key)
+            if camel_key is None:
+                camel_key = self._cache_key(camel_keys, key, utils._to_camel_case)
             if isinstance(value, (list, tuple, set)):
-                data[camel_key] = list()
-                for item in value:
-                    if hasattr(item, 'as_json_dict'):
-                        data[camel_key].append(item.as_json_dict())
-                    else:
-                        data[camel_key].append(item)
+                data[camel_key] = [item.as_json_dict() if hasattr(item, 'as_json_dict') else item
+                                   for item in value]
 
             elif hasattr(value, 'as_json_dict'):
                 data[camel_key] = value.as_json_dict()
@@ -95,11 +117,24 @@ class Base(object):
         if use_raw_message:
             return cls(use_raw_message=use_raw_message, **data)
 
-        new_data = {utils.to_snake_case(key): value
-                    for key, value in data.items()}
+        snake_keys = cls._snake_keys
+        new_data = {}
+        for key, value in data.items():
+            snake_key = snake_keys.get(key)
+            if snake_key is None:
+                snake_key = cls._cache_key(snake_keys, key, utils._to_snake_case)
+            new_data[snake_key] = value
 
         return cls(**new_data)
 
+    @classmethod
+    def _cache_key(cls, key_map, key, convert):
+        converted = convert(key)
+        # keys come from API payloads; stop growing the map for unbounded input
+        if len(key_map) < cls._KEY_MAP_LIMIT:
+            key_map[key] = converted
+        return converted
+
     @staticmethod
     def get_or_new_from_json_dict(data, cls):
         """Get `cls` object w/ deserialization from json if needed.
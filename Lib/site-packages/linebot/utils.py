@@ -38,10 +38,7 @@ def to_snake_case(text):
     :param str text:
     :rtype: str
     """
-    s1 = re.sub('(.)([A-Z])', r'\1_\2', text)
-    s2 = re.sub('(.)([0-9]+)', r'\1_\2', s1)
-    s3 = re.sub('([0-9])([a-z])', r'\1_\2', s2)
-    return s3.lower()
+    return _to_snake_case(text)
 
 
 @deprecated(reason="Use 'from linebot.v3.utils import to_camel_case' instead. See https://github.com/line/line-bot-sdk-python/blob/master/README.rst for more details.", version='3.0.0', category=LineBotSdkDeprecatedIn30)  # noqa: E501
@@ -51,6 +48,19 @@ def to_camel_case(text):
     :param str text:
     :rtype: str
     """
+    return _to_camel_case(text)
+
+
+def _to_snake_case(text):
+    # Undecorated implementation of to_snake_case for internal callers.
+    s1 = re.sub('(.)([A-Z])', r'\1_\2', text)
+    s2 = re.sub('(.)([0-9]+)', r'\1_\2', s1)
+    s3 = re.sub('([0-9])([a-z])', r'\1_\2', s2)
+    return s3.lower()
+
+
+def _to_camel_case(text):
+    # Undecorated implementation of to_camel_case for internal callers.
     split = text.split('_')
     return split[0] + "".join(x.title() for x in split[1:])
 
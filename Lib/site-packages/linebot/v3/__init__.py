@@ -18,5 +18,6 @@ from .webhook import (  # noqa
     SignatureValidator,
     WebhookParser,
     WebhookHandler,
+    AsyncWebhookHandler,
     WebhookPayload,
 )
@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.bulk module.
+
+Bulk multicast on top of :py:class:`linebot.v3.messaging.AsyncMessagingApi`.
+
+:py:class:`MulticastSender` reads recipient user IDs from a (sync or async)
+iterable, cuts them into chunks of at most 500, the multicast limit, and
+sends the chunks concurrently. Requests go through a :py:class:`TokenBucket`
+so that the channel stays under LINE's rate limit. Every chunk gets a retry
+key derived from the campaign and its recipients, so a chunk retried after a
+timeout or a 5xx, or sent again by a rerun of the same campaign, is accepted
+by LINE only once.
+"""
+
+
+import asyncio
+import itertools
+import json
+import time
+import uuid
+from collections import namedtuple
+
+import aiohttp
+
+from .messaging.exceptions import ApiException
+from .utils import LOGGER
+
+#: Maximum number of recipients of one multicast request.
+MULTICAST_MAX_RECIPIENTS = 500
+
+#: Multicast requests per second allowed per channel.
+MULTICAST_RATE_LIMIT = 200
+
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+_RETRY_KEY_NAMESPACE = uuid.UUID('5f0c7e55-2c1b-4a2f-9d52-1b8f0e6a4c37')
+
+
+class TokenBucket(object):
+    """Token bucket rate limiter for asyncio tasks.
+
+    Tokens are added continuously at ``rate`` per second, up to ``capacity``.
+    :py:meth:`acquire` waits until enough tokens are available; waiters are
+    served in arrival order.
+    """
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic):
+        """__init__ method.
+
+        :param float rate: Tokens added per second
+        :param float capacity: (optional) Maximum burst.
+            Default is one second worth of tokens
+        :param clock: (optional) Monotonic clock in seconds
+        """
+        self.rate = float(rate)
+        self.capacity = float(rate if capacity is None else capacity)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens=1):
+        """Wait until ``tokens`` tokens are available and take them.
+
+        :param float tokens: (optional) Default is 1
+        """
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+
+ChunkFailure = namedtuple('ChunkFailure', ['retry_key', 'user_ids', 'error'])
+ChunkFailure.__doc__ = """A chunk that could not be sent.
+
+Send ``user_ids`` again with the same ``retry_key`` to retry it safely.
+"""
+
+
+class BulkProgress(object):
+    """Counters of a bulk send, updated as chunks complete."""
+
+    def __init__(self):
+        """__init__ method."""
+        self.started = time.monotonic()
+        self.finished = None
+        self.chunks_sent = 0
+        self.recipients_sent = 0
+        self.chunks_failed = 0
+        self.recipients_failed = 0
+        self.retries = 0
+        self.failures = []
+
+    @property
+    def elapsed(self):
+        """Get seconds since the send started, or its duration once finished.
+
+        :rtype: float
+        """
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def recipients_per_second(self):
+        """Get the throughput in recipients sent per second.
+
+        :rtype: float
+        """
+        elapsed = self.elapsed
+        return self.recipients_sent / elapsed if elapsed > 0 else 0.0
+
+    def __repr__(self):
+        """__repr__ method."""
+        return (
+            '<BulkProgress sent={0} failed={1} retries={2} '
+            'rate={3:.0f}/s elapsed={4:.1f}s>'.format(
+                self.recipients_sent, self.recipients_failed, self.retries,
+                self.recipients_per_second, self.elapsed))
+
+
+class MulticastSender(object):
+    """Rate-limited, concurrent multicast to any number of recipients.
+
+    .. code-block:: python
+
+        async with AsyncApiClient(configuration) as api_client:
+            sender = MulticastSender(AsyncMessagingApi(api_client),
+                                     on_progress=print)
+            progress = await sender.send(
+                [TextMessage(text='Sale starts now')],
+                follower_ids(), campaign_id='2024-summer-sale')
+            for failure in progress.failures:
+                ...
+    """
+
+    def __init__(self, messaging_api, rate=MULTICAST_RATE_LIMIT, burst=None,
+                 concurrency=16, chunk_size=MULTICAST_MAX_RECIPIENTS,
+                 max_retries=3, backoff=1.0, max_backoff=30.0,
+                 on_progress=None, progress_interval=1.0):
+        """__init__ method.
+
+        :param messaging_api: AsyncMessagingApi instance
+        :param float rate: (optional) Requests per second.
+            Default is MULTICAST_RATE_LIMIT
+        :param float burst: (optional) Token bucket capacity.
+            Default is ``rate``
+        :param int concurrency: (optional) Maximum requests in flight
+        :param int chunk_size: (optional) Recipients per request.
+            Default is MULTICAST_MAX_RECIPIENTS
+        :param int max_retries: (optional) Retries of a chunk after a 429,
+            a 5xx, a timeout or a connection error
+        :param float backoff: (optional) First retry delay in seconds,
+            doubled on each retry. A Retry-After header takes precedence
+        :param float max_backoff: (optional) Maximum retry delay in seconds
+        :param on_progress: (optional) Called with the
+            :py:class:`BulkProgress` at most every ``progress_interval``
+            seconds while chunks complete, and once at the end
+        :param float progress_interval: (optional) Seconds between
+            ``on_progress`` calls
+        """
+        if not 1 <= chunk_size <= MULTICAST_MAX_RECIPIENTS:
+            raise ValueError('chunk_size must be between 1 and {0}'.format(
+                MULTICAST_MAX_RECIPIENTS))
+        self.messaging_api = messaging_api
+        self.rate_limiter = TokenBucket(rate, burst)
+        self.concurrency = concurrency
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.on_progress = on_progress
+        self.progress_interval = progress_interval
+        self._last_report = 0.0
+
+    async def send(self, messages, user_ids, campaign_id=None,
+                   notification_disabled=False, custom_aggregation_units=None):
+        """Send ``messages`` to every user in ``user_ids``.
+
+        Failed chunks do not stop the send; they are collected in
+        :py:attr:`BulkProgress.failures`.
+
+        :param messages: Messages, as models or dicts
+        :type messages: list[T <= linebot.v3.messaging.Message]
+        :param user_ids: Iterable or async iterable of user IDs
+        :param str campaign_id: (optional) Identifies this send. Chunks with
+            the same campaign ID and recipients get the same retry key, so a
+            rerun with the same ID and recipient order does not deliver twice
+            (LINE keeps retry keys for 24 hours). Default is a random ID
+        :param bool notification_disabled: (optional) Default is False
+        :param custom_aggregation_units: (optional) Aggregation unit name
+        :type custom_aggregation_units: list[str]
+        :rtype: BulkProgress
+        """
+        fields = {
+            'messages': [
+                message.to_dict() if hasattr(message, 'to_dict') else message
+                for message in messages
+            ],
+            'notificationDisabled': notification_disabled,
+        }
+        if custom_aggregation_units:
+            fields['customAggregationUnits'] = custom_aggregation_units
+        # the messages are serialized once; each body only adds "to"
+        body_tail = json.dumps(fields, ensure_ascii=False)[1:]
+        namespace = uuid.uuid5(_RETRY_KEY_NAMESPACE, campaign_id) \
+            if campaign_id is not None else uuid.uuid4()
+
+        progress = BulkProgress()
+        self._last_report = 0.0
+        pending = set()
+        try:
+            async for chunk in _chunks(user_ids, self.chunk_size):
+                if len(pending) >= self.concurrency:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        task.result()
+                body = '{"to": ' + json.dumps(chunk) + ', ' + body_tail
+                retry_key = str(uuid.uuid5(namespace, '\n'.join(chunk)))
+                pending.add(asyncio.ensure_future(
+                    self._send_chunk(body, chunk, retry_key, progress)))
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        progress.finished = time.monotonic()
+        if self.on_progress is not None:
+            self.on_progress(progress)
+        return progress
+
+    async def _send_chunk(self, body, user_ids, retry_key, progress):
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire()
+            try:
+                await self.messaging_api.multicast_json(
+                    body, x_line_retry_key=retry_key)
+            except ApiException as e:
+                if e.status == 409 and e.headers and \
+                        e.headers.get('x-line-accepted-request-id'):
+                    # already accepted with this retry key, by an earlier
+                    # attempt whose response was lost or by an earlier run
+                    break
+                if e.status not in RETRY_STATUSES or \
+                        attempt >= self.max_retries:
+                    self._fail(progress, retry_key, user_ids, e)
+                    return
+                delay = self._retry_delay(attempt, e.headers)
+            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                if attempt >= self.max_retries:
+                    self._fail(progress, retry_key, user_ids, e)
+                    return
+                delay = self._retry_delay(attempt)
+            else:
+                break
+            attempt += 1
+            progress.retries += 1
+            await asyncio.sleep(delay)
+
+        progress.chunks_sent += 1
+        progress.recipients_sent += len(user_ids)
+        self._report(progress)
+
+    def _fail(self, progress, retry_key, user_ids, error):
+        LOGGER.warning('Multicast to %d users failed (retry key %s): %s',
+                       len(user_ids), retry_key, error)
+        progress.chunks_failed += 1
+        progress.recipients_failed += len(user_ids)
+        progress.failures.append(ChunkFailure(retry_key, user_ids, error))
+        self._report(progress)
+
+    def _retry_delay(self, attempt, headers=None):
+        retry_after = headers.get('Retry-After') if headers else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass
+        return min(self.backoff * 2 ** attempt, self.max_backoff)
+
+    def _report(self, progress):
+        if self.on_progress is None:
+            return
+        now = time.monotonic()
+        if now - self._last_report >= self.progress_interval:
+            self._last_report = now
+            self.on_progress(progress)
+
+
+async def _chunks(user_ids, size):
+    if hasattr(user_ids, '__aiter__'):
+        chunk = []
+        async for user_id in user_ids:
+            chunk.append(user_id)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    else:
+        iterator = iter(user_ids)
+        while True:
+            chunk = list(itertools.islice(iterator, size))
+            if not chunk:
+                return
+            yield chunk
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.deserializer module.
+
+Response deserialization shared by the generated ``ApiClient`` and
+``AsyncApiClient`` classes of every linebot.v3 API package.
+
+A response type such as ``'List[str]'`` or ``'Dict[str, UserProfileResponse]'``
+is parsed once into a tree of small functions, with model classes already
+resolved, and the result is cached per models package. Deserializing a
+response then only runs those functions over the decoded JSON instead of
+matching regular expressions and looking up classes for every element.
+"""
+
+
+import datetime
+import re
+
+from dateutil.parser import parse
+
+PRIMITIVE_TYPES = (float, bool, bytes, str, int)
+NATIVE_TYPES_MAPPING = {
+    'int': int,
+    'long': int,
+    'float': float,
+    'str': str,
+    'bool': bool,
+    'date': datetime.date,
+    'datetime': datetime.datetime,
+    'object': object,
+}
+
+_DESERIALIZERS = {}
+
+
+def get_deserializer(klass, models, exception_class):
+    """Return a function deserializing decoded JSON into ``klass``.
+
+    :param klass: class literal, or string of class name such as
+        ``'List[str]'`` or ``'Dict[str, Foo]'``.
+    :param models: models module of the API package, used to resolve
+        class names.
+    :param exception_class: ApiException class of the API package, raised
+        when a date or datetime cannot be parsed.
+    :return: function taking dict, list or str and returning the object.
+        ``None`` is returned as is at every level.
+    """
+    key = (models.__name__, klass)
+    deserializer = _DESERIALIZERS.get(key)
+    if deserializer is None:
+        deserializer = _compile(klass, models, exception_class)
+        _DESERIALIZERS[key] = deserializer
+    return deserializer
+
+
+def _compile(klass, models, exception_class):
+    if type(klass) == str:
+        if klass.startswith('List['):
+            sub_kls = re.match(r'List\[(.*)]', klass).group(1)
+            return _list(get_deserializer(sub_kls, models, exception_class))
+
+        if klass.startswith('Dict['):
+            sub_kls = re.match(r'Dict\[([^,]*), (.*)]', klass).group(2)
+            return _dict(get_deserializer(sub_kls, models, exception_class))
+
+        # convert str to class
+        if klass in NATIVE_TYPES_MAPPING:
+            klass = NATIVE_TYPES_MAPPING[klass]
+        else:
+            klass = getattr(models, klass)
+
+    if klass in PRIMITIVE_TYPES:
+        return _primitive(klass)
+    elif klass == object:
+        return _object
+    elif klass == datetime.date:
+        return _date(exception_class)
+    elif klass == datetime.datetime:
+        return _datetime(exception_class)
+    else:
+        return _model(klass)
+
+
+def _list(deserialize_item):
+    def deserialize(data):
+        if data is None:
+            return None
+        return [deserialize_item(sub_data) for sub_data in data]
+    return deserialize
+
+
+def _dict(deserialize_value):
+    def deserialize(data):
+        if data is None:
+            return None
+        return {k: deserialize_value(v) for k, v in data.items()}
+    return deserialize
+
+
+def _primitive(klass):
+    def deserialize(data):
+        if data is None:
+            return None
+        try:
+            return klass(data)
+        except UnicodeEncodeError:
+            return str(data)
+        except TypeError:
+            return data
+    return deserialize
+
+
+def _object(data):
+    return data
+
+
+def _date(exception_class):
+    def deserialize(string):
+        if string is None:
+            return None
+        try:
+            return parse(string).date()
+        except ImportError:
+            return string
+        except ValueError:
+            raise exception_class(
+                status=0,
+                reason="Failed to parse `{0}` as date object".format(string)
+            )
+    return deserialize
+
+
+def _datetime(exception_class):
+    def deserialize(string):
+        if string is None:
+            return None
+        try:
+            return parse(string)
+        except ImportError:
+            return string
+        except ValueError:
+            raise exception_class(
+                status=0,
+                reason=(
+                    "Failed to parse `{0}` as datetime object"
+                    .format(string)
+                )
+            )
+    return deserialize
+
+
+def _model(klass):
+    from_dict = klass.from_dict
+
+    def deserialize(data):
+        if data is None:
+            return None
+        return from_dict(data)
+    return deserialize
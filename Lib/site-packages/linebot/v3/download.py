@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.download module.
+
+Streaming downloads for the generated API clients.
+
+The generated ``get_*_content`` methods read the whole body into memory
+before returning it (as ``bytearray``, or in ``ApiClient.__deserialize_file``
+before writing a temporary file), so one large video costs its full size in
+worker memory. :py:func:`download` and :py:func:`async_download` send the
+request without preloading the body and copy it to the destination
+``chunk_size`` bytes at a time. If the connection drops mid-body, the
+download is resumed with a ``Range`` request from the first missing byte.
+"""
+
+
+import asyncio
+import inspect
+import os
+from urllib.parse import quote
+
+import aiohttp
+import urllib3
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def content_writer(out, offset=0):
+    """Return a function writing chunks of bytes to ``out``.
+
+    :param out: Binary file object (anything with ``write``, including an
+        async one), file descriptor, or writable buffer such as a
+        ``bytearray`` or ``memoryview``. A buffer receives byte N of the
+        content at index N, so it must hold the whole content
+    :param int offset: (optional) Content position of the first chunk.
+        Only used for buffers; files and descriptors are written at their
+        current position
+    :return: Function taking bytes. For file objects it returns whatever
+        ``out.write`` returns
+    """
+    if hasattr(out, 'write'):
+        return out.write
+    if isinstance(out, int):
+        def write_fd(chunk):
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(out, view):]
+        return write_fd
+
+    buffer = memoryview(out).cast('B')
+    position = [offset]
+
+    def write_buffer(chunk):
+        end = position[0] + len(chunk)
+        if end > len(buffer):
+            raise ValueError(
+                'content does not fit in the buffer ({0} bytes)'.format(
+                    len(buffer)))
+        buffer[position[0]:end] = chunk
+        position[0] = end
+    return write_buffer
+
+
+def content_url(api_client, host, resource_path, **path_params):
+    """Build the URL of a request the way ``ApiClient.call_api`` does.
+
+    :param api_client: ApiClient or AsyncApiClient
+    :param str host: Host of the operation, used unless the configuration
+        sets one
+    :param str resource_path: Path with ``{name}`` placeholders
+    :rtype: str
+    """
+    config = api_client.configuration
+    for name, value in path_params.items():
+        resource_path = resource_path.replace(
+            '{%s}' % name,
+            quote(str(value), safe=config.safe_chars_for_path_param))
+    return (config.host if config.host is not None else host) + resource_path
+
+
+def _headers(api_client, position):
+    headers = dict(api_client.default_headers)
+    headers['Accept'] = '*/*'
+    if position:
+        headers['Range'] = 'bytes={0}-'.format(position)
+    return headers
+
+
+def download(api_client, url, out, chunk_size=DEFAULT_CHUNK_SIZE, offset=0,
+             max_resumes=3, _request_timeout=None):
+    """Stream the body of a GET request to ``out``.
+
+    :param api_client: ApiClient
+    :param str url: URL, see :py:func:`content_url`
+    :param out: Destination, see :py:func:`content_writer`
+    :param int chunk_size: (optional) Bytes read at a time
+    :param int offset: (optional) Start at this byte of the content, e.g.
+        the size of a partial file from an earlier attempt
+    :param int max_resumes: (optional) Times a dropped connection is
+        resumed with a Range request before the error is raised
+    :param _request_timeout: (optional) As for the generated methods
+    :rtype: int
+    :return: Number of bytes written to ``out``
+    """
+    write = content_writer(out, offset)
+    written = 0
+    resumes = 0
+    while True:
+        position = offset + written
+        response = api_client.request(
+            'GET', url, headers=_headers(api_client, position),
+            _preload_content=False, _request_timeout=_request_timeout)
+        # a 200 answer to a Range request starts over from byte 0
+        skip = position if response.status != 206 else 0
+        try:
+            for chunk in response.stream(chunk_size):
+                if skip:
+                    if len(chunk) <= skip:
+                        skip -= len(chunk)
+                        continue
+                    chunk = chunk[skip:]
+                    skip = 0
+                write(chunk)
+                written += len(chunk)
+            return written
+        except (urllib3.exceptions.ProtocolError,
+                urllib3.exceptions.ReadTimeoutError):
+            if resumes >= max_resumes:
+                raise
+            resumes += 1
+        finally:
+            response.release_conn()
+
+
+async def async_download(api_client, url, out, exception_class,
+                         chunk_size=DEFAULT_CHUNK_SIZE, offset=0,
+                         max_resumes=3, _request_timeout=None):
+    """Stream the body of a GET request to ``out``.
+
+    See :py:func:`download`. ``out.write`` may be a coroutine function.
+
+    :param api_client: AsyncApiClient
+    :param exception_class: ApiException class of the API package, raised
+        for an error response
+    :rtype: int
+    :return: Number of bytes written to ``out``
+    """
+    from linebot.v3.messaging.async_rest import RESTResponse
+
+    write = content_writer(out, offset)
+    written = 0
+    resumes = 0
+    while True:
+        position = offset + written
+        response = await api_client.request(
+            'GET', url, headers=_headers(api_client, position),
+            _preload_content=False, _request_timeout=_request_timeout)
+        try:
+            if not 200 <= response.status <= 299:
+                raise exception_class(
+                    http_resp=RESTResponse(response, await response.read()))
+            skip = position if response.status != 206 else 0
+            async for chunk in response.content.iter_chunked(chunk_size):
+                if skip:
+                    if len(chunk) <= skip:
+                        skip -= len(chunk)
+                        continue
+                    chunk = chunk[skip:]
+                    skip = 0
+                result = write(chunk)
+                if inspect.isawaitable(result):
+                    await result
+                written += len(chunk)
+            return written
+        except (aiohttp.ClientPayloadError,
+                aiohttp.ServerDisconnectedError,
+                asyncio.TimeoutError):
+            if resumes >= max_resumes:
+                raise
+            resumes += 1
+        finally:
+            response.release()
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.executor module.
+
+Executor running the ``async_req=True`` calls of the generated ``ApiClient``
+classes.
+
+Every ApiClient used to start its own ``multiprocessing.pool.ThreadPool``
+with a single thread, so background calls ran one at a time, and its
+urllib3 pool kept at most 4 connections. By default all ApiClients now
+share one :py:class:`ApiExecutor`, backed by a
+``concurrent.futures.ThreadPoolExecutor``, and size their urllib3 pool to
+the executor's ``max_workers``, so a single concurrency setting controls
+both.
+"""
+
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+DEFAULT_CONCURRENCY = 8
+
+
+class ApiFuture(Future):
+    """Future of an ``async_req=True`` call.
+
+    Besides the ``concurrent.futures.Future`` API, it keeps the
+    ``get``/``ready``/``successful``/``wait`` methods of the
+    ``multiprocessing.pool.AsyncResult`` returned before, so
+    ``api.broadcast(..., async_req=True).get()`` keeps working.
+    """
+
+    def get(self, timeout=None):
+        """Return the result of the call, raising its exception if it failed."""
+        return self.result(timeout)
+
+    def ready(self):
+        """Return whether the call has completed."""
+        return self.done()
+
+    def successful(self):
+        """Return whether the call completed without raising an exception."""
+        if not self.done():
+            raise ValueError('{0!r} not ready'.format(self))
+        return not self.cancelled() and self.exception() is None
+
+    def wait(self, timeout=None):
+        """Wait until the call has completed or ``timeout`` seconds passed."""
+        try:
+            self.exception(timeout)
+        except Exception:
+            pass
+
+
+class ApiExecutor(object):
+    """Runs calls in a thread pool and counts them for monitoring.
+
+    .. code-block:: python
+
+        registry.gauge_callback(
+            'linebot_api_queue_depth', 'Calls waiting for a thread.',
+            lambda: get_default_executor().queue_depth)
+    """
+
+    def __init__(self, max_workers=DEFAULT_CONCURRENCY, executor=None,
+                 thread_name_prefix='linebot-api'):
+        """__init__ method.
+
+        :param int max_workers: (optional) Threads running calls, and the
+            number of connections ApiClients using this executor keep
+            per host. Default is DEFAULT_CONCURRENCY
+        :param executor: (optional) ``concurrent.futures.Executor`` to run
+            the calls on instead of a private ThreadPoolExecutor. It is not
+            shut down by :py:meth:`shutdown`
+        :param str thread_name_prefix: (optional) Name prefix of the threads
+        """
+        self.max_workers = max_workers
+        self._own_executor = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers, thread_name_prefix=thread_name_prefix)
+        self._executor = executor
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+
+    @property
+    def queue_depth(self):
+        """Get the number of calls waiting for a thread.
+
+        :rtype: int
+        """
+        return self.queued
+
+    def stats(self):
+        """Get the numbers of queued, running and completed calls.
+
+        :rtype: dict[str, int]
+        """
+        with self._lock:
+            return {
+                'queued': self.queued,
+                'running': self.running,
+                'completed': self.completed,
+            }
+
+    def submit(self, fn, *args, **kwargs):
+        """Schedule ``fn(*args, **kwargs)``.
+
+        :rtype: ApiFuture
+        """
+        future = ApiFuture()
+        with self._lock:
+            self.queued += 1
+        try:
+            self._executor.submit(self._run, future, fn, args, kwargs)
+        except BaseException:
+            with self._lock:
+                self.queued -= 1
+            raise
+        return future
+
+    def apply_async(self, func, args=(), kwds=None, callback=None,
+                    error_callback=None):
+        """Schedule ``func(*args, **kwds)`` like ``ThreadPool.apply_async``.
+
+        Kept so that code calling ``ApiClient.pool.apply_async`` on the
+        ``multiprocessing.pool.ThreadPool`` it used to be keeps working.
+
+        :param callback: (optional) Called with the result on success
+        :param error_callback: (optional) Called with the exception on
+            failure
+        :rtype: ApiFuture
+        """
+        future = self.submit(func, *args, **(kwds or {}))
+        if callback is not None or error_callback is not None:
+            future.add_done_callback(
+                lambda done: _call_back(done, callback, error_callback))
+        return future
+
+    def shutdown(self, wait=True):
+        """Stop accepting calls and, with ``wait``, wait for the queued ones.
+
+        :param bool wait: (optional) Default is True
+        """
+        if self._own_executor:
+            self._executor.shutdown(wait=wait)
+
+    def _run(self, future, fn, args, kwargs):
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+        try:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+
+
+def _call_back(future, callback, error_callback):
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is None:
+        if callback is not None:
+            callback(future.result())
+    elif error_callback is not None:
+        error_callback(error)
+
+
+_default_executor = None
+_default_lock = threading.Lock()
+
+
+def get_default_executor():
+    """Return the ApiExecutor shared by ApiClients created without one.
+
+    It is created on first use with DEFAULT_CONCURRENCY threads, unless
+    :py:func:`set_default_executor` was called before.
+
+    :rtype: ApiExecutor
+    """
+    global _default_executor
+    if _default_executor is None:
+        with _default_lock:
+            if _default_executor is None:
+                _default_executor = ApiExecutor()
+    return _default_executor
+
+
+def set_default_executor(executor):
+    """Replace the ApiExecutor shared by ApiClients created afterwards.
+
+    :param ApiExecutor executor: e.g. ``ApiExecutor(max_workers=32)``
+    """
+    global _default_executor
+    with _default_lock:
+        _default_executor = executor
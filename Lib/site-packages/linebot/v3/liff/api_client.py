@@ -12,12 +12,9 @@
 """
 
 
-import atexit
 import datetime
-from dateutil.parser import parse
 import json
 import mimetypes
-from multiprocessing.pool import ThreadPool
 import os
 import re
 import tempfile
@@ -30,6 +27,8 @@ import linebot.v3.liff.models
 from linebot.v3.liff import rest
 from linebot.v3.liff.exceptions import ApiValueError, ApiException
 from linebot.__about__ import __version__
+from linebot.v3.deserializer import get_deserializer
+from linebot.v3.executor import ApiExecutor, get_default_executor
 
 class ApiClient(object):
     """Generic API client for OpenAPI client library builds.
@@ -47,30 +46,31 @@ class ApiClient(object):
         to the API
     :param pool_threads: The number of threads to use for async requests
         to the API. More threads means more concurrent API requests.
+        Default is to share linebot.v3.executor.get_default_executor().
+    :param executor: linebot.v3.executor.ApiExecutor running async
+        requests, instead of pool_threads. The urllib3 connection pool keeps
+        at least its max_workers connections per host.
     """
 
     PRIMITIVE_TYPES = (float, bool, bytes, str, int)
-    NATIVE_TYPES_MAPPING = {
-        'int': int,
-        'long': int, # TODO remove as only py3 is supported?
-        'float': float,
-        'str': str,
-        'bool': bool,
-        'date': datetime.date,
-        'datetime': datetime.datetime,
-        'object': object,
-    }
-    _pool = None
 
     def __init__(self, configuration=None, header_name=None, header_value=None,
-                 cookie=None, pool_threads=1):
+                 cookie=None, pool_threads=None, executor=None):
         # use default configuration if none is provided
         if configuration is None:
             configuration = Configuration.get_default()
         self.configuration = configuration
-        self.pool_threads = pool_threads
-
-        self.rest_client = rest.RESTClientObject(configuration)
+        self._own_executor = executor is None and pool_threads is not None
+        if executor is None:
+            executor = ApiExecutor(pool_threads) if pool_threads is not None \
+                else get_default_executor()
+        self.executor = executor
+        self.pool_threads = executor.max_workers
+
+        # one connection per thread that may run a request at the same time
+        maxsize = max(configuration.connection_pool_maxsize or 4,
+                      executor.max_workers)
+        self.rest_client = rest.RESTClientObject(configuration, maxsize=maxsize)
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -87,22 +87,18 @@ class ApiClient(object):
         self.close()
 
     def close(self):
-        if self._pool:
-            self._pool.close()
-            self._pool.join()
-            self._pool = None
-            if hasattr(atexit, 'unregister'):
-                atexit.unregister(self.close)
+        if self._own_executor:
+            self._own_executor = False
+            self.executor.shutdown()
 
     @property
     def pool(self):
-        """Create thread pool on first request
-         avoids instantiating unused threadpool for blocking clients.
+        """ApiExecutor running async requests.
+
+        It replaces the former ``multiprocessing.pool.ThreadPool`` and keeps
+        its ``apply_async`` method.
         """
-        if self._pool is None:
-            atexit.register(self.close)
-            self._pool = ThreadPool(self.pool_threads)
-        return self._pool
+        return self.executor
 
     @property
     def user_agent(self):
@@ -324,36 +320,8 @@ class ApiClient(object):
 
         :return: object.
         """
-        if data is None:
-            return None
-
-        if type(klass) == str:
-            if klass.startswith('List['):
-                sub_kls = re.match(r'List\[(.*)]', klass).group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
-
-            if klass.startswith('Dict['):
-                sub_kls = re.match(r'Dict\[([^,]*), (.*)]', klass).group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in data.items()}
-
-            # convert str to class
-            if klass in self.NATIVE_TYPES_MAPPING:
-                klass = self.NATIVE_TYPES_MAPPING[klass]
-            else:
-                klass = getattr(linebot.v3.liff.models, klass)
-
-        if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
-        elif klass == object:
-            return self.__deserialize_object(data)
-        elif klass == datetime.date:
-            return self.__deserialize_date(data)
-        elif klass == datetime.datetime:
-            return self.__deserialize_datetime(data)
-        else:
-            return self.__deserialize_model(data, klass)
+        return get_deserializer(
+            klass, linebot.v3.liff.models, ApiException)(data)
 
     def call_api(self, resource_path, method,
                  path_params=None, query_params=None, header_params=None,
@@ -412,18 +380,18 @@ class ApiClient(object):
                                    _preload_content, _request_timeout, _host,
                                    _request_auth)
 
-        return self.pool.apply_async(self.__call_api, (resource_path,
-                                                       method, path_params,
-                                                       query_params,
-                                                       header_params, body,
-                                                       post_params, files,
-                                                       response_types_map,
-                                                       auth_settings,
-                                                       _return_http_data_only,
-                                                       collection_formats,
-                                                       _preload_content,
-                                                       _request_timeout,
-                                                       _host, _request_auth))
+        return self.executor.submit(self.__call_api, resource_path,
+                                    method, path_params,
+                                    query_params,
+                                    header_params, body,
+                                    post_params, files,
+                                    response_types_map,
+                                    auth_settings,
+                                    _return_http_data_only,
+                                    collection_formats,
+                                    _preload_content,
+                                    _request_timeout,
+                                    _host, _request_auth)
 
     def request(self, method, url, query_params=None, headers=None,
                 post_params=None, body=None, _preload_content=True,
@@ -685,72 +653,3 @@ class ApiClient(object):
             f.write(response.data)
 
         return path
-
-    def __deserialize_primitive(self, data, klass):
-        """Deserializes string to primitive type.
-
-        :param data: str.
-        :param klass: class literal.
-
-        :return: int, long, float, str, bool.
-        """
-        try:
-            return klass(data)
-        except UnicodeEncodeError:
-            return str(data)
-        except TypeError:
-            return data
-
-    def __deserialize_object(self, value):
-        """Return an original value.
-
-        :return: object.
-        """
-        return value
-
-    def __deserialize_date(self, string):
-        """Deserializes string to date.
-
-        :param string: str.
-        :return: date.
-        """
-        try:
-            return parse(string).date()
-        except ImportError:
-            return string
-        except ValueError:
-            raise rest.ApiException(
-                status=0,
-                reason="Failed to parse `{0}` as date object".format(string)
-            )
-
-    def __deserialize_datetime(self, string):
-        """Deserializes string to datetime.
-
-        The string should be in iso8601 datetime format.
-
-        :param string: str.
-        :return: datetime.
-        """
-        try:
-            return parse(string)
-        except ImportError:
-            return string
-        except ValueError:
-            raise rest.ApiException(
-                status=0,
-                reason=(
-                    "Failed to parse `{0}` as datetime object"
-                    .format(string)
-                )
-            )
-
-    def __deserialize_model(self, data, klass):
-        """Deserializes list or dict to model.
-
-        :param data: dict, list.
-        :param klass: class literal.
-        :return: model object.
-        """
-
-        return klass.from_dict(data)
@@ -13,182 +13,361 @@
     Do not edit the class manually.
 """
 
+import typing as _typing
 
-# import apis into sdk package
-from linebot.v3.messaging.api.messaging_api import MessagingApi
-from linebot.v3.messaging.api.messaging_api_blob import MessagingApiBlob
+from linebot.v3.utils import lazy_exports as _lazy_exports
 
-from linebot.v3.messaging.api.async_messaging_api import AsyncMessagingApi
-from linebot.v3.messaging.api.async_messaging_api_blob import AsyncMessagingApiBlob
+# exports are imported on first access, see linebot.v3.utils.lazy_exports
+if _typing.TYPE_CHECKING:
+    # import apis into sdk package
+    from linebot.v3.messaging.api.messaging_api import MessagingApi
+    from linebot.v3.messaging.api.messaging_api_blob import MessagingApiBlob
 
+    from linebot.v3.messaging.api.async_messaging_api import AsyncMessagingApi
+    from linebot.v3.messaging.api.async_messaging_api_blob import AsyncMessagingApiBlob
 
-# import ApiClient
-from linebot.v3.messaging.api_response import ApiResponse
-from linebot.v3.messaging.api_client import ApiClient
-from linebot.v3.messaging.async_api_client import AsyncApiClient
-from linebot.v3.messaging.configuration import Configuration
-from linebot.v3.messaging.exceptions import OpenApiException
-from linebot.v3.messaging.exceptions import ApiTypeError
-from linebot.v3.messaging.exceptions import ApiValueError
-from linebot.v3.messaging.exceptions import ApiKeyError
-from linebot.v3.messaging.exceptions import ApiAttributeError
-from linebot.v3.messaging.exceptions import ApiException
 
-# import models into sdk package
-from linebot.v3.messaging.models.action import Action
-from linebot.v3.messaging.models.age_demographic import AgeDemographic
-from linebot.v3.messaging.models.age_demographic_filter import AgeDemographicFilter
-from linebot.v3.messaging.models.all_mention_target import AllMentionTarget
-from linebot.v3.messaging.models.alt_uri import AltUri
-from linebot.v3.messaging.models.app_type_demographic import AppTypeDemographic
-from linebot.v3.messaging.models.app_type_demographic_filter import AppTypeDemographicFilter
-from linebot.v3.messaging.models.area_demographic import AreaDemographic
-from linebot.v3.messaging.models.area_demographic_filter import AreaDemographicFilter
-from linebot.v3.messaging.models.audience_recipient import AudienceRecipient
-from linebot.v3.messaging.models.audio_message import AudioMessage
-from linebot.v3.messaging.models.bot_info_response import BotInfoResponse
-from linebot.v3.messaging.models.broadcast_request import BroadcastRequest
-from linebot.v3.messaging.models.buttons_template import ButtonsTemplate
-from linebot.v3.messaging.models.camera_action import CameraAction
-from linebot.v3.messaging.models.camera_roll_action import CameraRollAction
-from linebot.v3.messaging.models.carousel_column import CarouselColumn
-from linebot.v3.messaging.models.carousel_template import CarouselTemplate
-from linebot.v3.messaging.models.chat_reference import ChatReference
-from linebot.v3.messaging.models.clipboard_action import ClipboardAction
-from linebot.v3.messaging.models.clipboard_imagemap_action import ClipboardImagemapAction
-from linebot.v3.messaging.models.confirm_template import ConfirmTemplate
-from linebot.v3.messaging.models.create_rich_menu_alias_request import CreateRichMenuAliasRequest
-from linebot.v3.messaging.models.datetime_picker_action import DatetimePickerAction
-from linebot.v3.messaging.models.demographic_filter import DemographicFilter
-from linebot.v3.messaging.models.emoji import Emoji
-from linebot.v3.messaging.models.emoji_substitution_object import EmojiSubstitutionObject
-from linebot.v3.messaging.models.error_detail import ErrorDetail
-from linebot.v3.messaging.models.error_response import ErrorResponse
-from linebot.v3.messaging.models.filter import Filter
-from linebot.v3.messaging.models.flex_block_style import FlexBlockStyle
-from linebot.v3.messaging.models.flex_box import FlexBox
-from linebot.v3.messaging.models.flex_box_background import FlexBoxBackground
-from linebot.v3.messaging.models.flex_box_border_width import FlexBoxBorderWidth
-from linebot.v3.messaging.models.flex_box_corner_radius import FlexBoxCornerRadius
-from linebot.v3.messaging.models.flex_box_linear_gradient import FlexBoxLinearGradient
-from linebot.v3.messaging.models.flex_box_padding import FlexBoxPadding
-from linebot.v3.messaging.models.flex_box_spacing import FlexBoxSpacing
-from linebot.v3.messaging.models.flex_bubble import FlexBubble
-from linebot.v3.messaging.models.flex_bubble_styles import FlexBubbleStyles
-from linebot.v3.messaging.models.flex_button import FlexButton
-from linebot.v3.messaging.models.flex_carousel import FlexCarousel
-from linebot.v3.messaging.models.flex_component import FlexComponent
-from linebot.v3.messaging.models.flex_container import FlexContainer
-from linebot.v3.messaging.models.flex_filler import FlexFiller
-from linebot.v3.messaging.models.flex_icon import FlexIcon
-from linebot.v3.messaging.models.flex_icon_size import FlexIconSize
-from linebot.v3.messaging.models.flex_image import FlexImage
-from linebot.v3.messaging.models.flex_image_size import FlexImageSize
-from linebot.v3.messaging.models.flex_margin import FlexMargin
-from linebot.v3.messaging.models.flex_message import FlexMessage
-from linebot.v3.messaging.models.flex_offset import FlexOffset
-from linebot.v3.messaging.models.flex_separator import FlexSeparator
-from linebot.v3.messaging.models.flex_span import FlexSpan
-from linebot.v3.messaging.models.flex_span_size import FlexSpanSize
-from linebot.v3.messaging.models.flex_text import FlexText
-from linebot.v3.messaging.models.flex_text_font_size import FlexTextFontSize
-from linebot.v3.messaging.models.flex_video import FlexVideo
-from linebot.v3.messaging.models.gender_demographic import GenderDemographic
-from linebot.v3.messaging.models.gender_demographic_filter import GenderDemographicFilter
-from linebot.v3.messaging.models.get_aggregation_unit_name_list_response import GetAggregationUnitNameListResponse
-from linebot.v3.messaging.models.get_aggregation_unit_usage_response import GetAggregationUnitUsageResponse
-from linebot.v3.messaging.models.get_followers_response import GetFollowersResponse
-from linebot.v3.messaging.models.get_membership_subscription_response import GetMembershipSubscriptionResponse
-from linebot.v3.messaging.models.get_message_content_transcoding_response import GetMessageContentTranscodingResponse
-from linebot.v3.messaging.models.get_webhook_endpoint_response import GetWebhookEndpointResponse
-from linebot.v3.messaging.models.group_member_count_response import GroupMemberCountResponse
-from linebot.v3.messaging.models.group_summary_response import GroupSummaryResponse
-from linebot.v3.messaging.models.group_user_profile_response import GroupUserProfileResponse
-from linebot.v3.messaging.models.image_carousel_column import ImageCarouselColumn
-from linebot.v3.messaging.models.image_carousel_template import ImageCarouselTemplate
-from linebot.v3.messaging.models.image_message import ImageMessage
-from linebot.v3.messaging.models.imagemap_action import ImagemapAction
-from linebot.v3.messaging.models.imagemap_area import ImagemapArea
-from linebot.v3.messaging.models.imagemap_base_size import ImagemapBaseSize
-from linebot.v3.messaging.models.imagemap_external_link import ImagemapExternalLink
-from linebot.v3.messaging.models.imagemap_message import ImagemapMessage
-from linebot.v3.messaging.models.imagemap_video import ImagemapVideo
-from linebot.v3.messaging.models.issue_link_token_response import IssueLinkTokenResponse
-from linebot.v3.messaging.models.limit import Limit
-from linebot.v3.messaging.models.location_action import LocationAction
-from linebot.v3.messaging.models.location_message import LocationMessage
-from linebot.v3.messaging.models.mark_messages_as_read_request import MarkMessagesAsReadRequest
-from linebot.v3.messaging.models.members_ids_response import MembersIdsResponse
-from linebot.v3.messaging.models.membership import Membership
-from linebot.v3.messaging.models.membership_list_response import MembershipListResponse
-from linebot.v3.messaging.models.mention_substitution_object import MentionSubstitutionObject
-from linebot.v3.messaging.models.mention_target import MentionTarget
-from linebot.v3.messaging.models.message import Message
-from linebot.v3.messaging.models.message_action import MessageAction
-from linebot.v3.messaging.models.message_imagemap_action import MessageImagemapAction
-from linebot.v3.messaging.models.message_quota_response import MessageQuotaResponse
-from linebot.v3.messaging.models.multicast_request import MulticastRequest
-from linebot.v3.messaging.models.narrowcast_progress_response import NarrowcastProgressResponse
-from linebot.v3.messaging.models.narrowcast_request import NarrowcastRequest
-from linebot.v3.messaging.models.number_of_messages_response import NumberOfMessagesResponse
-from linebot.v3.messaging.models.operator_demographic_filter import OperatorDemographicFilter
-from linebot.v3.messaging.models.operator_recipient import OperatorRecipient
-from linebot.v3.messaging.models.pnp_messages_request import PnpMessagesRequest
-from linebot.v3.messaging.models.postback_action import PostbackAction
-from linebot.v3.messaging.models.push_message_request import PushMessageRequest
-from linebot.v3.messaging.models.push_message_response import PushMessageResponse
-from linebot.v3.messaging.models.quick_reply import QuickReply
-from linebot.v3.messaging.models.quick_reply_item import QuickReplyItem
-from linebot.v3.messaging.models.quota_consumption_response import QuotaConsumptionResponse
-from linebot.v3.messaging.models.quota_type import QuotaType
-from linebot.v3.messaging.models.recipient import Recipient
-from linebot.v3.messaging.models.redelivery_recipient import RedeliveryRecipient
-from linebot.v3.messaging.models.reply_message_request import ReplyMessageRequest
-from linebot.v3.messaging.models.reply_message_response import ReplyMessageResponse
-from linebot.v3.messaging.models.rich_menu_alias_list_response import RichMenuAliasListResponse
-from linebot.v3.messaging.models.rich_menu_alias_response import RichMenuAliasResponse
-from linebot.v3.messaging.models.rich_menu_area import RichMenuArea
-from linebot.v3.messaging.models.rich_menu_batch_link_operation import RichMenuBatchLinkOperation
-from linebot.v3.messaging.models.rich_menu_batch_operation import RichMenuBatchOperation
-from linebot.v3.messaging.models.rich_menu_batch_progress_phase import RichMenuBatchProgressPhase
-from linebot.v3.messaging.models.rich_menu_batch_progress_response import RichMenuBatchProgressResponse
-from linebot.v3.messaging.models.rich_menu_batch_request import RichMenuBatchRequest
-from linebot.v3.messaging.models.rich_menu_batch_unlink_all_operation import RichMenuBatchUnlinkAllOperation
-from linebot.v3.messaging.models.rich_menu_batch_unlink_operation import RichMenuBatchUnlinkOperation
-from linebot.v3.messaging.models.rich_menu_bounds import RichMenuBounds
-from linebot.v3.messaging.models.rich_menu_bulk_link_request import RichMenuBulkLinkRequest
-from linebot.v3.messaging.models.rich_menu_bulk_unlink_request import RichMenuBulkUnlinkRequest
-from linebot.v3.messaging.models.rich_menu_id_response import RichMenuIdResponse
-from linebot.v3.messaging.models.rich_menu_list_response import RichMenuListResponse
-from linebot.v3.messaging.models.rich_menu_request import RichMenuRequest
-from linebot.v3.messaging.models.rich_menu_response import RichMenuResponse
-from linebot.v3.messaging.models.rich_menu_size import RichMenuSize
-from linebot.v3.messaging.models.rich_menu_switch_action import RichMenuSwitchAction
-from linebot.v3.messaging.models.room_member_count_response import RoomMemberCountResponse
-from linebot.v3.messaging.models.room_user_profile_response import RoomUserProfileResponse
-from linebot.v3.messaging.models.sender import Sender
-from linebot.v3.messaging.models.sent_message import SentMessage
-from linebot.v3.messaging.models.set_webhook_endpoint_request import SetWebhookEndpointRequest
-from linebot.v3.messaging.models.show_loading_animation_request import ShowLoadingAnimationRequest
-from linebot.v3.messaging.models.sticker_message import StickerMessage
-from linebot.v3.messaging.models.subscribed_membership_plan import SubscribedMembershipPlan
-from linebot.v3.messaging.models.subscribed_membership_user import SubscribedMembershipUser
-from linebot.v3.messaging.models.subscription import Subscription
-from linebot.v3.messaging.models.subscription_period_demographic import SubscriptionPeriodDemographic
-from linebot.v3.messaging.models.subscription_period_demographic_filter import SubscriptionPeriodDemographicFilter
-from linebot.v3.messaging.models.substitution_object import SubstitutionObject
-from linebot.v3.messaging.models.template import Template
-from linebot.v3.messaging.models.template_image_aspect_ratio import TemplateImageAspectRatio
-from linebot.v3.messaging.models.template_image_size import TemplateImageSize
-from linebot.v3.messaging.models.template_message import TemplateMessage
-from linebot.v3.messaging.models.test_webhook_endpoint_request import TestWebhookEndpointRequest
-from linebot.v3.messaging.models.test_webhook_endpoint_response import TestWebhookEndpointResponse
-from linebot.v3.messaging.models.text_message import TextMessage
-from linebot.v3.messaging.models.text_message_v2 import TextMessageV2
-from linebot.v3.messaging.models.uri_action import URIAction
-from linebot.v3.messaging.models.uri_imagemap_action import URIImagemapAction
-from linebot.v3.messaging.models.update_rich_menu_alias_request import UpdateRichMenuAliasRequest
-from linebot.v3.messaging.models.user_mention_target import UserMentionTarget
-from linebot.v3.messaging.models.user_profile_response import UserProfileResponse
-from linebot.v3.messaging.models.validate_message_request import ValidateMessageRequest
-from linebot.v3.messaging.models.video_message import VideoMessage
+    # import ApiClient
+    from linebot.v3.messaging.api_response import ApiResponse
+    from linebot.v3.messaging.api_client import ApiClient
+    from linebot.v3.messaging.async_api_client import AsyncApiClient
+    from linebot.v3.messaging.configuration import Configuration
+    from linebot.v3.messaging.exceptions import OpenApiException
+    from linebot.v3.messaging.exceptions import ApiTypeError
+    from linebot.v3.messaging.exceptions import ApiValueError
+    from linebot.v3.messaging.exceptions import ApiKeyError
+    from linebot.v3.messaging.exceptions import ApiAttributeError
+    from linebot.v3.messaging.exceptions import ApiException
+
+    # import models into sdk package
+    from linebot.v3.messaging.models.action import Action
+    from linebot.v3.messaging.models.age_demographic import AgeDemographic
+    from linebot.v3.messaging.models.age_demographic_filter import AgeDemographicFilter
+    from linebot.v3.messaging.models.all_mention_target import AllMentionTarget
+    from linebot.v3.messaging.models.alt_uri import AltUri
+    from linebot.v3.messaging.models.app_type_demographic import AppTypeDemographic
+    from linebot.v3.messaging.models.app_type_demographic_filter import AppTypeDemographicFilter
+    from linebot.v3.messaging.models.area_demographic import AreaDemographic
+    from linebot.v3.messaging.models.area_demographic_filter import AreaDemographicFilter
+    from linebot.v3.messaging.models.audience_recipient import AudienceRecipient
+    from linebot.v3.messaging.models.audio_message import AudioMessage
+    from linebot.v3.messaging.models.bot_info_response import BotInfoResponse
+    from linebot.v3.messaging.models.broadcast_request import BroadcastRequest
+    from linebot.v3.messaging.models.buttons_template import ButtonsTemplate
+    from linebot.v3.messaging.models.camera_action import CameraAction
+    from linebot.v3.messaging.models.camera_roll_action import CameraRollAction
+    from linebot.v3.messaging.models.carousel_column import CarouselColumn
+    from linebot.v3.messaging.models.carousel_template import CarouselTemplate
+    from linebot.v3.messaging.models.chat_reference import ChatReference
+    from linebot.v3.messaging.models.clipboard_action import ClipboardAction
+    from linebot.v3.messaging.models.clipboard_imagemap_action import ClipboardImagemapAction
+    from linebot.v3.messaging.models.confirm_template import ConfirmTemplate
+    from linebot.v3.messaging.models.create_rich_menu_alias_request import CreateRichMenuAliasRequest
+    from linebot.v3.messaging.models.datetime_picker_action import DatetimePickerAction
+    from linebot.v3.messaging.models.demographic_filter import DemographicFilter
+    from linebot.v3.messaging.models.emoji import Emoji
+    from linebot.v3.messaging.models.emoji_substitution_object import EmojiSubstitutionObject
+    from linebot.v3.messaging.models.error_detail import ErrorDetail
+    from linebot.v3.messaging.models.error_response import ErrorResponse
+    from linebot.v3.messaging.models.filter import Filter
+    from linebot.v3.messaging.models.flex_block_style import FlexBlockStyle
+    from linebot.v3.messaging.models.flex_box import FlexBox
+    from linebot.v3.messaging.models.flex_box_background import FlexBoxBackground
+    from linebot.v3.messaging.models.flex_box_border_width import FlexBoxBorderWidth
+    from linebot.v3.messaging.models.flex_box_corner_radius import FlexBoxCornerRadius
+    from linebot.v3.messaging.models.flex_box_linear_gradient import FlexBoxLinearGradient
+    from linebot.v3.messaging.models.flex_box_padding import FlexBoxPadding
+    from linebot.v3.messaging.models.flex_box_spacing import FlexBoxSpacing
+    from linebot.v3.messaging.models.flex_bubble import FlexBubble
+    from linebot.v3.messaging.models.flex_bubble_styles import FlexBubbleStyles
+    from linebot.v3.messaging.models.flex_button import FlexButton
+    from linebot.v3.messaging.models.flex_carousel import FlexCarousel
+    from linebot.v3.messaging.models.flex_component import FlexComponent
+    from linebot.v3.messaging.models.flex_container import FlexContainer
+    from linebot.v3.messaging.models.flex_filler import FlexFiller
+    from linebot.v3.messaging.models.flex_icon import FlexIcon
+    from linebot.v3.messaging.models.flex_icon_size import FlexIconSize
+    from linebot.v3.messaging.models.flex_image import FlexImage
+    from linebot.v3.messaging.models.flex_image_size import FlexImageSize
+    from linebot.v3.messaging.models.flex_margin import FlexMargin
+    from linebot.v3.messaging.models.flex_message import FlexMessage
+    from linebot.v3.messaging.models.flex_offset import FlexOffset
+    from linebot.v3.messaging.models.flex_separator import FlexSeparator
+    from linebot.v3.messaging.models.flex_span import FlexSpan
+    from linebot.v3.messaging.models.flex_span_size import FlexSpanSize
+    from linebot.v3.messaging.models.flex_text import FlexText
+    from linebot.v3.messaging.models.flex_text_font_size import FlexTextFontSize
+    from linebot.v3.messaging.models.flex_video import FlexVideo
+    from linebot.v3.messaging.models.gender_demographic import GenderDemographic
+    from linebot.v3.messaging.models.gender_demographic_filter import GenderDemographicFilter
+    from linebot.v3.messaging.models.get_aggregation_unit_name_list_response import GetAggregationUnitNameListResponse
+    from linebot.v3.messaging.models.get_aggregation_unit_usage_response import GetAggregationUnitUsageResponse
+    from linebot.v3.messaging.models.get_followers_response import GetFollowersResponse
+    from linebot.v3.messaging.models.get_membership_subscription_response import GetMembershipSubscriptionResponse
+    from linebot.v3.messaging.models.get_message_content_transcoding_response import GetMessageContentTranscodingResponse
+    from linebot.v3.messaging.models.get_webhook_endpoint_response import GetWebhookEndpointResponse
+    from linebot.v3.messaging.models.group_member_count_response import GroupMemberCountResponse
+    from linebot.v3.messaging.models.group_summary_response import GroupSummaryResponse
+    from linebot.v3.messaging.models.group_user_profile_response import GroupUserProfileResponse
+    from linebot.v3.messaging.models.image_carousel_column import ImageCarouselColumn
+    from linebot.v3.messaging.models.image_carousel_template import ImageCarouselTemplate
+    from linebot.v3.messaging.models.image_message import ImageMessage
+    from linebot.v3.messaging.models.imagemap_action import ImagemapAction
+    from linebot.v3.messaging.models.imagemap_area import ImagemapArea
+    from linebot.v3.messaging.models.imagemap_base_size import ImagemapBaseSize
+    from linebot.v3.messaging.models.imagemap_external_link import ImagemapExternalLink
+    from linebot.v3.messaging.models.imagemap_message import ImagemapMessage
+    from linebot.v3.messaging.models.imagemap_video import ImagemapVideo
+    from linebot.v3.messaging.models.issue_link_token_response import IssueLinkTokenResponse
+    from linebot.v3.messaging.models.limit import Limit
+    from linebot.v3.messaging.models.location_action import LocationAction
+    from linebot.v3.messaging.models.location_message import LocationMessage
+    from linebot.v3.messaging.models.mark_messages_as_read_request import MarkMessagesAsReadRequest
+    from linebot.v3.messaging.models.members_ids_response import MembersIdsResponse
+    from linebot.v3.messaging.models.membership import Membership
+    from linebot.v3.messaging.models.membership_list_response import MembershipListResponse
+    from linebot.v3.messaging.models.mention_substitution_object import MentionSubstitutionObject
+    from linebot.v3.messaging.models.mention_target import MentionTarget
+    from linebot.v3.messaging.models.message import Message
+    from linebot.v3.messaging.models.message_action import MessageAction
+    from linebot.v3.messaging.models.message_imagemap_action import MessageImagemapAction
+    from linebot.v3.messaging.models.message_quota_response import MessageQuotaResponse
+    from linebot.v3.messaging.models.multicast_request import MulticastRequest
+    from linebot.v3.messaging.models.narrowcast_progress_response import NarrowcastProgressResponse
+    from linebot.v3.messaging.models.narrowcast_request import NarrowcastRequest
+    from linebot.v3.messaging.models.number_of_messages_response import NumberOfMessagesResponse
+    from linebot.v3.messaging.models.operator_demographic_filter import OperatorDemographicFilter
+    from linebot.v3.messaging.models.operator_recipient import OperatorRecipient
+    from linebot.v3.messaging.models.pnp_messages_request import PnpMessagesRequest
+    from linebot.v3.messaging.models.postback_action import PostbackAction
+    from linebot.v3.messaging.models.push_message_request import PushMessageRequest
+    from linebot.v3.messaging.models.push_message_response import PushMessageResponse
+    from linebot.v3.messaging.models.quick_reply import QuickReply
+    from linebot.v3.messaging.models.quick_reply_item import QuickReplyItem
+    from linebot.v3.messaging.models.quota_consumption_response import QuotaConsumptionResponse
+    from linebot.v3.messaging.models.quota_type import QuotaType
+    from linebot.v3.messaging.models.recipient import Recipient
+    from linebot.v3.messaging.models.redelivery_recipient import RedeliveryRecipient
+    from linebot.v3.messaging.models.reply_message_request import ReplyMessageRequest
+    from linebot.v3.messaging.models.reply_message_response import ReplyMessageResponse
+    from linebot.v3.messaging.models.rich_menu_alias_list_response import RichMenuAliasListResponse
+    from linebot.v3.messaging.models.rich_menu_alias_response import RichMenuAliasResponse
+    from linebot.v3.messaging.models.rich_menu_area import RichMenuArea
+    from linebot.v3.messaging.models.rich_menu_batch_link_operation import RichMenuBatchLinkOperation
+    from linebot.v3.messaging.models.rich_menu_batch_operation import RichMenuBatchOperation
+    from linebot.v3.messaging.models.rich_menu_batch_progress_phase import RichMenuBatchProgressPhase
+    from linebot.v3.messaging.models.rich_menu_batch_progress_response import RichMenuBatchProgressResponse
+    from linebot.v3.messaging.models.rich_menu_batch_request import RichMenuBatchRequest
+    from linebot.v3.messaging.models.rich_menu_batch_unlink_all_operation import RichMenuBatchUnlinkAllOperation
+    from linebot.v3.messaging.models.rich_menu_batch_unlink_operation import RichMenuBatchUnlinkOperation
+    from linebot.v3.messaging.models.rich_menu_bounds import RichMenuBounds
+    from linebot.v3.messaging.models.rich_menu_bulk_link_request import RichMenuBulkLinkRequest
+    from linebot.v3.messaging.models.rich_menu_bulk_unlink_request import RichMenuBulkUnlinkRequest
+    from linebot.v3.messaging.models.rich_menu_id_response import RichMenuIdResponse
+    from linebot.v3.messaging.models.rich_menu_list_response import RichMenuListResponse
+    from linebot.v3.messaging.models.rich_menu_request import RichMenuRequest
+    from linebot.v3.messaging.models.rich_menu_response import RichMenuResponse
+    from linebot.v3.messaging.models.rich_menu_size import RichMenuSize
+    from linebot.v3.messaging.models.rich_menu_switch_action import RichMenuSwitchAction
+    from linebot.v3.messaging.models.room_member_count_response import RoomMemberCountResponse
+    from linebot.v3.messaging.models.room_user_profile_response import RoomUserProfileResponse
+    from linebot.v3.messaging.models.sender import Sender
+    from linebot.v3.messaging.models.sent_message import SentMessage
+    from linebot.v3.messaging.models.set_webhook_endpoint_request import SetWebhookEndpointRequest
+    from linebot.v3.messaging.models.show_loading_animation_request import ShowLoadingAnimationRequest
+    from linebot.v3.messaging.models.sticker_message import StickerMessage
+    from linebot.v3.messaging.models.subscribed_membership_plan import SubscribedMembershipPlan
+    from linebot.v3.messaging.models.subscribed_membership_user import SubscribedMembershipUser
+    from linebot.v3.messaging.models.subscription import Subscription
+    from linebot.v3.messaging.models.subscription_period_demographic import SubscriptionPeriodDemographic
+    from linebot.v3.messaging.models.subscription_period_demographic_filter import SubscriptionPeriodDemographicFilter
+    from linebot.v3.messaging.models.substitution_object import SubstitutionObject
+    from linebot.v3.messaging.models.template import Template
+    from linebot.v3.messaging.models.template_image_aspect_ratio import TemplateImageAspectRatio
+    from linebot.v3.messaging.models.template_image_size import TemplateImageSize
+    from linebot.v3.messaging.models.template_message import TemplateMessage
+    from linebot.v3.messaging.models.test_webhook_endpoint_request import TestWebhookEndpointRequest
+    from linebot.v3.messaging.models.test_webhook_endpoint_response import TestWebhookEndpointResponse
+    from linebot.v3.messaging.models.text_message import TextMessage
+    from linebot.v3.messaging.models.text_message_v2 import TextMessageV2
+    from linebot.v3.messaging.models.uri_action import URIAction
+    from linebot.v3.messaging.models.uri_imagemap_action import URIImagemapAction
+    from linebot.v3.messaging.models.update_rich_menu_alias_request import UpdateRichMenuAliasRequest
+    from linebot.v3.messaging.models.user_mention_target import UserMentionTarget
+    from linebot.v3.messaging.models.user_profile_response import UserProfileResponse
+    from linebot.v3.messaging.models.validate_message_request import ValidateMessageRequest
+    from linebot.v3.messaging.models.video_message import VideoMessage
+else:
+    __getattr__, __dir__ = _lazy_exports(__name__, globals(), {
+        'MessagingApi': 'linebot.v3.messaging.api.messaging_api',
+        'MessagingApiBlob': 'linebot.v3.messaging.api.messaging_api_blob',
+        'AsyncMessagingApi': 'linebot.v3.messaging.api.async_messaging_api',
+        'AsyncMessagingApiBlob': 'linebot.v3.messaging.api.async_messaging_api_blob',
+        'ApiResponse': 'linebot.v3.messaging.api_response',
+        'ApiClient': 'linebot.v3.messaging.api_client',
+        'AsyncApiClient': 'linebot.v3.messaging.async_api_client',
+        'Configuration': 'linebot.v3.messaging.configuration',
+        'OpenApiException': 'linebot.v3.messaging.exceptions',
+        'ApiTypeError': 'linebot.v3.messaging.exceptions',
+        'ApiValueError': 'linebot.v3.messaging.exceptions',
+        'ApiKeyError': 'linebot.v3.messaging.exceptions',
+        'ApiAttributeError': 'linebot.v3.messaging.exceptions',
+        'ApiException': 'linebot.v3.messaging.exceptions',
+        'Action': 'linebot.v3.messaging.models.action',
+        'AgeDemographic': 'linebot.v3.messaging.models.age_demographic',
+        'AgeDemographicFilter': 'linebot.v3.messaging.models.age_demographic_filter',
+        'AllMentionTarget': 'linebot.v3.messaging.models.all_mention_target',
+        'AltUri': 'linebot.v3.messaging.models.alt_uri',
+        'AppTypeDemographic': 'linebot.v3.messaging.models.app_type_demographic',
+        'AppTypeDemographicFilter': 'linebot.v3.messaging.models.app_type_demographic_filter',
+        'AreaDemographic': 'linebot.v3.messaging.models.area_demographic',
+        'AreaDemographicFilter': 'linebot.v3.messaging.models.area_demographic_filter',
+        'AudienceRecipient': 'linebot.v3.messaging.models.audience_recipient',
+        'AudioMessage': 'linebot.v3.messaging.models.audio_message',
+        'BotInfoResponse': 'linebot.v3.messaging.models.bot_info_response',
+        'BroadcastRequest': 'linebot.v3.messaging.models.broadcast_request',
+        'ButtonsTemplate': 'linebot.v3.messaging.models.buttons_template',
+        'CameraAction': 'linebot.v3.messaging.models.camera_action',
+        'CameraRollAction': 'linebot.v3.messaging.models.camera_roll_action',
+        'CarouselColumn': 'linebot.v3.messaging.models.carousel_column',
+        'CarouselTemplate': 'linebot.v3.messaging.models.carousel_template',
+        'ChatReference': 'linebot.v3.messaging.models.chat_reference',
+        'ClipboardAction': 'linebot.v3.messaging.models.clipboard_action',
+        'ClipboardImagemapAction': 'linebot.v3.messaging.models.clipboard_imagemap_action',
+        'ConfirmTemplate': 'linebot.v3.messaging.models.confirm_template',
+        'CreateRichMenuAliasRequest': 'linebot.v3.messaging.models.create_rich_menu_alias_request',
+        'DatetimePickerAction': 'linebot.v3.messaging.models.datetime_picker_action',
+        'DemographicFilter': 'linebot.v3.messaging.models.demographic_filter',
+        'Emoji': 'linebot.v3.messaging.models.emoji',
+        'EmojiSubstitutionObject': 'linebot.v3.messaging.models.emoji_substitution_object',
+        'ErrorDetail': 'linebot.v3.messaging.models.error_detail',
+        'ErrorResponse': 'linebot.v3.messaging.models.error_response',
+        'Filter': 'linebot.v3.messaging.models.filter',
+        'FlexBlockStyle': 'linebot.v3.messaging.models.flex_block_style',
+        'FlexBox': 'linebot.v3.messaging.models.flex_box',
+        'FlexBoxBackground': 'linebot.v3.messaging.models.flex_box_background',
+        'FlexBoxBorderWidth': 'linebot.v3.messaging.models.flex_box_border_width',
+        'FlexBoxCornerRadius': 'linebot.v3.messaging.models.flex_box_corner_radius',
+        'FlexBoxLinearGradient': 'linebot.v3.messaging.models.flex_box_linear_gradient',
+        'FlexBoxPadding': 'linebot.v3.messaging.models.flex_box_padding',
+        'FlexBoxSpacing': 'linebot.v3.messaging.models.flex_box_spacing',
+        'FlexBubble': 'linebot.v3.messaging.models.flex_bubble',
+        'FlexBubbleStyles': 'linebot.v3.messaging.models.flex_bubble_styles',
+        'FlexButton': 'linebot.v3.messaging.models.flex_button',
+        'FlexCarousel': 'linebot.v3.messaging.models.flex_carousel',
+        'FlexComponent': 'linebot.v3.messaging.models.flex_component',
+        'FlexContainer': 'linebot.v3.messaging.models.flex_container',
+        'FlexFiller': 'linebot.v3.messaging.models.flex_filler',
+        'FlexIcon': 'linebot.v3.messaging.models.flex_icon',
+        'FlexIconSize': 'linebot.v3.messaging.models.flex_icon_size',
+        'FlexImage': 'linebot.v3.messaging.models.flex_image',
+        'FlexImageSize': 'linebot.v3.messaging.models.flex_image_size',
+        'FlexMargin': 'linebot.v3.messaging.models.flex_margin',
+        'FlexMessage': 'linebot.v3.messaging.models.flex_message',
+        'FlexOffset': 'linebot.v3.messaging.models.flex_offset',
+        'FlexSeparator': 'linebot.v3.messaging.models.flex_separator',
+        'FlexSpan': 'linebot.v3.messaging.models.flex_span',
+        'FlexSpanSize': 'linebot.v3.messaging.models.flex_span_size',
+        'FlexText': 'linebot.v3.messaging.models.flex_text',
+        'FlexTextFontSize': 'linebot.v3.messaging.models.flex_text_font_size',
+        'FlexVideo': 'linebot.v3.messaging.models.flex_video',
+        'GenderDemographic': 'linebot.v3.messaging.models.gender_demographic',
+        'GenderDemographicFilter': 'linebot.v3.messaging.models.gender_demographic_filter',
+        'GetAggregationUnitNameListResponse': 'linebot.v3.messaging.models.get_aggregation_unit_name_list_response',
+        'GetAggregationUnitUsageResponse': 'linebot.v3.messaging.models.get_aggregation_unit_usage_response',
+        'GetFollowersResponse': 'linebot.v3.messaging.models.get_followers_response',
+        'GetMembershipSubscriptionResponse': 'linebot.v3.messaging.models.get_membership_subscription_response',
+        'GetMessageContentTranscodingResponse': 'linebot.v3.messaging.models.get_message_content_transcoding_response',
+        'GetWebhookEndpointResponse': 'linebot.v3.messaging.models.get_webhook_endpoint_response',
+        'GroupMemberCountResponse': 'linebot.v3.messaging.models.group_member_count_response',
+        'GroupSummaryResponse': 'linebot.v3.messaging.models.group_summary_response',
+        'GroupUserProfileResponse': 'linebot.v3.messaging.models.group_user_profile_response',
+        'ImageCarouselColumn': 'linebot.v3.messaging.models.image_carousel_column',
+        'ImageCarouselTemplate': 'linebot.v3.messaging.models.image_carousel_template',
+        'ImageMessage': 'linebot.v3.messaging.models.image_message',
+        'ImagemapAction': 'linebot.v3.messaging.models.imagemap_action',
+        'ImagemapArea': 'linebot.v3.messaging.models.imagemap_area',
+        'ImagemapBaseSize': 'linebot.v3.messaging.models.imagemap_base_size',
+        'ImagemapExternalLink': 'linebot.v3.messaging.models.imagemap_external_link',
+        'ImagemapMessage': 'linebot.v3.messaging.models.imagemap_message',
+        'ImagemapVideo': 'linebot.v3.messaging.models.imagemap_video',
+        'IssueLinkTokenResponse': 'linebot.v3.messaging.models.issue_link_token_response',
+        'Limit': 'linebot.v3.messaging.models.limit',
+        'LocationAction': 'linebot.v3.messaging.models.location_action',
+        'LocationMessage': 'linebot.v3.messaging.models.location_message',
+        'MarkMessagesAsReadRequest': 'linebot.v3.messaging.models.mark_messages_as_read_request',
+        'MembersIdsResponse': 'linebot.v3.messaging.models.members_ids_response',
+        'Membership': 'linebot.v3.messaging.models.membership',
+        'MembershipListResponse': 'linebot.v3.messaging.models.membership_list_response',
+        'MentionSubstitutionObject': 'linebot.v3.messaging.models.mention_substitution_object',
+        'MentionTarget': 'linebot.v3.messaging.models.mention_target',
+        'Message': 'linebot.v3.messaging.models.message',
+        'MessageAction': 'linebot.v3.messaging.models.message_action',
+        'MessageImagemapAction': 'linebot.v3.messaging.models.message_imagemap_action',
+        'MessageQuotaResponse': 'linebot.v3.messaging.models.message_quota_response',
+        'MulticastRequest': 'linebot.v3.messaging.models.multicast_request',
+        'NarrowcastProgressResponse': 'linebot.v3.messaging.models.narrowcast_progress_response',
+        'NarrowcastRequest': 'linebot.v3.messaging.models.narrowcast_request',
+        'NumberOfMessagesResponse': 'linebot.v3.messaging.models.number_of_messages_response',
+        'OperatorDemographicFilter': 'linebot.v3.messaging.models.operator_demographic_filter',
+        'OperatorRecipient': 'linebot.v3.messaging.models.operator_recipient',
+        'PnpMessagesRequest': 'linebot.v3.messaging.models.pnp_messages_request',
+        'PostbackAction': 'linebot.v3.messaging.models.postback_action',
+        'PushMessageRequest': 'linebot.v3.messaging.models.push_message_request',
+        'PushMessageResponse': 'linebot.v3.messaging.models.push_message_response',
+        'QuickReply': 'linebot.v3.messaging.models.quick_reply',
+        'QuickReplyItem': 'linebot.v3.messaging.models.quick_reply_item',
+        'QuotaConsumptionResponse': 'linebot.v3.messaging.models.quota_consumption_response',
+        'QuotaType': 'linebot.v3.messaging.models.quota_type',
+        'Recipient': 'linebot.v3.messaging.models.recipient',
+        'RedeliveryRecipient': 'linebot.v3.messaging.models.redelivery_recipient',
+        'ReplyMessageRequest': 'linebot.v3.messaging.models.reply_message_request',
+        'ReplyMessageResponse': 'linebot.v3.messaging.models.reply_message_response',
+        'RichMenuAliasListResponse': 'linebot.v3.messaging.models.rich_menu_alias_list_response',
+        'RichMenuAliasResponse': 'linebot.v3.messaging.models.rich_menu_alias_response',
+        'RichMenuArea': 'linebot.v3.messaging.models.rich_menu_area',
+        'RichMenuBatchLinkOperation': 'linebot.v3.messaging.models.rich_menu_batch_link_operation',
+        'RichMenuBatchOperation': 'linebot.v3.messaging.models.rich_menu_batch_operation',
+        'RichMenuBatchProgressPhase': 'linebot.v3.messaging.models.rich_menu_batch_progress_phase',
+        'RichMenuBatchProgressResponse': 'linebot.v3.messaging.models.rich_menu_batch_progress_response',
+        'RichMenuBatchRequest': 'linebot.v3.messaging.models.rich_menu_batch_request',
+        'RichMenuBatchUnlinkAllOperation': 'linebot.v3.messaging.models.rich_menu_batch_unlink_all_operation',
+        'RichMenuBatchUnlinkOperation': 'linebot.v3.messaging.models.rich_menu_batch_unlink_operation',
+        'RichMenuBounds': 'linebot.v3.messaging.models.rich_menu_bounds',
+        'RichMenuBulkLinkRequest': 'linebot.v3.messaging.models.rich_menu_bulk_link_request',
+        'RichMenuBulkUnlinkRequest': 'linebot.v3.messaging.models.rich_menu_bulk_unlink_request',
+        'RichMenuIdResponse': 'linebot.v3.messaging.models.rich_menu_id_response',
+        'RichMenuListResponse': 'linebot.v3.messaging.models.rich_menu_list_response',
+        'RichMenuRequest': 'linebot.v3.messaging.models.rich_menu_request',
+        'RichMenuResponse': 'linebot.v3.messaging.models.rich_menu_response',
+        'RichMenuSize': 'linebot.v3.messaging.models.rich_menu_size',
+        'RichMenuSwitchAction': 'linebot.v3.messaging.models.rich_menu_switch_action',
+        'RoomMemberCountResponse': 'linebot.v3.messaging.models.room_member_count_response',
+        'RoomUserProfileResponse': 'linebot.v3.messaging.models.room_user_profile_response',
+        'Sender': 'linebot.v3.messaging.models.sender',
+        'SentMessage': 'linebot.v3.messaging.models.sent_message',
+        'SetWebhookEndpointRequest': 'linebot.v3.messaging.models.set_webhook_endpoint_request',
+        'ShowLoadingAnimationRequest': 'linebot.v3.messaging.models.show_loading_animation_request',
+        'StickerMessage': 'linebot.v3.messaging.models.sticker_message',
+        'SubscribedMembershipPlan': 'linebot.v3.messaging.models.subscribed_membership_plan',
+        'SubscribedMembershipUser': 'linebot.v3.messaging.models.subscribed_membership_user',
+        'Subscription': 'linebot.v3.messaging.models.subscription',
+        'SubscriptionPeriodDemographic': 'linebot.v3.messaging.models.subscription_period_demographic',
+        'SubscriptionPeriodDemographicFilter': 'linebot.v3.messaging.models.subscription_period_demographic_filter',
+        'SubstitutionObject': 'linebot.v3.messaging.models.substitution_object',
+        'Template': 'linebot.v3.messaging.models.template',
+        'TemplateImageAspectRatio': 'linebot.v3.messaging.models.template_image_aspect_ratio',
+        'TemplateImageSize': 'linebot.v3.messaging.models.template_image_size',
+        'TemplateMessage': 'linebot.v3.messaging.models.template_message',
+        'TestWebhookEndpointRequest': 'linebot.v3.messaging.models.test_webhook_endpoint_request',
+        'TestWebhookEndpointResponse': 'linebot.v3.messaging.models.test_webhook_endpoint_response',
+        'TextMessage': 'linebot.v3.messaging.models.text_message',
+        'TextMessageV2': 'linebot.v3.messaging.models.text_message_v2',
+        'URIAction': 'linebot.v3.messaging.models.uri_action',
+        'URIImagemapAction': 'linebot.v3.messaging.models.uri_imagemap_action',
+        'UpdateRichMenuAliasRequest': 'linebot.v3.messaging.models.update_rich_menu_alias_request',
+        'UserMentionTarget': 'linebot.v3.messaging.models.user_mention_target',
+        'UserProfileResponse': 'linebot.v3.messaging.models.user_profile_response',
+        'ValidateMessageRequest': 'linebot.v3.messaging.models.validate_message_request',
+        'VideoMessage': 'linebot.v3.messaging.models.video_message',
+    })
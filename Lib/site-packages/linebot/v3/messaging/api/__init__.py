@@ -1,11 +1,23 @@
 # flake8: noqa
 
-# import apis into api package
-from linebot.v3.messaging.api.messaging_api import MessagingApi
-from linebot.v3.messaging.api.messaging_api_blob import MessagingApiBlob
+import typing as _typing
 
+from linebot.v3.utils import lazy_exports as _lazy_exports
 
-# Async version
-from linebot.v3.messaging.api.async_messaging_api import AsyncMessagingApi
-from linebot.v3.messaging.api.async_messaging_api_blob import AsyncMessagingApiBlob
+# exports are imported on first access, see linebot.v3.utils.lazy_exports
+if _typing.TYPE_CHECKING:
+    # import apis into api package
+    from linebot.v3.messaging.api.messaging_api import MessagingApi
+    from linebot.v3.messaging.api.messaging_api_blob import MessagingApiBlob
 
+
+    # Async version
+    from linebot.v3.messaging.api.async_messaging_api import AsyncMessagingApi
+    from linebot.v3.messaging.api.async_messaging_api_blob import AsyncMessagingApiBlob
+else:
+    __getattr__, __dir__ = _lazy_exports(__name__, globals(), {
+        'MessagingApi': 'linebot.v3.messaging.api.messaging_api',
+        'MessagingApiBlob': 'linebot.v3.messaging.api.messaging_api_blob',
+        'AsyncMessagingApi': 'linebot.v3.messaging.api.async_messaging_api',
+        'AsyncMessagingApiBlob': 'linebot.v3.messaging.api.async_messaging_api_blob',
+    })
@@ -28,6 +28,8 @@ from linebot.v3.messaging.models.get_message_content_transcoding_response import
 
 from linebot.v3.messaging.async_api_client import AsyncApiClient
 from linebot.v3.messaging.api_response import ApiResponse
+from linebot.v3.messaging.exceptions import ApiException
+from linebot.v3.download import DEFAULT_CHUNK_SIZE, async_download, content_url
 from linebot.v3.messaging.exceptions import (  # noqa: F401
     ApiTypeError,
     ApiValueError
@@ -47,6 +49,38 @@ class AsyncMessagingApiBlob(object):
         self.api_client = api_client
         self.line_base_path = "https://api.line.me"
 
+    async def download_message_content(self, message_id, out,
+                                       chunk_size=DEFAULT_CHUNK_SIZE, offset=0,
+                                       max_resumes=3, _request_timeout=None):
+        """Stream image, video, and audio data sent from users to ``out``.
+
+        Unlike :py:meth:`get_message_content`, the content is copied
+        ``chunk_size`` bytes at a time and never held in memory as a whole.
+        See :py:mod:`linebot.v3.download`.
+
+        ``out.write`` may also be a coroutine function.
+
+        :param str message_id: Message ID of video or audio
+        :param out: Binary file object, file descriptor, or writable buffer
+            such as a ``bytearray``
+        :param int chunk_size: (optional) Bytes read at a time.
+            Default is 64 KiB
+        :param int offset: (optional) Start at this byte of the content,
+            e.g. the size of a partial file from an earlier attempt
+        :param int max_resumes: (optional) Times a dropped connection is
+            resumed with a Range request. Default is 3
+        :param _request_timeout: (optional) As for get_message_content
+        :rtype: int
+        :return: Number of bytes written to ``out``
+        """
+        url = content_url(
+            self.api_client, 'https://api-data.line.me',
+            '/v2/bot/message/{messageId}/content', messageId=message_id)
+        return await async_download(
+            self.api_client, url, out, ApiException, chunk_size=chunk_size,
+            offset=offset, max_resumes=max_resumes,
+            _request_timeout=_request_timeout)
+
 
     @overload
     async def get_message_content(self, message_id : Annotated[StrictStr, Field(..., description="Message ID of video or audio")], **kwargs) -> bytearray:  # noqa: E501
@@ -70,6 +70,8 @@ from linebot.v3.messaging.models.validate_message_request import ValidateMessage
 
 from linebot.v3.messaging.api_client import ApiClient
 from linebot.v3.messaging.api_response import ApiResponse
+from linebot.v3.pagination import IdPager
+from linebot.v3.utils import bind_unvalidated_methods
 from linebot.v3.messaging.exceptions import (  # noqa: F401
     ApiTypeError,
     ApiValueError
@@ -83,11 +85,144 @@ class MessagingApi(object):
     Do not edit the class manually.
     """
 
-    def __init__(self, api_client=None):
+    def __init__(self, api_client=None, skip_validation=False):
+        """__init__ method.
+
+        :param api_client: (optional) Default is ApiClient.get_default()
+        :param bool skip_validation: (optional) Call the methods without
+            pydantic argument validation; the request models are validated
+            when they are built. Default is False
+        """
         if api_client is None:
             api_client = ApiClient.get_default()
         self.api_client = api_client
         self.line_base_path = "https://api.line.me"
+        if skip_validation:
+            bind_unvalidated_methods(self)
+
+    def reply_message_json(self, body, **kwargs):
+        """Send reply message from a pre-serialized request body.
+
+        ``body`` is sent as it is: it is neither validated nor serialized
+        again. Build it once, e.g. with ``ReplyMessageRequest(...).to_json()``,
+        or render it from a template.
+
+        :param body: ReplyMessageRequest as JSON
+        :type body: str | bytes
+        :param async_req: Whether to execute the request asynchronously.
+        :type async_req: bool, optional
+        :param _request_timeout: timeout setting for this request.
+        :param _headers: additional request headers
+        :type _headers: dict, optional
+        :rtype: ReplyMessageResponse
+        """
+        return self._post_json('/v2/bot/message/reply', body, {
+            '200': "ReplyMessageResponse",
+            '400': "ErrorResponse",
+            '429': "ErrorResponse",
+        }, **kwargs)
+
+    def push_message_json(self, body, x_line_retry_key=None, **kwargs):
+        """Send push message from a pre-serialized request body.
+
+        See :py:meth:`reply_message_json`.
+
+        :param body: PushMessageRequest as JSON
+        :type body: str | bytes
+        :param str x_line_retry_key: (optional) Retry key (UUID)
+        :rtype: PushMessageResponse
+        """
+        return self._post_json('/v2/bot/message/push', body, {
+            '200': "PushMessageResponse",
+            '400': "ErrorResponse",
+            '403': "ErrorResponse",
+            '409': "ErrorResponse",
+            '429': "ErrorResponse",
+        }, x_line_retry_key=x_line_retry_key, **kwargs)
+
+    def multicast_json(self, body, x_line_retry_key=None, **kwargs):
+        """Send multicast message from a pre-serialized request body.
+
+        See :py:meth:`reply_message_json`.
+
+        :param body: MulticastRequest as JSON
+        :type body: str | bytes
+        :param str x_line_retry_key: (optional) Retry key (UUID)
+        :rtype: object
+        """
+        return self._post_json('/v2/bot/message/multicast', body, {
+            '200': "object",
+            '400': "ErrorResponse",
+            '403': "ErrorResponse",
+            '409': "ErrorResponse",
+            '429': "ErrorResponse",
+        }, x_line_retry_key=x_line_retry_key, **kwargs)
+
+    def _post_json(self, path, body, response_types_map, x_line_retry_key=None,
+                   async_req=None, _request_timeout=None, _headers=None):
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        header_params = dict(_headers or {})
+        header_params['Accept'] = 'application/json'
+        header_params['Content-Type'] = 'application/json'
+        if x_line_retry_key:
+            header_params['X-Line-Retry-Key'] = x_line_retry_key
+        return self.api_client.call_api(
+            path, 'POST',
+            {},
+            [],
+            header_params,
+            body=body,
+            post_params=[],
+            files={},
+            response_types_map=response_types_map,
+            auth_settings=['Bearer'],
+            async_req=async_req,
+            _return_http_data_only=True,
+            _request_timeout=_request_timeout,
+            _host=self.line_base_path,
+            collection_formats={})
+
+    def iter_followers(self, start=None, limit=None, prefetch=2, **kwargs):
+        """Iterate over the user IDs of all friends, fetching pages ahead.
+
+        See :py:class:`linebot.v3.pagination.IdPager`.
+
+        :param str start: (optional) Continuation token to start from
+        :param int limit: (optional) User IDs per request, up to 1000
+        :param int prefetch: (optional) Pages buffered ahead. Default is 2
+        :rtype: IdPager
+        """
+        def fetch_page(token):
+            response = self.get_followers(start=token, limit=limit, **kwargs)
+            return response.user_ids, response.next
+        return IdPager(fetch_page, start=start, prefetch=prefetch)
+
+    def iter_group_members_ids(self, group_id, start=None, prefetch=2, **kwargs):
+        """Iterate over the user IDs of all members of a group chat.
+
+        See :py:meth:`iter_followers`.
+
+        :param str group_id: Group ID
+        :rtype: IdPager
+        """
+        def fetch_page(token):
+            response = self.get_group_members_ids(group_id, start=token, **kwargs)
+            return response.member_ids, response.next
+        return IdPager(fetch_page, start=start, prefetch=prefetch)
+
+    def iter_room_members_ids(self, room_id, start=None, prefetch=2, **kwargs):
+        """Iterate over the user IDs of all members of a multi-person chat.
+
+        See :py:meth:`iter_followers`.
+
+        :param str room_id: Room ID
+        :rtype: IdPager
+        """
+        def fetch_page(token):
+            response = self.get_room_members_ids(room_id, start=token, **kwargs)
+            return response.member_ids, response.next
+        return IdPager(fetch_page, start=start, prefetch=prefetch)
 
 
     @validate_arguments
@@ -135,7 +135,8 @@ class RESTClientObject(object):
         # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
         if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
             if re.search('json', headers['Content-Type'], re.IGNORECASE):
-                if body is not None:
+                # bytes are already serialized, e.g. by AsyncMessagingApi.reply_message_json
+                if body is not None and not isinstance(body, bytes):
                     body = json.dumps(body)
                 args["data"] = body
             elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
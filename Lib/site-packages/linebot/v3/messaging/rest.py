@@ -151,7 +151,10 @@ class RESTClientObject(object):
                 # no content type provided or payload is json
                 if not headers.get('Content-Type') or re.search('json', headers['Content-Type'], re.IGNORECASE):
                     request_body = None
-                    if body is not None:
+                    if isinstance(body, bytes):
+                        # already serialized, e.g. by MessagingApi.reply_message_json
+                        request_body = body
+                    elif body is not None:
                         request_body = json.dumps(body)
                     r = self.pool_manager.request(
                         method, url,
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+"""linebot.v3.pagination module.
+
+Iterators over the IDs returned by continuation-token endpoints such as
+``get_followers``, ``get_group_members_ids`` and ``get_room_members_ids``.
+
+The next page is fetched in the background (a thread for
+:py:class:`IdPager`, a task for :py:class:`AsyncIdPager`) while the IDs of
+the current one are consumed, so page round trips overlap with the work
+done on the IDs instead of adding up. At most ``prefetch`` pages are
+buffered. :py:attr:`IdPager.resume_token` tells where to start
+again after a failure or a restart.
+"""
+
+
+import asyncio
+import queue
+import threading
+
+# put in the page queue after the last page
+_END = object()
+
+
+class IdPager(object):
+    """Iterator over the IDs of all pages, fetching pages ahead in a thread.
+
+    ``resume_token`` is the continuation token of the page the last ID came
+    from. Passing it as ``start`` fetches that whole page again, so callers
+    must dedupe up to one full page of IDs that were already returned.
+    After an error it is the token of the page that failed, and None once
+    all IDs have been returned.
+
+    .. code-block:: python
+
+        with messaging_api.iter_followers() as user_ids:
+            for user_id in user_ids:
+                ...
+    """
+
+    def __init__(self, fetch_page, start=None, prefetch=2):
+        """__init__ method.
+
+        :param fetch_page: Function taking a continuation token (None for
+            the first page) and returning ``(ids, next_token)``
+        :param str start: (optional) Continuation token to start from
+        :param int prefetch: (optional) Maximum number of pages fetched
+            ahead of the one being consumed. Default is 2
+        """
+        self.resume_token = start
+        self._fetch_page = fetch_page
+        self._pages = queue.Queue(max(prefetch, 1))
+        self._stop = threading.Event()
+        self._thread = None
+        self._ids = iter(())
+        self._done = False
+
+    def __iter__(self):
+        """__iter__ method."""
+        return self
+
+    def __next__(self):
+        """__next__ method."""
+        while True:
+            for item in self._ids:
+                return item
+            if self._done:
+                raise StopIteration
+            if self._thread is None:
+                # the thread must not reference self, so that an abandoned
+                # pager can be collected and stop it in __del__
+                self._thread = threading.Thread(target=_produce, args=(
+                    self._fetch_page, self.resume_token, self._pages,
+                    self._stop), daemon=True)
+                self._thread.start()
+            page = self._pages.get()
+            if page is _END:
+                self._done = True
+                self.resume_token = None
+                raise StopIteration
+            token, ids, error = page
+            if error is not None:
+                self._done = True
+                self.resume_token = token
+                raise error
+            self.resume_token = token
+            # a page without IDs is empty, not the end
+            self._ids = iter(ids or ())
+
+    def close(self):
+        """Stop fetching pages."""
+        self._done = True
+        self._stop.set()
+
+    def __del__(self):
+        """__del__ method."""
+        self._stop.set()
+
+    def __enter__(self):
+        """__enter__ method."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """__exit__ method."""
+        self.close()
+
+
+class AsyncIdPager(object):
+    """Async iterator over the IDs of all pages, fetching pages ahead in a task.
+
+    ``resume_token`` works as in :py:class:`IdPager`.
+
+    .. code-block:: python
+
+        async with messaging_api.iter_followers() as user_ids:
+            async for user_id in user_ids:
+                ...
+    """
+
+    def __init__(self, fetch_page, start=None, prefetch=2):
+        """__init__ method.
+
+        :param fetch_page: Coroutine function taking a continuation token
+            (None for the first page) and returning ``(ids, next_token)``
+        :param str start: (optional) Continuation token to start from
+        :param int prefetch: (optional) Maximum number of pages fetched
+            ahead of the one being consumed. Default is 2
+        """
+        self.resume_token = start
+        self._fetch_page = fetch_page
+        self._prefetch = max(prefetch, 1)
+        self._pages = None
+        self._task = None
+        self._ids = iter(())
+        self._done = False
+
+    def __aiter__(self):
+        """__aiter__ method."""
+        return self
+
+    async def __anext__(self):
+        """__anext__ method."""
+        while True:
+            for item in self._ids:
+                return item
+            if self._done:
+                raise StopAsyncIteration
+            if self._task is None:
+                self._pages = asyncio.Queue(self._prefetch)
+                self._task = asyncio.ensure_future(_aproduce(
+                    self._fetch_page, self.resume_token, self._pages))
+            page = await self._pages.get()
+            if page is _END:
+                self._done = True
+                self.resume_token = None
+                raise StopAsyncIteration
+            token, ids, error = page
+            if error is not None:
+                self._done = True
+                self.resume_token = token
+                raise error
+            self.resume_token = token
+            # a page without IDs is empty, not the end
+            self._ids = iter(ids or ())
+
+    async def aclose(self):
+        """Stop fetching pages."""
+        self._done = True
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def __aenter__(self):
+        """__aenter__ method."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """__aexit__ method."""
+        await self.aclose()
+
+    def __del__(self):
+        """__del__ method."""
+        if self._task is not None and not self._task.done():
+            try:
+                self._task.cancel()
+            except RuntimeError:
+                # event loop already closed
+                pass
+
+
+def _produce(fetch_page, token, pages, stop):
+    def put(item):
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    try:
+        while not stop.is_set():
+            ids, next_token = fetch_page(token)
+            put((token, ids, None))
+            if not next_token:
+                break
+            token = next_token
+        put(_END)
+    except Exception as e:
+        put((token, None, e))
+
+
+async def _aproduce(fetch_page, token, pages):
+    try:
+        while True:
+            ids, next_token = await fetch_page(token)
+            await pages.put((token, ids, None))
+            if not next_token:
+                break
+            token = next_token
+        await pages.put(_END)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        await pages.put((token, None, e))
@@ -15,8 +15,10 @@
 """linebot.v3.utils module."""
 
 
+import importlib
 import logging
 import re
+import types
 
 import sys
 
@@ -67,3 +69,80 @@ def safe_compare_digest(val1, val2):
             result |= (ord(i) ^ ord(j))
 
     return result == 0
+
+
+def bind_unvalidated_methods(api):
+    """Make the ``@validate_arguments`` methods of ``api`` skip validation.
+
+    The generated API classes wrap every public method with pydantic's
+    ``validate_arguments``, which re-validates request models that were
+    validated when they were built. This binds the undecorated functions
+    on this instance only; other instances of the class are unaffected.
+
+    :param api: Generated API instance, e.g. ``MessagingApi``
+    :return: ``api``
+    """
+    for name in _validated_method_names(type(api)):
+        raw_function = getattr(type(api), name).raw_function
+        setattr(api, name, types.MethodType(raw_function, api))
+    return api
+
+
+_VALIDATED_METHOD_NAMES = {}
+
+
+def _validated_method_names(cls):
+    names = _VALIDATED_METHOD_NAMES.get(cls)
+    if names is None:
+        names = _VALIDATED_METHOD_NAMES[cls] = [
+            name for name, attr in vars(cls).items()
+            if callable(attr) and hasattr(attr, 'raw_function')
+        ]
+    return names
+
+
+def lazy_exports(package, namespace, attributes):
+    """Build module ``__getattr__`` and ``__dir__`` functions for ``package``.
+
+    The generated API packages used to import every API class and model
+    module when the package was imported. They pass their exports here
+    instead and expose the returned functions at module level (PEP 562),
+    so each name is imported the first time it is looked up and then cached
+    in the module namespace.
+
+    Names missing from ``attributes`` fall back to importing the submodule
+    of that name, so ``package.submodule`` keeps working without an explicit
+    import. ``__all__`` is set to the exported names unless the package
+    defines it, so ``from package import *`` still exports all of them.
+
+    :param str package: Package name, i.e. ``__name__``
+    :param dict namespace: Package namespace, i.e. ``globals()``
+    :param dict attributes: Exported name to the module defining it
+    :rtype: tuple
+    :return: ``(__getattr__, __dir__)``
+    """
+    namespace.setdefault('__all__', list(attributes))
+
+    def __getattr__(name):
+        module_name = attributes.get(name)
+        if module_name is not None:
+            value = getattr(importlib.import_module(module_name), name)
+        elif name.startswith('__'):
+            raise AttributeError(
+                'module {0!r} has no attribute {1!r}'.format(package, name))
+        else:
+            try:
+                value = importlib.import_module(package + '.' + name)
+            except ModuleNotFoundError as err:
+                if err.name != package + '.' + name:
+                    raise
+                raise AttributeError(
+                    'module {0!r} has no attribute {1!r}'.format(package, name)
+                ) from None
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(attributes))
+
+    return __getattr__, __dir__
@@ -16,10 +16,18 @@
 
 
 import base64
+import functools
 import hashlib
 import hmac
 import inspect
 import json
+import sys
+from enum import Enum
+
+from pydantic.v1 import BaseModel
+from pydantic.v1.fields import SHAPE_LIST
+
+from linebot.async_webhook import AsyncWebhookHandlerMixin
 
 from .exceptions import InvalidSignatureError
 from .webhooks import (
@@ -92,6 +100,76 @@ class SignatureValidator(object):
         )
 
 
+# model class -> (is discriminated, defaults, [(alias, field name, converter, is list)])
+_CONSTRUCT_PLANS = {}
+
+
+def construct_model(cls, obj):
+    """Build a webhook model from a JSON-decoded dict without validation.
+
+    The result matches ``cls.from_dict(obj)`` for well-formed input: the
+    concrete class is picked through the model's discriminator, nested models
+    and enums are converted and missing fields get their defaults, but values
+    are assigned as they are, without pydantic validation. Only use it for
+    data whose origin is already proven, e.g. by the webhook signature.
+
+    :param cls: Model class, e.g. :py:class:`linebot.v3.webhooks.models.Event`
+    :param dict obj: JSON-decoded data
+    :raises ValueError: if a discriminator value is not known
+    """
+    if obj is None:
+        return None
+
+    plan = _CONSTRUCT_PLANS.get(cls)
+    if plan is None:
+        plan = _CONSTRUCT_PLANS[cls] = _construct_plan(cls)
+    discriminated, defaults, fields = plan
+
+    if discriminated:
+        class_name = cls.get_discriminator_value(obj)
+        if class_name is None:
+            raise ValueError(cls.__name__ + ' failed to lookup discriminator value from ' + json.dumps(obj))
+        if class_name != cls.__name__:
+            package = sys.modules[cls.__module__.rpartition('.')[0]]
+            return construct_model(getattr(package, class_name), obj)
+
+    # same result as BaseModel.construct(), minus its per-call field walk
+    values = dict(defaults)
+    fields_set = set()
+    for alias, name, convert, is_list in fields:
+        value = obj.get(alias)
+        if value is None:
+            continue
+        if convert is not None:
+            value = [convert(item) for item in value] if is_list else convert(value)
+        values[name] = value
+        fields_set.add(name)
+
+    model = cls.__new__(cls)
+    object.__setattr__(model, '__dict__', values)
+    object.__setattr__(model, '__fields_set__', fields_set)
+    if cls.__private_attributes__:
+        model._init_private_attributes()
+    return model
+
+
+def _construct_plan(cls):
+    defaults = {}
+    fields = []
+    for field in cls.__fields__.values():
+        # defaults of the generated models are None or immutable literals
+        defaults[field.name] = None if field.required else field.get_default()
+        field_type = field.type_
+        convert = None
+        if isinstance(field_type, type):
+            if issubclass(field_type, BaseModel):
+                convert = functools.partial(construct_model, field_type)
+            elif issubclass(field_type, Enum):
+                convert = field_type
+        fields.append((field.alias, field.name, convert, field.shape == SHAPE_LIST))
+    return hasattr(cls, 'get_discriminator_value'), defaults, fields
+
+
 class WebhookPayload(object):
     """Webhook Payload.
 
@@ -112,12 +190,17 @@ class WebhookPayload(object):
 class WebhookParser(object):
     """Webhook Parser."""
 
-    def __init__(self, channel_secret):
+    def __init__(self, channel_secret, skip_validation=False):
         """__init__ method.
 
         :param str channel_secret: Channel secret (as text)
+        :param bool skip_validation: (optional) Build events with
+            :py:func:`construct_model` instead of validating them with
+            pydantic. The body is trusted once its signature is checked.
+            Default is False
         """
         self.signature_validator = SignatureValidator(channel_secret)
+        self.skip_validation = skip_validation
 
     def parse(self, body, signature, as_payload=False):
         """Parse webhook request body as text.
@@ -134,19 +217,31 @@ class WebhookParser(object):
                 'Invalid signature. signature=' + signature)
 
         body_json = json.loads(body)
-        events = []
-        for event in body_json['events']:
-            try:
-                events.append(Event.from_dict(event))
-            except ValueError:
-                LOGGER.info('Unknown event type. type=' + event['type'])
-                events.append(UnknownEvent.new_from_json_dict(event))
+        events = [self.parse_event(event) for event in body_json['events']]
 
         if as_payload:
             return WebhookPayload(events=events, destination=body_json.get('destination'))
         else:
             return events
 
+    def parse_event(self, event):
+        """Build an event object from one element of the webhook ``events`` array.
+
+        The signature is not checked here; only pass events taken from a
+        body which has already been validated.
+
+        :param dict event: Event (as JSON-decoded dict)
+        :rtype: T <= :py:class:`linebot.v3.webhooks.models.Event`
+        :return: Event instance
+        """
+        try:
+            if self.skip_validation:
+                return construct_model(Event, event)
+            return Event.from_dict(event)
+        except ValueError:
+            LOGGER.info('Unknown event type. type=' + event['type'])
+            return UnknownEvent.new_from_json_dict(event)
+
 
 class WebhookHandler(object):
     """Webhook Handler.
@@ -154,12 +249,14 @@ class WebhookHandler(object):
     Please read https://github.com/line/line-bot-sdk-python#webhookhandler
     """
 
-    def __init__(self, channel_secret):
+    def __init__(self, channel_secret, skip_validation=False):
         """__init__ method.
 
         :param str channel_secret: Channel secret (as text)
+        :param bool skip_validation: (optional) Build events without pydantic
+            validation; see :py:class:`WebhookParser`. Default is False
         """
-        self.parser = WebhookParser(channel_secret)
+        self.parser = WebhookParser(channel_secret, skip_validation=skip_validation)
         self._handlers = {}
         self._default = None
 
@@ -206,39 +303,48 @@ class WebhookHandler(object):
         payload = self.parser.parse(body, signature, as_payload=True)
 
         for event in payload.events:
-            func = None
-            key = None
+            func = self._find_handler(event)
+            if func is not None:
+                self._invoke_func(func, event, payload)
 
-            if isinstance(event, MessageEvent):
-                key = self.__get_handler_key(
-                    event.__class__, event.message.__class__)
-                func = self._handlers.get(key, None)
+    def _find_handler(self, event):
+        func = None
+        key = None
 
-            if func is None:
-                key = self.__get_handler_key(event.__class__)
-                func = self._handlers.get(key, None)
+        if isinstance(event, MessageEvent):
+            key = self.__get_handler_key(
+                event.__class__, event.message.__class__)
+            func = self._handlers.get(key, None)
 
-            if func is None:
-                func = self._default
+        if func is None:
+            key = self.__get_handler_key(event.__class__)
+            func = self._handlers.get(key, None)
 
-            if func is None:
-                LOGGER.info('No handler of ' + key + ' and no default handler')
-            else:
-                self.__invoke_func(func, event, payload)
+        if func is None:
+            func = self._default
+
+        if func is None:
+            LOGGER.info('No handler of ' + key + ' and no default handler')
+
+        return func
 
     def __add_handler(self, func, event, message=None):
         key = self.__get_handler_key(event, message=message)
         self._handlers[key] = func
 
     @classmethod
-    def __invoke_func(cls, func, event, payload):
+    def _invoke_func(cls, func, event, payload):
+        return func(*cls._get_invoke_args(func, event, payload.destination))
+
+    @classmethod
+    def _get_invoke_args(cls, func, event, destination):
         (has_varargs, args_count) = cls.__get_args_count(func)
         if has_varargs or args_count == 2:
-            func(event, payload.destination)
+            return (event, destination)
         elif args_count == 1:
-            func(event)
+            return (event,)
         else:
-            func()
+            return ()
 
     @staticmethod
     def __get_args_count(func):
@@ -255,3 +361,38 @@ class WebhookHandler(object):
             return event.__name__
         else:
             return event.__name__ + '_' + message.__name__
+
+
+class AsyncWebhookHandler(AsyncWebhookHandlerMixin, WebhookHandler):
+    """Webhook Handler for asyncio applications.
+
+    Coroutine functions registered with :py:meth:`add` are awaited and
+    plain functions are run in an executor, so a slow handler does not
+    block the event loop. The events of one webhook body are dispatched
+    concurrently.
+    """
+
+    def __init__(self, channel_secret, executor=None, skip_validation=False):
+        """__init__ method.
+
+        :param str channel_secret: Channel secret (as text)
+        :param executor: (optional) Executor used to run non-coroutine
+            handlers. Default is the event loop's default executor.
+        :type executor: :py:class:`concurrent.futures.Executor`
+        :param bool skip_validation: (optional) Build events without pydantic
+            validation; see :py:class:`WebhookParser`. Default is False
+        """
+        super(AsyncWebhookHandler, self).__init__(channel_secret, skip_validation=skip_validation)
+        self.executor = executor
+
+    async def handle(self, body, signature):
+        """Handle webhook.
+
+        If a handler raises, the first exception is propagated once every
+        event of the body has been dispatched.
+
+        :param str body: Webhook request body (as text)
+        :param str signature: X-Line-Signature value (as text)
+        """
+        payload = self.parser.parse(body, signature, as_payload=True)
+        await self._dispatch_payload(payload)
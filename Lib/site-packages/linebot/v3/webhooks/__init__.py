@@ -13,84 +13,165 @@
     Do not edit the class manually.
 """
 
+import typing as _typing
 
-# import apis into sdk package
-from linebot.v3.webhooks.api.dummy import Dummy
+from linebot.v3.utils import lazy_exports as _lazy_exports
 
-from linebot.v3.webhooks.api.async_dummy import AsyncDummy
+# exports are imported on first access, see linebot.v3.utils.lazy_exports
+if _typing.TYPE_CHECKING:
+    # import apis into sdk package
+    from linebot.v3.webhooks.api.dummy import Dummy
 
+    from linebot.v3.webhooks.api.async_dummy import AsyncDummy
 
-# import ApiClient
-from linebot.v3.webhooks.api_response import ApiResponse
-from linebot.v3.webhooks.api_client import ApiClient
-from linebot.v3.webhooks.async_api_client import AsyncApiClient
-from linebot.v3.webhooks.configuration import Configuration
-from linebot.v3.webhooks.exceptions import OpenApiException
-from linebot.v3.webhooks.exceptions import ApiTypeError
-from linebot.v3.webhooks.exceptions import ApiValueError
-from linebot.v3.webhooks.exceptions import ApiKeyError
-from linebot.v3.webhooks.exceptions import ApiAttributeError
-from linebot.v3.webhooks.exceptions import ApiException
 
-# import models into sdk package
-from linebot.v3.webhooks.models.account_link_event import AccountLinkEvent
-from linebot.v3.webhooks.models.action_result import ActionResult
-from linebot.v3.webhooks.models.activated_event import ActivatedEvent
-from linebot.v3.webhooks.models.all_mentionee import AllMentionee
-from linebot.v3.webhooks.models.attached_module_content import AttachedModuleContent
-from linebot.v3.webhooks.models.audio_message_content import AudioMessageContent
-from linebot.v3.webhooks.models.beacon_content import BeaconContent
-from linebot.v3.webhooks.models.beacon_event import BeaconEvent
-from linebot.v3.webhooks.models.bot_resumed_event import BotResumedEvent
-from linebot.v3.webhooks.models.bot_suspended_event import BotSuspendedEvent
-from linebot.v3.webhooks.models.callback_request import CallbackRequest
-from linebot.v3.webhooks.models.chat_control import ChatControl
-from linebot.v3.webhooks.models.content_provider import ContentProvider
-from linebot.v3.webhooks.models.deactivated_event import DeactivatedEvent
-from linebot.v3.webhooks.models.delivery_context import DeliveryContext
-from linebot.v3.webhooks.models.detached_module_content import DetachedModuleContent
-from linebot.v3.webhooks.models.emoji import Emoji
-from linebot.v3.webhooks.models.event import Event
-from linebot.v3.webhooks.models.event_mode import EventMode
-from linebot.v3.webhooks.models.file_message_content import FileMessageContent
-from linebot.v3.webhooks.models.follow_detail import FollowDetail
-from linebot.v3.webhooks.models.follow_event import FollowEvent
-from linebot.v3.webhooks.models.group_source import GroupSource
-from linebot.v3.webhooks.models.image_message_content import ImageMessageContent
-from linebot.v3.webhooks.models.image_set import ImageSet
-from linebot.v3.webhooks.models.join_event import JoinEvent
-from linebot.v3.webhooks.models.joined_members import JoinedMembers
-from linebot.v3.webhooks.models.leave_event import LeaveEvent
-from linebot.v3.webhooks.models.left_members import LeftMembers
-from linebot.v3.webhooks.models.link_content import LinkContent
-from linebot.v3.webhooks.models.link_things_content import LinkThingsContent
-from linebot.v3.webhooks.models.location_message_content import LocationMessageContent
-from linebot.v3.webhooks.models.member_joined_event import MemberJoinedEvent
-from linebot.v3.webhooks.models.member_left_event import MemberLeftEvent
-from linebot.v3.webhooks.models.mention import Mention
-from linebot.v3.webhooks.models.mentionee import Mentionee
-from linebot.v3.webhooks.models.message_content import MessageContent
-from linebot.v3.webhooks.models.message_event import MessageEvent
-from linebot.v3.webhooks.models.module_content import ModuleContent
-from linebot.v3.webhooks.models.module_event import ModuleEvent
-from linebot.v3.webhooks.models.pnp_delivery import PnpDelivery
-from linebot.v3.webhooks.models.pnp_delivery_completion_event import PnpDeliveryCompletionEvent
-from linebot.v3.webhooks.models.postback_content import PostbackContent
-from linebot.v3.webhooks.models.postback_event import PostbackEvent
-from linebot.v3.webhooks.models.room_source import RoomSource
-from linebot.v3.webhooks.models.scenario_result import ScenarioResult
-from linebot.v3.webhooks.models.scenario_result_things_content import ScenarioResultThingsContent
-from linebot.v3.webhooks.models.source import Source
-from linebot.v3.webhooks.models.sticker_message_content import StickerMessageContent
-from linebot.v3.webhooks.models.text_message_content import TextMessageContent
-from linebot.v3.webhooks.models.things_content import ThingsContent
-from linebot.v3.webhooks.models.things_event import ThingsEvent
-from linebot.v3.webhooks.models.unfollow_event import UnfollowEvent
-from linebot.v3.webhooks.models.unlink_things_content import UnlinkThingsContent
-from linebot.v3.webhooks.models.unsend_detail import UnsendDetail
-from linebot.v3.webhooks.models.unsend_event import UnsendEvent
-from linebot.v3.webhooks.models.user_mentionee import UserMentionee
-from linebot.v3.webhooks.models.user_source import UserSource
-from linebot.v3.webhooks.models.video_message_content import VideoMessageContent
-from linebot.v3.webhooks.models.video_play_complete import VideoPlayComplete
-from linebot.v3.webhooks.models.video_play_complete_event import VideoPlayCompleteEvent
+    # import ApiClient
+    from linebot.v3.webhooks.api_response import ApiResponse
+    from linebot.v3.webhooks.api_client import ApiClient
+    from linebot.v3.webhooks.async_api_client import AsyncApiClient
+    from linebot.v3.webhooks.configuration import Configuration
+    from linebot.v3.webhooks.exceptions import OpenApiException
+    from linebot.v3.webhooks.exceptions import ApiTypeError
+    from linebot.v3.webhooks.exceptions import ApiValueError
+    from linebot.v3.webhooks.exceptions import ApiKeyError
+    from linebot.v3.webhooks.exceptions import ApiAttributeError
+    from linebot.v3.webhooks.exceptions import ApiException
+
+    # import models into sdk package
+    from linebot.v3.webhooks.models.account_link_event import AccountLinkEvent
+    from linebot.v3.webhooks.models.action_result import ActionResult
+    from linebot.v3.webhooks.models.activated_event import ActivatedEvent
+    from linebot.v3.webhooks.models.all_mentionee import AllMentionee
+    from linebot.v3.webhooks.models.attached_module_content import AttachedModuleContent
+    from linebot.v3.webhooks.models.audio_message_content import AudioMessageContent
+    from linebot.v3.webhooks.models.beacon_content import BeaconContent
+    from linebot.v3.webhooks.models.beacon_event import BeaconEvent
+    from linebot.v3.webhooks.models.bot_resumed_event import BotResumedEvent
+    from linebot.v3.webhooks.models.bot_suspended_event import BotSuspendedEvent
+    from linebot.v3.webhooks.models.callback_request import CallbackRequest
+    from linebot.v3.webhooks.models.chat_control import ChatControl
+    from linebot.v3.webhooks.models.content_provider import ContentProvider
+    from linebot.v3.webhooks.models.deactivated_event import DeactivatedEvent
+    from linebot.v3.webhooks.models.delivery_context import DeliveryContext
+    from linebot.v3.webhooks.models.detached_module_content import DetachedModuleContent
+    from linebot.v3.webhooks.models.emoji import Emoji
+    from linebot.v3.webhooks.models.event import Event
+    from linebot.v3.webhooks.models.event_mode import EventMode
+    from linebot.v3.webhooks.models.file_message_content import FileMessageContent
+    from linebot.v3.webhooks.models.follow_detail import FollowDetail
+    from linebot.v3.webhooks.models.follow_event import FollowEvent
+    from linebot.v3.webhooks.models.group_source import GroupSource
+    from linebot.v3.webhooks.models.image_message_content import ImageMessageContent
+    from linebot.v3.webhooks.models.image_set import ImageSet
+    from linebot.v3.webhooks.models.join_event import JoinEvent
+    from linebot.v3.webhooks.models.joined_members import JoinedMembers
+    from linebot.v3.webhooks.models.leave_event import LeaveEvent
+    from linebot.v3.webhooks.models.left_members import LeftMembers
+    from linebot.v3.webhooks.models.link_content import LinkContent
+    from linebot.v3.webhooks.models.link_things_content import LinkThingsContent
+    from linebot.v3.webhooks.models.location_message_content import LocationMessageContent
+    from linebot.v3.webhooks.models.member_joined_event import MemberJoinedEvent
+    from linebot.v3.webhooks.models.member_left_event import MemberLeftEvent
+    from linebot.v3.webhooks.models.mention import Mention
+    from linebot.v3.webhooks.models.mentionee import Mentionee
+    from linebot.v3.webhooks.models.message_content import MessageContent
+    from linebot.v3.webhooks.models.message_event import MessageEvent
+    from linebot.v3.webhooks.models.module_content import ModuleContent
+    from linebot.v3.webhooks.models.module_event import ModuleEvent
+    from linebot.v3.webhooks.models.pnp_delivery import PnpDelivery
+    from linebot.v3.webhooks.models.pnp_delivery_completion_event import PnpDeliveryCompletionEvent
+    from linebot.v3.webhooks.models.postback_content import PostbackContent
+    from linebot.v3.webhooks.models.postback_event import PostbackEvent
+    from linebot.v3.webhooks.models.room_source import RoomSource
+    from linebot.v3.webhooks.models.scenario_result import ScenarioResult
+    from linebot.v3.webhooks.models.scenario_result_things_content import ScenarioResultThingsContent
+    from linebot.v3.webhooks.models.source import Source
+    from linebot.v3.webhooks.models.sticker_message_content import StickerMessageContent
+    from linebot.v3.webhooks.models.text_message_content import TextMessageContent
+    from linebot.v3.webhooks.models.things_content import ThingsContent
+    from linebot.v3.webhooks.models.things_event import ThingsEvent
+    from linebot.v3.webhooks.models.unfollow_event import UnfollowEvent
+    from linebot.v3.webhooks.models.unlink_things_content import UnlinkThingsContent
+    from linebot.v3.webhooks.models.unsend_detail import UnsendDetail
+    from linebot.v3.webhooks.models.unsend_event import UnsendEvent
+    from linebot.v3.webhooks.models.user_mentionee import UserMentionee
+    from linebot.v3.webhooks.models.user_source import UserSource
+    from linebot.v3.webhooks.models.video_message_content import VideoMessageContent
+    from linebot.v3.webhooks.models.video_play_complete import VideoPlayComplete
+    from linebot.v3.webhooks.models.video_play_complete_event import VideoPlayCompleteEvent
+else:
+    __getattr__, __dir__ = _lazy_exports(__name__, globals(), {
+        'Dummy': 'linebot.v3.webhooks.api.dummy',
+        'AsyncDummy': 'linebot.v3.webhooks.api.async_dummy',
+        'ApiResponse': 'linebot.v3.webhooks.api_response',
+        'ApiClient': 'linebot.v3.webhooks.api_client',
+        'AsyncApiClient': 'linebot.v3.webhooks.async_api_client',
+        'Configuration': 'linebot.v3.webhooks.configuration',
+        'OpenApiException': 'linebot.v3.webhooks.exceptions',
+        'ApiTypeError': 'linebot.v3.webhooks.exceptions',
+        'ApiValueError': 'linebot.v3.webhooks.exceptions',
+        'ApiKeyError': 'linebot.v3.webhooks.exceptions',
+        'ApiAttributeError': 'linebot.v3.webhooks.exceptions',
+        'ApiException': 'linebot.v3.webhooks.exceptions',
+        'AccountLinkEvent': 'linebot.v3.webhooks.models.account_link_event',
+        'ActionResult': 'linebot.v3.webhooks.models.action_result',
+        'ActivatedEvent': 'linebot.v3.webhooks.models.activated_event',
+        'AllMentionee': 'linebot.v3.webhooks.models.all_mentionee',
+        'AttachedModuleContent': 'linebot.v3.webhooks.models.attached_module_content',
+        'AudioMessageContent': 'linebot.v3.webhooks.models.audio_message_content',
+        'BeaconContent': 'linebot.v3.webhooks.models.beacon_content',
+        'BeaconEvent': 'linebot.v3.webhooks.models.beacon_event',
+        'BotResumedEvent': 'linebot.v3.webhooks.models.bot_resumed_event',
+        'BotSuspendedEvent': 'linebot.v3.webhooks.models.bot_suspended_event',
+        'CallbackRequest': 'linebot.v3.webhooks.models.callback_request',
+        'ChatControl': 'linebot.v3.webhooks.models.chat_control',
+        'ContentProvider': 'linebot.v3.webhooks.models.content_provider',
+        'DeactivatedEvent': 'linebot.v3.webhooks.models.deactivated_event',
+        'DeliveryContext': 'linebot.v3.webhooks.models.delivery_context',
+        'DetachedModuleContent': 'linebot.v3.webhooks.models.detached_module_content',
+        'Emoji': 'linebot.v3.webhooks.models.emoji',
+        'Event': 'linebot.v3.webhooks.models.event',
+        'EventMode': 'linebot.v3.webhooks.models.event_mode',
+        'FileMessageContent': 'linebot.v3.webhooks.models.file_message_content',
+        'FollowDetail': 'linebot.v3.webhooks.models.follow_detail',
+        'FollowEvent': 'linebot.v3.webhooks.models.follow_event',
+        'GroupSource': 'linebot.v3.webhooks.models.group_source',
+        'ImageMessageContent': 'linebot.v3.webhooks.models.image_message_content',
+        'ImageSet': 'linebot.v3.webhooks.models.image_set',
+        'JoinEvent': 'linebot.v3.webhooks.models.join_event',
+        'JoinedMembers': 'linebot.v3.webhooks.models.joined_members',
+        'LeaveEvent': 'linebot.v3.webhooks.models.leave_event',
+        'LeftMembers': 'linebot.v3.webhooks.models.left_members',
+        'LinkContent': 'linebot.v3.webhooks.models.link_content',
+        'LinkThingsContent': 'linebot.v3.webhooks.models.link_things_content',
+        'LocationMessageContent': 'linebot.v3.webhooks.models.location_message_content',
+        'MemberJoinedEvent': 'linebot.v3.webhooks.models.member_joined_event',
+        'MemberLeftEvent': 'linebot.v3.webhooks.models.member_left_event',
+        'Mention': 'linebot.v3.webhooks.models.mention',
+        'Mentionee': 'linebot.v3.webhooks.models.mentionee',
+        'MessageContent': 'linebot.v3.webhooks.models.message_content',
+        'MessageEvent': 'linebot.v3.webhooks.models.message_event',
+        'ModuleContent': 'linebot.v3.webhooks.models.module_content',
+        'ModuleEvent': 'linebot.v3.webhooks.models.module_event',
+        'PnpDelivery': 'linebot.v3.webhooks.models.pnp_delivery',
+        'PnpDeliveryCompletionEvent': 'linebot.v3.webhooks.models.pnp_delivery_completion_event',
+        'PostbackContent': 'linebot.v3.webhooks.models.postback_content',
+        'PostbackEvent': 'linebot.v3.webhooks.models.postback_event',
+        'RoomSource': 'linebot.v3.webhooks.models.room_source',
+        'ScenarioResult': 'linebot.v3.webhooks.models.scenario_result',
+        'ScenarioResultThingsContent': 'linebot.v3.webhooks.models.scenario_result_things_content',
+        'Source': 'linebot.v3.webhooks.models.source',
+        'StickerMessageContent': 'linebot.v3.webhooks.models.sticker_message_content',
+        'TextMessageContent': 'linebot.v3.webhooks.models.text_message_content',
+        'ThingsContent': 'linebot.v3.webhooks.models.things_content',
+        'ThingsEvent': 'linebot.v3.webhooks.models.things_event',
+        'UnfollowEvent': 'linebot.v3.webhooks.models.unfollow_event',
+        'UnlinkThingsContent': 'linebot.v3.webhooks.models.unlink_things_content',
+        'UnsendDetail': 'linebot.v3.webhooks.models.unsend_detail',
+        'UnsendEvent': 'linebot.v3.webhooks.models.unsend_event',
+        'UserMentionee': 'linebot.v3.webhooks.models.user_mentionee',
+        'UserSource': 'linebot.v3.webhooks.models.user_source',
+        'VideoMessageContent': 'linebot.v3.webhooks.models.video_message_content',
+        'VideoPlayComplete': 'linebot.v3.webhooks.models.video_play_complete',
+        'VideoPlayCompleteEvent': 'linebot.v3.webhooks.models.video_play_complete_event',
+    })
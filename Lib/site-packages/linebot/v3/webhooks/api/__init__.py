@@ -1,9 +1,19 @@
 # flake8: noqa
 
-# import apis into api package
-from linebot.v3.webhooks.api.dummy import Dummy
+import typing as _typing
 
+from linebot.v3.utils import lazy_exports as _lazy_exports
 
-# Async version
-from linebot.v3.webhooks.api.async_dummy import AsyncDummy
+# exports are imported on first access, see linebot.v3.utils.lazy_exports
+if _typing.TYPE_CHECKING:
+    # import apis into api package
+    from linebot.v3.webhooks.api.dummy import Dummy
 
+
+    # Async version
+    from linebot.v3.webhooks.api.async_dummy import AsyncDummy
+else:
+    __getattr__, __dir__ = _lazy_exports(__name__, globals(), {
+        'Dummy': 'linebot.v3.webhooks.api.dummy',
+        'AsyncDummy': 'linebot.v3.webhooks.api.async_dummy',
+    })
@@ -19,7 +19,9 @@ import hashlib
 import hmac
 import inspect
 import json
+import sys
 
+from .async_webhook import AsyncWebhookHandlerMixin
 from .exceptions import InvalidSignatureError
 from .models.events import (
     MessageEvent,
@@ -45,6 +47,22 @@ from .deprecations import (
     LineBotSdkDeprecatedIn30
 )
 
+EVENT_CLASSES = {
+    'message': MessageEvent,
+    'follow': FollowEvent,
+    'unfollow': UnfollowEvent,
+    'join': JoinEvent,
+    'leave': LeaveEvent,
+    'postback': PostbackEvent,
+    'beacon': BeaconEvent,
+    'accountLink': AccountLinkEvent,
+    'memberJoined': MemberJoinedEvent,
+    'memberLeft': MemberLeftEvent,
+    'things': ThingsEvent,
+    'unsend': UnsendEvent,
+    'videoPlayComplete': VideoPlayCompleteEvent,
+}
+
 if hasattr(hmac, "compare_digest"):
     def compare_digest(val1, val2):
         """compare_digest function.
@@ -94,13 +112,17 @@ class SignatureValidator(object):
     def validate(self, body, signature):
         """Check signature.
 
-        :param str body: Request body (as text)
+        :param body: Request body (as text, or the raw bytes as received)
+        :type body: str | bytes
         :param str signature: X-Line-Signature value (as text)
         :rtype: bool
         """
+        if not isinstance(body, bytes):
+            body = body.encode('utf-8')
+
         gen_signature = hmac.new(
             self.channel_secret,
-            body.encode('utf-8'),
+            body,
             hashlib.sha256
         ).digest()
 
@@ -139,9 +161,13 @@ class WebhookParser(object):
         self.signature_validator = SignatureValidator(channel_secret)
 
     def parse(self, body, signature, as_payload=False, use_raw_message=False):
-        """Parse webhook request body as text.
+        """Parse webhook request body.
+
+        The raw request body can be passed as bytes; the signature is then
+        checked over it directly, without decoding it first.
 
-        :param str body: Webhook request body (as text)
+        :param body: Webhook request body (as text or bytes)
+        :type body: str | bytes
         :param str signature: X-Line-Signature value (as text)
         :param bool as_payload: (optional) True to return WebhookPayload object.
         :rtype: list[T <= :py:class:`linebot.models.events.Event`]
@@ -154,45 +180,36 @@ class WebhookParser(object):
                 'Invalid signature. signature=' + signature)
 
         body_json = json.loads(body)
-        events = []
-        for event in body_json['events']:
-            event_type = event['type']
-            if event_type == 'message':
-                events.append(MessageEvent.new_from_json_dict(event,
-                              use_raw_message=use_raw_message))
-            elif event_type == 'follow':
-                events.append(FollowEvent.new_from_json_dict(event))
-            elif event_type == 'unfollow':
-                events.append(UnfollowEvent.new_from_json_dict(event))
-            elif event_type == 'join':
-                events.append(JoinEvent.new_from_json_dict(event))
-            elif event_type == 'leave':
-                events.append(LeaveEvent.new_from_json_dict(event))
-            elif event_type == 'postback':
-                events.append(PostbackEvent.new_from_json_dict(event))
-            elif event_type == 'beacon':
-                events.append(BeaconEvent.new_from_json_dict(event))
-            elif event_type == 'accountLink':
-                events.append(AccountLinkEvent.new_from_json_dict(event))
-            elif event_type == 'memberJoined':
-                events.append(MemberJoinedEvent.new_from_json_dict(event))
-            elif event_type == 'memberLeft':
-                events.append(MemberLeftEvent.new_from_json_dict(event))
-            elif event_type == 'things':
-                events.append(ThingsEvent.new_from_json_dict(event))
-            elif event_type == 'unsend':
-                events.append(UnsendEvent.new_from_json_dict(event))
-            elif event_type == 'videoPlayComplete':
-                events.append(VideoPlayCompleteEvent.new_from_json_dict(event))
-            else:
-                LOGGER.info('Unknown event type. type=' + event_type)
-                events.append(UnknownEvent.new_from_json_dict(event))
+        events = [self.parse_event(event, use_raw_message=use_raw_message)
+                  for event in body_json['events']]
 
         if as_payload:
             return WebhookPayload(events=events, destination=body_json.get('destination'))
         else:
             return events
 
+    def parse_event(self, event, use_raw_message=False):
+        """Build an event object from one element of the webhook ``events`` array.
+
+        The signature is not checked here; only pass events taken from a
+        body which has already been validated.
+
+        :param dict event: Event (as JSON-decoded dict)
+        :param bool use_raw_message: Using original Message key as attribute
+        :rtype: T <= :py:class:`linebot.models.events.Event`
+        :return: Event instance
+        """
+        event_type = event['type']
+        event_class = EVENT_CLASSES.get(event_type)
+        if event_class is None:
+            LOGGER.info('Unknown event type. type=' + event_type)
+            return UnknownEvent.new_from_json_dict(event)
+        elif event_class is MessageEvent:
+            return MessageEvent.new_from_json_dict(
+                event, use_raw_message=use_raw_message)
+        else:
+            return event_class.new_from_json_dict(event)
+
 
 @deprecated(reason="Use 'from linebot.v3.webhook import WebhookHandler' instead. See https://github.com/line/line-bot-sdk-python/blob/master/README.rst for more details.", version='3.0.0', category=LineBotSdkDeprecatedIn30)  # noqa: E501
 class WebhookHandler(object):
@@ -209,6 +226,10 @@ class WebhookHandler(object):
         self.parser = WebhookParser(channel_secret)
         self._handlers = {}
         self._default = None
+        # (event class, message class) -> handler, filled on first dispatch
+        self._resolved = {}
+        # handler -> number of arguments it is called with
+        self._args_counts = {}
 
     def add(self, event, message=None):
         """Add handler method.
@@ -242,6 +263,8 @@ class WebhookHandler(object):
 
         def decorator(func):
             self._default = func
+            self._args_counts[func] = self.__get_invoke_args_count(func)
+            self._resolved.clear()
             return func
 
         return decorator
@@ -249,7 +272,8 @@ class WebhookHandler(object):
     def handle(self, body, signature, use_raw_message=False):
         """Handle webhook.
 
-        :param str body: Webhook request body (as text)
+        :param body: Webhook request body (as text or bytes)
+        :type body: str | bytes
         :param str signature: X-Line-Signature value (as text)
         :param bool use_raw_message: Using original Message key as attribute
         """
@@ -257,39 +281,70 @@ class WebhookHandler(object):
                                     use_raw_message=use_raw_message)
 
         for event in payload.events:
-            func = None
-            key = None
+            func = self._find_handler(event)
+            if func is not None:
+                self._invoke_func(func, event, payload)
 
-            if isinstance(event, MessageEvent):
-                key = self.__get_handler_key(
-                    event.__class__, event.message.__class__)
-                func = self._handlers.get(key, None)
+    def _find_handler(self, event):
+        if isinstance(event, MessageEvent):
+            resolved_key = (event.__class__, event.message.__class__)
+        else:
+            resolved_key = (event.__class__, None)
 
-            if func is None:
-                key = self.__get_handler_key(event.__class__)
-                func = self._handlers.get(key, None)
+        func = self._resolved.get(resolved_key)
+        if func is None:
+            func = self._resolved[resolved_key] = self.__resolve_handler(*resolved_key)
 
-            if func is None:
-                func = self._default
+        if func is False:
+            LOGGER.info('No handler of ' + self.__get_handler_key(event.__class__)
+                        + ' and no default handler')
+            return None
 
-            if func is None:
-                LOGGER.info('No handler of ' + key + ' and no default handler')
-            else:
-                self.__invoke_func(func, event, payload)
+        return func
+
+    def __resolve_handler(self, event, message=None):
+        func = None
+        if message is not None:
+            func = self._handlers.get(self.__get_handler_key(event, message))
+
+        if func is None:
+            func = self._handlers.get(self.__get_handler_key(event))
+
+        if func is None:
+            func = self._default
+
+        # False marks "no handler" so that the miss is cached too
+        return False if func is None else func
 
     def __add_handler(self, func, event, message=None):
         key = self.__get_handler_key(event, message=message)
         self._handlers[key] = func
+        self._args_counts[func] = self.__get_invoke_args_count(func)
+        self._resolved.clear()
+
+    def _invoke_func(self, func, event, payload):
+        return func(*self._get_invoke_args(func, event, payload.destination))
+
+    def _get_invoke_args(self, func, event, destination):
+        args_count = self._args_counts.get(func)
+        if args_count is None:
+            args_count = self.__get_invoke_args_count(func)
+        if args_count == 2:
+            return (event, destination)
+        elif args_count == 1:
+            return (event,)
+        else:
+            return ()
 
     @classmethod
-    def __invoke_func(cls, func, event, payload):
+    def __get_invoke_args_count(cls, func):
         (has_varargs, args_count) = cls.__get_args_count(func)
         if has_varargs or args_count == 2:
-            func(event, payload.destination)
+            return 2
         elif args_count == 1:
-            func(event)
+            return 1
         else:
-            func()
+            return 0
 
     @staticmethod
     def __get_args_count(func):
@@ -303,6 +358,43 @@ class WebhookHandler(object):
     @staticmethod
     def __get_handler_key(event, message=None):
         if message is None:
-            return event.__name__
+            return sys.intern(event.__name__)
         else:
-            return event.__name__ + '_' + message.__name__
+            return sys.intern(event.__name__ + '_' + message.__name__)
+
+
+@deprecated(reason="Use 'from linebot.v3.webhook import AsyncWebhookHandler' instead. See https://github.com/line/line-bot-sdk-python/blob/master/README.rst for more details.", version='3.0.0', category=LineBotSdkDeprecatedIn30)  # noqa: E501
+class AsyncWebhookHandler(AsyncWebhookHandlerMixin, WebhookHandler):
+    """Webhook Handler for asyncio applications.
+
+    Coroutine functions registered with :py:meth:`add` are awaited and
+    plain functions are run in an executor, so a slow handler does not
+    block the event loop. The events of one webhook body are dispatched
+    concurrently.
+    """
+
+    def __init__(self, channel_secret, executor=None):
+        """__init__ method.
+
+        :param str channel_secret: Channel secret (as text)
+        :param executor: (optional) Executor used to run non-coroutine
+            handlers. Default is the event loop's default executor.
+        :type executor: :py:class:`concurrent.futures.Executor`
+        """
+        super(AsyncWebhookHandler, self).__init__(channel_secret)
+        self.executor = executor
+
+    async def handle(self, body, signature, use_raw_message=False):
+        """Handle webhook.
+
+        If a handler raises, the first exception is propagated once every
+        event of the body has been dispatched.
+
+        :param body: Webhook request body (as text or bytes)
+        :type body: str | bytes
+        :param str signature: X-Line-Signature value (as text)
+        :param bool use_raw_message: Using original Message key as attribute
+        """
+        payload = self.parser.parse(body, signature, as_payload=True,
+                                    use_raw_message=use_raw_message)
+        await self._dispatch_payload(payload)
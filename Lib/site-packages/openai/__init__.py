@@ -3,37 +3,65 @@
 from __future__ import annotations
 
 import os as _os
-from typing_extensions import override
+import typing as _t
+import typing_extensions as _te
+
+import httpx as _httpx
 
-from . import types
-from ._types import NOT_GIVEN, Omit, NoneType, NotGiven, Transport, ProxiesTypes
-from ._utils import file_from_path
-from ._client import Client, OpenAI, Stream, Timeout, Transport, AsyncClient, AsyncOpenAI, AsyncStream, RequestOptions
-from ._models import BaseModel
+from ._lazy import lazy_exports as _lazy_exports
 from ._version import __title__, __version__
-from ._response import APIResponse as APIResponse, AsyncAPIResponse as AsyncAPIResponse
 from ._constants import DEFAULT_TIMEOUT, DEFAULT_MAX_RETRIES, DEFAULT_CONNECTION_LIMITS
-from ._exceptions import (
-    APIError,
-    OpenAIError,
-    ConflictError,
-    NotFoundError,
-    APIStatusError,
-    RateLimitError,
-    APITimeoutError,
-    BadRequestError,
-    APIConnectionError,
-    AuthenticationError,
-    InternalServerError,
-    PermissionDeniedError,
-    LengthFinishReasonError,
-    UnprocessableEntityError,
-    APIResponseValidationError,
-    ContentFilterFinishReasonError,
-)
-from ._base_client import DefaultHttpxClient, DefaultAsyncHttpxClient
-from ._utils._logs import setup_logging as _setup_logging
-from ._legacy_response import HttpxBinaryResponseContent as HttpxBinaryResponseContent
+
+if _t.TYPE_CHECKING:
+    from . import types
+    from ._types import NOT_GIVEN, Omit, NoneType, NotGiven, Transport, ProxiesTypes
+    from ._utils import file_from_path
+    from ._client import Client, OpenAI, Stream, Timeout, Transport, AsyncClient, AsyncOpenAI, AsyncStream, RequestOptions
+    from ._models import BaseModel
+    from ._response import APIResponse as APIResponse, AsyncAPIResponse as AsyncAPIResponse
+    from ._exceptions import (
+        APIError,
+        OpenAIError,
+        ConflictError,
+        NotFoundError,
+        APIStatusError,
+        RateLimitError,
+        APITimeoutError,
+        BadRequestError,
+        APIConnectionError,
+        AuthenticationError,
+        InternalServerError,
+        PermissionDeniedError,
+        LengthFinishReasonError,
+        UnprocessableEntityError,
+        APIResponseValidationError,
+        ContentFilterFinishReasonError,
+    )
+    from ._base_client import DefaultHttpxClient, DefaultAsyncHttpxClient
+    from ._legacy_response import HttpxBinaryResponseContent as HttpxBinaryResponseContent
+
+    from .lib import azure as _azure, pydantic_function_tool as pydantic_function_tool
+    from .version import VERSION as VERSION
+    from .lib.azure import AzureOpenAI as AzureOpenAI, AsyncAzureOpenAI as AsyncAzureOpenAI
+    from .lib._old_api import *
+    from .lib.streaming import (
+        AssistantEventHandler as AssistantEventHandler,
+        AsyncAssistantEventHandler as AsyncAssistantEventHandler,
+    )
+
+    from ._module_client import (
+        beta as beta,
+        chat as chat,
+        audio as audio,
+        files as files,
+        images as images,
+        models as models,
+        batches as batches,
+        embeddings as embeddings,
+        completions as completions,
+        fine_tuning as fine_tuning,
+        moderations as moderations,
+    )
 
 __all__ = [
     "types",
@@ -78,38 +106,110 @@ __all__ = [
     "DefaultAsyncHttpxClient",
 ]
 
-from .lib import azure as _azure, pydantic_function_tool as pydantic_function_tool
-from .version import VERSION as VERSION
-from .lib.azure import AzureOpenAI as AzureOpenAI, AsyncAzureOpenAI as AsyncAzureOpenAI
-from .lib._old_api import *
-from .lib.streaming import (
-    AssistantEventHandler as AssistantEventHandler,
-    AsyncAssistantEventHandler as AsyncAssistantEventHandler,
-)
-
-_setup_logging()
-
-# Update the __module__ attribute for exported symbols so that
-# error messages point to this module instead of the module
-# it was originally defined in, e.g.
-# openai._exceptions.NotFoundError -> openai.NotFoundError
-__locals = locals()
-for __name in __all__:
-    if not __name.startswith("__"):
+
+def _set_public_module(name: str, value: object) -> None:
+    # Update the __module__ attribute for exported symbols so that
+    # error messages point to this module instead of the module
+    # it was originally defined in, e.g.
+    # openai._exceptions.NotFoundError -> openai.NotFoundError
+    if name in __all__:
         try:
-            __locals[__name].__module__ = "openai"
+            value.__module__ = "openai"  # type: ignore[attr-defined]
         except (TypeError, AttributeError):
             # Some of our exported symbols are builtins which we can't set attributes for.
             pass
 
-# ------ Module level client ------
-import typing as _t
-import typing_extensions as _te
 
-import httpx as _httpx
+# Everything except the module level configuration below is imported on first
+# attribute access, so `import openai` does not load pydantic or `openai.types`.
+if not _t.TYPE_CHECKING:
+    __getattr__, __dir__ = _lazy_exports(
+        __name__,
+        globals(),
+        {
+            "types": (".types", None),
+            "NOT_GIVEN": ("._types", "NOT_GIVEN"),
+            "Omit": ("._types", "Omit"),
+            "NoneType": ("._types", "NoneType"),
+            "NotGiven": ("._types", "NotGiven"),
+            "Transport": ("._types", "Transport"),
+            "ProxiesTypes": ("._types", "ProxiesTypes"),
+            "file_from_path": ("._utils", "file_from_path"),
+            "Client": ("._client", "Client"),
+            "OpenAI": ("._client", "OpenAI"),
+            "Stream": ("._client", "Stream"),
+            "Timeout": ("._client", "Timeout"),
+            "AsyncClient": ("._client", "AsyncClient"),
+            "AsyncOpenAI": ("._client", "AsyncOpenAI"),
+            "AsyncStream": ("._client", "AsyncStream"),
+            "RequestOptions": ("._client", "RequestOptions"),
+            "BaseModel": ("._models", "BaseModel"),
+            "APIResponse": ("._response", "APIResponse"),
+            "AsyncAPIResponse": ("._response", "AsyncAPIResponse"),
+            "APIError": ("._exceptions", "APIError"),
+            "OpenAIError": ("._exceptions", "OpenAIError"),
+            "ConflictError": ("._exceptions", "ConflictError"),
+            "NotFoundError": ("._exceptions", "NotFoundError"),
+            "APIStatusError": ("._exceptions", "APIStatusError"),
+            "RateLimitError": ("._exceptions", "RateLimitError"),
+            "APITimeoutError": ("._exceptions", "APITimeoutError"),
+            "BadRequestError": ("._exceptions", "BadRequestError"),
+            "APIConnectionError": ("._exceptions", "APIConnectionError"),
+            "AuthenticationError": ("._exceptions", "AuthenticationError"),
+            "InternalServerError": ("._exceptions", "InternalServerError"),
+            "PermissionDeniedError": ("._exceptions", "PermissionDeniedError"),
+            "LengthFinishReasonError": ("._exceptions", "LengthFinishReasonError"),
+            "UnprocessableEntityError": ("._exceptions", "UnprocessableEntityError"),
+            "APIResponseValidationError": ("._exceptions", "APIResponseValidationError"),
+            "ContentFilterFinishReasonError": ("._exceptions", "ContentFilterFinishReasonError"),
+            "DefaultHttpxClient": ("._base_client", "DefaultHttpxClient"),
+            "DefaultAsyncHttpxClient": ("._base_client", "DefaultAsyncHttpxClient"),
+            "HttpxBinaryResponseContent": ("._legacy_response", "HttpxBinaryResponseContent"),
+            "pydantic_function_tool": (".lib", "pydantic_function_tool"),
+            "VERSION": (".version", "VERSION"),
+            "AzureOpenAI": (".lib.azure", "AzureOpenAI"),
+            "AsyncAzureOpenAI": (".lib.azure", "AsyncAzureOpenAI"),
+            "Edit": (".lib._old_api", "Edit"),
+            "File": (".lib._old_api", "File"),
+            "Audio": (".lib._old_api", "Audio"),
+            "Image": (".lib._old_api", "Image"),
+            "Model": (".lib._old_api", "Model"),
+            "Engine": (".lib._old_api", "Engine"),
+            "Customer": (".lib._old_api", "Customer"),
+            "FineTune": (".lib._old_api", "FineTune"),
+            "Embedding": (".lib._old_api", "Embedding"),
+            "Completion": (".lib._old_api", "Completion"),
+            "Deployment": (".lib._old_api", "Deployment"),
+            "Moderation": (".lib._old_api", "Moderation"),
+            "ErrorObject": (".lib._old_api", "ErrorObject"),
+            "FineTuningJob": (".lib._old_api", "FineTuningJob"),
+            "ChatCompletion": (".lib._old_api", "ChatCompletion"),
+            "AssistantEventHandler": (".lib.streaming", "AssistantEventHandler"),
+            "AsyncAssistantEventHandler": (".lib.streaming", "AsyncAssistantEventHandler"),
+            "beta": ("._module_client", "beta"),
+            "chat": ("._module_client", "chat"),
+            "audio": ("._module_client", "audio"),
+            "files": ("._module_client", "files"),
+            "images": ("._module_client", "images"),
+            "models": ("._module_client", "models"),
+            "batches": ("._module_client", "batches"),
+            "embeddings": ("._module_client", "embeddings"),
+            "completions": ("._module_client", "completions"),
+            "fine_tuning": ("._module_client", "fine_tuning"),
+            "moderations": ("._module_client", "moderations"),
+            "_ModuleClient": ("._module_client", "_ModuleClient"),
+            "_AzureModuleClient": ("._module_client", "_AzureModuleClient"),
+            "_AmbiguousModuleClientUsageError": ("._module_client", "_AmbiguousModuleClientUsageError"),
+        },
+        on_load=_set_public_module,
+    )
+
+if _os.environ.get("OPENAI_LOG"):
+    from ._utils._logs import setup_logging as _setup_logging
 
-from ._base_client import DEFAULT_TIMEOUT, DEFAULT_MAX_RETRIES
+    _setup_logging()
 
+# ------ Module level client ------
 api_key: str | None = None
 
 organization: str | None = None
@@ -141,122 +241,6 @@ azure_ad_token: str | None = _os.environ.get("AZURE_OPENAI_AD_TOKEN")
 azure_ad_token_provider: _azure.AzureADTokenProvider | None = None
 
 
-class _ModuleClient(OpenAI):
-    # Note: we have to use type: ignores here as overriding class members
-    # with properties is technically unsafe but it is fine for our use case
-
-    @property  # type: ignore
-    @override
-    def api_key(self) -> str | None:
-        return api_key
-
-    @api_key.setter  # type: ignore
-    def api_key(self, value: str | None) -> None:  # type: ignore
-        global api_key
-
-        api_key = value
-
-    @property  # type: ignore
-    @override
-    def organization(self) -> str | None:
-        return organization
-
-    @organization.setter  # type: ignore
-    def organization(self, value: str | None) -> None:  # type: ignore
-        global organization
-
-        organization = value
-
-    @property  # type: ignore
-    @override
-    def project(self) -> str | None:
-        return project
-
-    @project.setter  # type: ignore
-    def project(self, value: str | None) -> None:  # type: ignore
-        global project
-
-        project = value
-
-    @property
-    @override
-    def base_url(self) -> _httpx.URL:
-        if base_url is not None:
-            return _httpx.URL(base_url)
-
-        return super().base_url
-
-    @base_url.setter
-    def base_url(self, url: _httpx.URL | str) -> None:
-        super().base_url = url  # type: ignore[misc]
-
-    @property  # type: ignore
-    @override
-    def timeout(self) -> float | Timeout | None:
-        return timeout
-
-    @timeout.setter  # type: ignore
-    def timeout(self, value: float | Timeout | None) -> None:  # type: ignore
-        global timeout
-
-        timeout = value
-
-    @property  # type: ignore
-    @override
-    def max_retries(self) -> int:
-        return max_retries
-
-    @max_retries.setter  # type: ignore
-    def max_retries(self, value: int) -> None:  # type: ignore
-        global max_retries
-
-        max_retries = value
-
-    @property  # type: ignore
-    @override
-    def _custom_headers(self) -> _t.Mapping[str, str] | None:
-        return default_headers
-
-    @_custom_headers.setter  # type: ignore
-    def _custom_headers(self, value: _t.Mapping[str, str] | None) -> None:  # type: ignore
-        global default_headers
-
-        default_headers = value
-
-    @property  # type: ignore
-    @override
-    def _custom_query(self) -> _t.Mapping[str, object] | None:
-        return default_query
-
-    @_custom_query.setter  # type: ignore
-    def _custom_query(self, value: _t.Mapping[str, object] | None) -> None:  # type: ignore
-        global default_query
-
-        default_query = value
-
-    @property  # type: ignore
-    @override
-    def _client(self) -> _httpx.Client:
-        return http_client or super()._client
-
-    @_client.setter  # type: ignore
-    def _client(self, value: _httpx.Client) -> None:  # type: ignore
-        global http_client
-
-        http_client = value
-
-
-class _AzureModuleClient(_ModuleClient, AzureOpenAI):  # type: ignore
-    ...
-
-
-class _AmbiguousModuleClientUsageError(OpenAIError):
-    def __init__(self) -> None:
-        super().__init__(
-            "Ambiguous use of module client; please set `openai.api_type` or the `OPENAI_API_TYPE` environment variable to `openai` or `azure`"
-        )
-
-
 def _has_openai_credentials() -> bool:
     return _os.environ.get("OPENAI_API_KEY") is not None
 
@@ -273,13 +257,17 @@ def _has_azure_ad_credentials() -> bool:
     )
 
 
-_client: OpenAI | None = None
+# Not named "_client": importing the openai._client submodule (which lazy
+# attribute access does at any time) sets that name on the package.
+_default_client: OpenAI | None = None
 
 
 def _load_client() -> OpenAI:  # type: ignore[reportUnusedFunction]
-    global _client
+    global _default_client
+
+    if _default_client is None:
+        from ._module_client import _ModuleClient, _AzureModuleClient, _AmbiguousModuleClientUsageError
 
-    if _client is None:
         global api_type, azure_endpoint, azure_ad_token, api_version
 
         if azure_endpoint is None:
@@ -300,7 +288,7 @@ def _load_client() -> OpenAI:  # type: ignore[reportUnusedFunction]
                 raise _AmbiguousModuleClientUsageError()
 
             if (azure_ad_token is not None or azure_ad_token_provider is not None) and _os.environ.get(
-                "AZURE_OPENAI_API_KEY"
+            "AZURE_OPENAI_API_KEY"
             ) is not None:
                 raise _AmbiguousModuleClientUsageError()
 
@@ -310,7 +298,7 @@ def _load_client() -> OpenAI:  # type: ignore[reportUnusedFunction]
                 api_type = "openai"
 
         if api_type == "azure":
-            _client = _AzureModuleClient(  # type: ignore
+            _default_client = _AzureModuleClient(  # type: ignore
                 api_version=api_version,
                 azure_endpoint=azure_endpoint,
                 api_key=api_key,
@@ -324,9 +312,9 @@ def _load_client() -> OpenAI:  # type: ignore[reportUnusedFunction]
                 default_query=default_query,
                 http_client=http_client,
             )
-            return _client
+            return _default_client
 
-        _client = _ModuleClient(
+        _default_client = _ModuleClient(
             api_key=api_key,
             organization=organization,
             project=project,
@@ -337,27 +325,15 @@ def _load_client() -> OpenAI:  # type: ignore[reportUnusedFunction]
             default_query=default_query,
             http_client=http_client,
         )
-        return _client
+        return _default_client
 
-    return _client
+    return _default_client
 
 
 def _reset_client() -> None:  # type: ignore[reportUnusedFunction]
-    global _client
-
-    _client = None
-
-
-from ._module_client import (
-    beta as beta,
-    chat as chat,
-    audio as audio,
-    files as files,
-    images as images,
-    models as models,
-    batches as batches,
-    embeddings as embeddings,
-    completions as completions,
-    fine_tuning as fine_tuning,
-    moderations as moderations,
-)
+    global _default_client
+
+    _default_client = None
+
+
+
@@ -0,0 +1,63 @@
+"""Deferred imports for package namespaces.
+
+`import openai` used to import every client, resource and model eagerly, which
+pulls in pydantic and several hundred `openai.types` modules before any of them
+is used. Packages call `lazy_exports()` instead and expose the returned
+`__getattr__` / `__dir__` at module level (PEP 562), so each name is imported
+the first time it is looked up and then cached in the module namespace.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, Dict, List, Tuple, Callable, Optional
+
+__all__ = ["lazy_exports"]
+
+
+def lazy_exports(
+    package: str,
+    namespace: Dict[str, Any],
+    attributes: Dict[str, Tuple[str, Optional[str]]],
+    *,
+    on_load: Optional[Callable[[str, Any], None]] = None,
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build module `__getattr__` and `__dir__` functions for `package`.
+
+    `attributes` maps an exported name to `(module, attribute)`, where `module`
+    is imported relative to `package` and `attribute` is looked up on it, or
+    `None` to export the module itself. Names missing from the map fall back
+    to importing the submodule of that name, so `package.submodule` keeps
+    working without an explicit import, as it did when the package imported
+    its submodules eagerly. `on_load` is called with every resolved value
+    before it is cached.
+
+    Unless the package defines `__all__` itself, it is set to the names in
+    `attributes` so that `from package import *` still exports all of them.
+    """
+    namespace.setdefault("__all__", list(attributes))
+
+    def __getattr__(name: str) -> Any:
+        target = attributes.get(name)
+        if target is None:
+            if name.startswith("__"):
+                raise AttributeError(f"module {package!r} has no attribute {name!r}")
+            try:
+                value = importlib.import_module(f"{package}.{name}")
+            except ModuleNotFoundError as err:
+                if err.name != f"{package}.{name}":
+                    raise
+                raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        else:
+            module_name, attribute = target
+            module = importlib.import_module(module_name, package)
+            value = module if attribute is None else getattr(module, attribute)
+            if on_load is not None:
+                on_load(name, value)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(attributes))
+
+    return __getattr__, __dir__
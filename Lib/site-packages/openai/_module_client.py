@@ -1,9 +1,123 @@
 # File generated from our OpenAPI spec by Stainless. See CONTRIBUTING.md for details.
 
+from __future__ import annotations
+
+import typing as _t
 from typing_extensions import override
 
+import httpx as _httpx
+
+import openai as _openai
+
 from . import resources, _load_client
 from ._utils import LazyProxy
+from ._client import OpenAI, Timeout
+from .lib.azure import AzureOpenAI
+from ._exceptions import OpenAIError
+
+# The module level client classes read and write the configuration stored on
+# the `openai` module itself, e.g. `openai.api_key = ...`.
+
+
+class _ModuleClient(OpenAI):
+    # Note: we have to use type: ignores here as overriding class members
+    # with properties is technically unsafe but it is fine for our use case
+
+    @property  # type: ignore
+    @override
+    def api_key(self) -> str | None:
+        return _openai.api_key
+
+    @api_key.setter  # type: ignore
+    def api_key(self, value: str | None) -> None:  # type: ignore
+        _openai.api_key = value
+
+    @property  # type: ignore
+    @override
+    def organization(self) -> str | None:
+        return _openai.organization
+
+    @organization.setter  # type: ignore
+    def organization(self, value: str | None) -> None:  # type: ignore
+        _openai.organization = value
+
+    @property  # type: ignore
+    @override
+    def project(self) -> str | None:
+        return _openai.project
+
+    @project.setter  # type: ignore
+    def project(self, value: str | None) -> None:  # type: ignore
+        _openai.project = value
+
+    @property
+    @override
+    def base_url(self) -> _httpx.URL:
+        if _openai.base_url is not None:
+            return _httpx.URL(_openai.base_url)
+
+        return super().base_url
+
+    @base_url.setter
+    def base_url(self, url: _httpx.URL | str) -> None:
+        super().base_url = url  # type: ignore[misc]
+
+    @property  # type: ignore
+    @override
+    def timeout(self) -> float | Timeout | None:
+        return _openai.timeout
+
+    @timeout.setter  # type: ignore
+    def timeout(self, value: float | Timeout | None) -> None:  # type: ignore
+        _openai.timeout = value
+
+    @property  # type: ignore
+    @override
+    def max_retries(self) -> int:
+        return _openai.max_retries
+
+    @max_retries.setter  # type: ignore
+    def max_retries(self, value: int) -> None:  # type: ignore
+        _openai.max_retries = value
+
+    @property  # type: ignore
+    @override
+    def _custom_headers(self) -> _t.Mapping[str, str] | None:
+        return _openai.default_headers
+
+    @_custom_headers.setter  # type: ignore
+    def _custom_headers(self, value: _t.Mapping[str, str] | None) -> None:  # type: ignore
+        _openai.default_headers = value
+
+    @property  # type: ignore
+    @override
+    def _custom_query(self) -> _t.Mapping[str, object] | None:
+        return _openai.default_query
+
+    @_custom_query.setter  # type: ignore
+    def _custom_query(self, value: _t.Mapping[str, object] | None) -> None:  # type: ignore
+        _openai.default_query = value
+
+    @property  # type: ignore
+    @override
+    def _client(self) -> _httpx.Client:
+        return _openai.http_client or super()._client
+
+    @_client.setter  # type: ignore
+    def _client(self, value: _httpx.Client) -> None:  # type: ignore
+        _openai.http_client = value
+
+
+class _AzureModuleClient(_ModuleClient, AzureOpenAI):  # type: ignore
+    ...
+
+
+class _AmbiguousModuleClientUsageError(OpenAIError):
+    def __init__(self) -> None:
+        super().__init__(
+            "Ambiguous use of module client; please set `openai.api_type` or the `OPENAI_API_TYPE` environment variable to `openai` or `azure`"
+        )
+
 
 
 class ChatProxy(LazyProxy[resources.Chat]):
@@ -2,53 +2,113 @@
 
 from __future__ import annotations
 
-from .batch import Batch as Batch
-from .image import Image as Image
-from .model import Model as Model
-from .shared import (
-    Metadata as Metadata,
-    ErrorObject as ErrorObject,
-    FunctionDefinition as FunctionDefinition,
-    FunctionParameters as FunctionParameters,
-    ResponseFormatText as ResponseFormatText,
-    ResponseFormatJSONObject as ResponseFormatJSONObject,
-    ResponseFormatJSONSchema as ResponseFormatJSONSchema,
-)
-from .upload import Upload as Upload
-from .embedding import Embedding as Embedding
-from .chat_model import ChatModel as ChatModel
-from .completion import Completion as Completion
-from .moderation import Moderation as Moderation
-from .audio_model import AudioModel as AudioModel
-from .batch_error import BatchError as BatchError
-from .file_object import FileObject as FileObject
-from .image_model import ImageModel as ImageModel
-from .file_content import FileContent as FileContent
-from .file_deleted import FileDeleted as FileDeleted
-from .file_purpose import FilePurpose as FilePurpose
-from .model_deleted import ModelDeleted as ModelDeleted
-from .embedding_model import EmbeddingModel as EmbeddingModel
-from .images_response import ImagesResponse as ImagesResponse
-from .completion_usage import CompletionUsage as CompletionUsage
-from .file_list_params import FileListParams as FileListParams
-from .moderation_model import ModerationModel as ModerationModel
-from .batch_list_params import BatchListParams as BatchListParams
-from .completion_choice import CompletionChoice as CompletionChoice
-from .image_edit_params import ImageEditParams as ImageEditParams
-from .file_create_params import FileCreateParams as FileCreateParams
-from .batch_create_params import BatchCreateParams as BatchCreateParams
-from .batch_request_counts import BatchRequestCounts as BatchRequestCounts
-from .upload_create_params import UploadCreateParams as UploadCreateParams
-from .audio_response_format import AudioResponseFormat as AudioResponseFormat
-from .image_generate_params import ImageGenerateParams as ImageGenerateParams
-from .upload_complete_params import UploadCompleteParams as UploadCompleteParams
-from .embedding_create_params import EmbeddingCreateParams as EmbeddingCreateParams
-from .completion_create_params import CompletionCreateParams as CompletionCreateParams
-from .moderation_create_params import ModerationCreateParams as ModerationCreateParams
-from .create_embedding_response import CreateEmbeddingResponse as CreateEmbeddingResponse
-from .moderation_create_response import ModerationCreateResponse as ModerationCreateResponse
-from .moderation_text_input_param import ModerationTextInputParam as ModerationTextInputParam
-from .websocket_connection_options import WebsocketConnectionOptions as WebsocketConnectionOptions
-from .image_create_variation_params import ImageCreateVariationParams as ImageCreateVariationParams
-from .moderation_image_url_input_param import ModerationImageURLInputParam as ModerationImageURLInputParam
-from .moderation_multi_modal_input_param import ModerationMultiModalInputParam as ModerationMultiModalInputParam
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+from .._lazy import lazy_exports as _lazy_exports
+
+if _TYPE_CHECKING:
+    from .batch import Batch as Batch
+    from .image import Image as Image
+    from .model import Model as Model
+    from .shared import (
+        Metadata as Metadata,
+        ErrorObject as ErrorObject,
+        FunctionDefinition as FunctionDefinition,
+        FunctionParameters as FunctionParameters,
+        ResponseFormatText as ResponseFormatText,
+        ResponseFormatJSONObject as ResponseFormatJSONObject,
+        ResponseFormatJSONSchema as ResponseFormatJSONSchema,
+    )
+    from .upload import Upload as Upload
+    from .embedding import Embedding as Embedding
+    from .chat_model import ChatModel as ChatModel
+    from .completion import Completion as Completion
+    from .moderation import Moderation as Moderation
+    from .audio_model import AudioModel as AudioModel
+    from .batch_error import BatchError as BatchError
+    from .file_object import FileObject as FileObject
+    from .image_model import ImageModel as ImageModel
+    from .file_content import FileContent as FileContent
+    from .file_deleted import FileDeleted as FileDeleted
+    from .file_purpose import FilePurpose as FilePurpose
+    from .model_deleted import ModelDeleted as ModelDeleted
+    from .embedding_model import EmbeddingModel as EmbeddingModel
+    from .images_response import ImagesResponse as ImagesResponse
+    from .completion_usage import CompletionUsage as CompletionUsage
+    from .file_list_params import FileListParams as FileListParams
+    from .moderation_model import ModerationModel as ModerationModel
+    from .batch_list_params import BatchListParams as BatchListParams
+    from .completion_choice import CompletionChoice as CompletionChoice
+    from .image_edit_params import ImageEditParams as ImageEditParams
+    from .file_create_params import FileCreateParams as FileCreateParams
+    from .batch_create_params import BatchCreateParams as BatchCreateParams
+    from .batch_request_counts import BatchRequestCounts as BatchRequestCounts
+    from .upload_create_params import UploadCreateParams as UploadCreateParams
+    from .audio_response_format import AudioResponseFormat as AudioResponseFormat
+    from .image_generate_params import ImageGenerateParams as ImageGenerateParams
+    from .upload_complete_params import UploadCompleteParams as UploadCompleteParams
+    from .embedding_create_params import EmbeddingCreateParams as EmbeddingCreateParams
+    from .completion_create_params import CompletionCreateParams as CompletionCreateParams
+    from .moderation_create_params import ModerationCreateParams as ModerationCreateParams
+    from .create_embedding_response import CreateEmbeddingResponse as CreateEmbeddingResponse
+    from .moderation_create_response import ModerationCreateResponse as ModerationCreateResponse
+    from .moderation_text_input_param import ModerationTextInputParam as ModerationTextInputParam
+    from .websocket_connection_options import WebsocketConnectionOptions as WebsocketConnectionOptions
+    from .image_create_variation_params import ImageCreateVariationParams as ImageCreateVariationParams
+    from .moderation_image_url_input_param import ModerationImageURLInputParam as ModerationImageURLInputParam
+    from .moderation_multi_modal_input_param import ModerationMultiModalInputParam as ModerationMultiModalInputParam
+else:
+    __getattr__, __dir__ = _lazy_exports(
+        __name__,
+        globals(),
+        {
+            "Batch": (".batch", "Batch"),
+            "Image": (".image", "Image"),
+            "Model": (".model", "Model"),
+            "Metadata": (".shared", "Metadata"),
+            "ErrorObject": (".shared", "ErrorObject"),
+            "FunctionDefinition": (".shared", "FunctionDefinition"),
+            "FunctionParameters": (".shared", "FunctionParameters"),
+            "ResponseFormatText": (".shared", "ResponseFormatText"),
+            "ResponseFormatJSONObject": (".shared", "ResponseFormatJSONObject"),
+            "ResponseFormatJSONSchema": (".shared", "ResponseFormatJSONSchema"),
+            "Upload": (".upload", "Upload"),
+            "Embedding": (".embedding", "Embedding"),
+            "ChatModel": (".chat_model", "ChatModel"),
+            "Completion": (".completion", "Completion"),
+            "Moderation": (".moderation", "Moderation"),
+            "AudioModel": (".audio_model", "AudioModel"),
+            "BatchError": (".batch_error", "BatchError"),
+            "FileObject": (".file_object", "FileObject"),
+            "ImageModel": (".image_model", "ImageModel"),
+            "FileContent": (".file_content", "FileContent"),
+            "FileDeleted": (".file_deleted", "FileDeleted"),
+            "FilePurpose": (".file_purpose", "FilePurpose"),
+            "ModelDeleted": (".model_deleted", "ModelDeleted"),
+            "EmbeddingModel": (".embedding_model", "EmbeddingModel"),
+            "ImagesResponse": (".images_response", "ImagesResponse"),
+            "CompletionUsage": (".completion_usage", "CompletionUsage"),
+            "FileListParams": (".file_list_params", "FileListParams"),
+            "ModerationModel": (".moderation_model", "ModerationModel"),
+            "BatchListParams": (".batch_list_params", "BatchListParams"),
+            "CompletionChoice": (".completion_choice", "CompletionChoice"),
+            "ImageEditParams": (".image_edit_params", "ImageEditParams"),
+            "FileCreateParams": (".file_create_params", "FileCreateParams"),
+            "BatchCreateParams": (".batch_create_params", "BatchCreateParams"),
+            "BatchRequestCounts": (".batch_request_counts", "BatchRequestCounts"),
+            "UploadCreateParams": (".upload_create_params", "UploadCreateParams"),
+            "AudioResponseFormat": (".audio_response_format", "AudioResponseFormat"),
+            "ImageGenerateParams": (".image_generate_params", "ImageGenerateParams"),
+            "UploadCompleteParams": (".upload_complete_params", "UploadCompleteParams"),
+            "EmbeddingCreateParams": (".embedding_create_params", "EmbeddingCreateParams"),
+            "CompletionCreateParams": (".completion_create_params", "CompletionCreateParams"),
+            "ModerationCreateParams": (".moderation_create_params", "ModerationCreateParams"),
+            "CreateEmbeddingResponse": (".create_embedding_response", "CreateEmbeddingResponse"),
+            "ModerationCreateResponse": (".moderation_create_response", "ModerationCreateResponse"),
+            "ModerationTextInputParam": (".moderation_text_input_param", "ModerationTextInputParam"),
+            "WebsocketConnectionOptions": (".websocket_connection_options", "WebsocketConnectionOptions"),
+            "ImageCreateVariationParams": (".image_create_variation_params", "ImageCreateVariationParams"),
+            "ModerationImageURLInputParam": (".moderation_image_url_input_param", "ModerationImageURLInputParam"),
+            "ModerationMultiModalInputParam": (".moderation_multi_modal_input_param", "ModerationMultiModalInputParam"),
+        },
+    )
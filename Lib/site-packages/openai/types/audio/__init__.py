@@ -2,15 +2,39 @@
 
 from __future__ import annotations
 
-from .translation import Translation as Translation
-from .speech_model import SpeechModel as SpeechModel
-from .transcription import Transcription as Transcription
-from .transcription_word import TranscriptionWord as TranscriptionWord
-from .translation_verbose import TranslationVerbose as TranslationVerbose
-from .speech_create_params import SpeechCreateParams as SpeechCreateParams
-from .transcription_segment import TranscriptionSegment as TranscriptionSegment
-from .transcription_verbose import TranscriptionVerbose as TranscriptionVerbose
-from .translation_create_params import TranslationCreateParams as TranslationCreateParams
-from .transcription_create_params import TranscriptionCreateParams as TranscriptionCreateParams
-from .translation_create_response import TranslationCreateResponse as TranslationCreateResponse
-from .transcription_create_response import TranscriptionCreateResponse as TranscriptionCreateResponse
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+from ..._lazy import lazy_exports as _lazy_exports
+
+if _TYPE_CHECKING:
+    from .translation import Translation as Translation
+    from .speech_model import SpeechModel as SpeechModel
+    from .transcription import Transcription as Transcription
+    from .transcription_word import TranscriptionWord as TranscriptionWord
+    from .translation_verbose import TranslationVerbose as TranslationVerbose
+    from .speech_create_params import SpeechCreateParams as SpeechCreateParams
+    from .transcription_segment import TranscriptionSegment as TranscriptionSegment
+    from .transcription_verbose import TranscriptionVerbose as TranscriptionVerbose
+    from .translation_create_params import TranslationCreateParams as TranslationCreateParams
+    from .transcription_create_params import TranscriptionCreateParams as TranscriptionCreateParams
+    from .translation_create_response import TranslationCreateResponse as TranslationCreateResponse
+    from .transcription_create_response import TranscriptionCreateResponse as TranscriptionCreateResponse
+else:
+    __getattr__, __dir__ = _lazy_exports(
+        __name__,
+        globals(),
+        {
+            "Translation": (".translation", "Translation"),
+            "SpeechModel": (".speech_model", "SpeechModel"),
+            "Transcription": (".transcription", "Transcription"),
+            "TranscriptionWord": (".transcription_word", "TranscriptionWord"),
+            "TranslationVerbose": (".translation_verbose", "TranslationVerbose"),
+            "SpeechCreateParams": (".speech_create_params", "SpeechCreateParams"),
+            "TranscriptionSegment": (".transcription_segment", "TranscriptionSegment"),
+            "TranscriptionVerbose": (".transcription_verbose", "TranscriptionVerbose"),
+            "TranslationCreateParams": (".translation_create_params", "TranslationCreateParams"),
+            "TranscriptionCreateParams": (".transcription_create_params", "TranscriptionCreateParams"),
+            "TranslationCreateResponse": (".translation_create_response", "TranslationCreateResponse"),
+            "TranscriptionCreateResponse": (".transcription_create_response", "TranscriptionCreateResponse"),
+        },
+    )
@@ -2,47 +2,99 @@
 
 from __future__ import annotations
 
-from .thread import Thread as Thread
-from .assistant import Assistant as Assistant
-from .vector_store import VectorStore as VectorStore
-from .function_tool import FunctionTool as FunctionTool
-from .assistant_tool import AssistantTool as AssistantTool
-from .thread_deleted import ThreadDeleted as ThreadDeleted
-from .file_search_tool import FileSearchTool as FileSearchTool
-from .assistant_deleted import AssistantDeleted as AssistantDeleted
-from .function_tool_param import FunctionToolParam as FunctionToolParam
-from .assistant_tool_param import AssistantToolParam as AssistantToolParam
-from .thread_create_params import ThreadCreateParams as ThreadCreateParams
-from .thread_update_params import ThreadUpdateParams as ThreadUpdateParams
-from .vector_store_deleted import VectorStoreDeleted as VectorStoreDeleted
-from .assistant_list_params import AssistantListParams as AssistantListParams
-from .assistant_tool_choice import AssistantToolChoice as AssistantToolChoice
-from .code_interpreter_tool import CodeInterpreterTool as CodeInterpreterTool
-from .assistant_stream_event import AssistantStreamEvent as AssistantStreamEvent
-from .file_chunking_strategy import FileChunkingStrategy as FileChunkingStrategy
-from .file_search_tool_param import FileSearchToolParam as FileSearchToolParam
-from .assistant_create_params import AssistantCreateParams as AssistantCreateParams
-from .assistant_update_params import AssistantUpdateParams as AssistantUpdateParams
-from .vector_store_list_params import VectorStoreListParams as VectorStoreListParams
-from .vector_store_create_params import VectorStoreCreateParams as VectorStoreCreateParams
-from .vector_store_update_params import VectorStoreUpdateParams as VectorStoreUpdateParams
-from .assistant_tool_choice_param import AssistantToolChoiceParam as AssistantToolChoiceParam
-from .code_interpreter_tool_param import CodeInterpreterToolParam as CodeInterpreterToolParam
-from .assistant_tool_choice_option import AssistantToolChoiceOption as AssistantToolChoiceOption
-from .file_chunking_strategy_param import FileChunkingStrategyParam as FileChunkingStrategyParam
-from .thread_create_and_run_params import ThreadCreateAndRunParams as ThreadCreateAndRunParams
-from .static_file_chunking_strategy import StaticFileChunkingStrategy as StaticFileChunkingStrategy
-from .assistant_tool_choice_function import AssistantToolChoiceFunction as AssistantToolChoiceFunction
-from .assistant_response_format_option import AssistantResponseFormatOption as AssistantResponseFormatOption
-from .auto_file_chunking_strategy_param import AutoFileChunkingStrategyParam as AutoFileChunkingStrategyParam
-from .assistant_tool_choice_option_param import AssistantToolChoiceOptionParam as AssistantToolChoiceOptionParam
-from .other_file_chunking_strategy_object import OtherFileChunkingStrategyObject as OtherFileChunkingStrategyObject
-from .static_file_chunking_strategy_param import StaticFileChunkingStrategyParam as StaticFileChunkingStrategyParam
-from .assistant_tool_choice_function_param import AssistantToolChoiceFunctionParam as AssistantToolChoiceFunctionParam
-from .static_file_chunking_strategy_object import StaticFileChunkingStrategyObject as StaticFileChunkingStrategyObject
-from .assistant_response_format_option_param import (
-    AssistantResponseFormatOptionParam as AssistantResponseFormatOptionParam,
-)
-from .static_file_chunking_strategy_object_param import (
-    StaticFileChunkingStrategyObjectParam as StaticFileChunkingStrategyObjectParam,
-)
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+from ..._lazy import lazy_exports as _lazy_exports
+
+if _TYPE_CHECKING:
+    from .thread import Thread as Thread
+    from .assistant import Assistant as Assistant
+    from .vector_store import VectorStore as VectorStore
+    from .function_tool import FunctionTool as FunctionTool
+    from .assistant_tool import AssistantTool as AssistantTool
+    from .thread_deleted import ThreadDeleted as ThreadDeleted
+    from .file_search_tool import FileSearchTool as FileSearchTool
+    from .assistant_deleted import AssistantDeleted as AssistantDeleted
+    from .function_tool_param import FunctionToolParam as FunctionToolParam
+    from .assistant_tool_param import AssistantToolParam as AssistantToolParam
+    from .thread_create_params import ThreadCreateParams as ThreadCreateParams
+    from .thread_update_params import ThreadUpdateParams as ThreadUpdateParams
+    from .vector_store_deleted import VectorStoreDeleted as VectorStoreDeleted
+    from .assistant_list_params import AssistantListParams as AssistantListParams
+    from .assistant_tool_choice import AssistantToolChoice as AssistantToolChoice
+    from .code_interpreter_tool import CodeInterpreterTool as CodeInterpreterTool
+    from .assistant_stream_event import AssistantStreamEvent as AssistantStreamEvent
+    from .file_chunking_strategy import FileChunkingStrategy as FileChunkingStrategy
+    from .file_search_tool_param import FileSearchToolParam as FileSearchToolParam
+    from .assistant_create_params import AssistantCreateParams as AssistantCreateParams
+    from .assistant_update_params import AssistantUpdateParams as AssistantUpdateParams
+    from .vector_store_list_params import VectorStoreListParams as VectorStoreListParams
+    from .vector_store_create_params import VectorStoreCreateParams as VectorStoreCreateParams
+    from .vector_store_update_params import VectorStoreUpdateParams as VectorStoreUpdateParams
+    from .assistant_tool_choice_param import AssistantToolChoiceParam as AssistantToolChoiceParam
+    from .code_interpreter_tool_param import CodeInterpreterToolParam as CodeInterpreterToolParam
+    from .assistant_tool_choice_option import AssistantToolChoiceOption as AssistantToolChoiceOption
+    from .file_chunking_strategy_param import FileChunkingStrategyParam as FileChunkingStrategyParam
+    from .thread_create_and_run_params import ThreadCreateAndRunParams as ThreadCreateAndRunParams
+    from .static_file_chunking_strategy import StaticFileChunkingStrategy as StaticFileChunkingStrategy
+    from .assistant_tool_choice_function import AssistantToolChoiceFunction as AssistantToolChoiceFunction
+    from .assistant_response_format_option import AssistantResponseFormatOption as AssistantResponseFormatOption
+    from .auto_file_chunking_strategy_param import AutoFileChunkingStrategyParam as AutoFileChunkingStrategyParam
+    from .assistant_tool_choice_option_param import AssistantToolChoiceOptionParam as AssistantToolChoiceOptionParam
+    from .other_file_chunking_strategy_object import OtherFileChunkingStrategyObject as OtherFileChunkingStrategyObject
+    from .static_file_chunking_strategy_param import StaticFileChunkingStrategyParam as StaticFileChunkingStrategyParam
+    from .assistant_tool_choice_function_param import AssistantToolChoiceFunctionParam as AssistantToolChoiceFunctionParam
+    from .static_file_chunking_strategy_object import StaticFileChunkingStrategyObject as StaticFileChunkingStrategyObject
+    from .assistant_response_format_option_param import (
+        AssistantResponseFormatOptionParam as AssistantResponseFormatOptionParam,
+    )
+    from .static_file_chunking_strategy_object_param import (
+        StaticFileChunkingStrategyObjectParam as StaticFileChunkingStrategyObjectParam,
+    )
+else:
+    __getattr__, __dir__ = _lazy_exports(
+        __name__,
+        globals(),
+        {
+            "Thread": (".thread", "Thread"),
+            "Assistant": (".assistant", "Assistant"),
+            "VectorStore": (".vector_store", "VectorStore"),
+            "FunctionTool": (".function_tool", "FunctionTool"),
+            "AssistantTool": (".assistant_tool", "AssistantTool"),
+            "ThreadDeleted": (".thread_deleted", "ThreadDeleted"),
+            "FileSearchTool": (".file_search_tool", "FileSearchTool"),
+            "AssistantDeleted": (".assistant_deleted", "AssistantDeleted"),
+            "FunctionToolParam": (".function_tool_param", "FunctionToolParam"),
+            "AssistantToolParam": (".assistant_tool_param", "AssistantToolParam"),
+            "ThreadCreateParams": (".thread_create_params", "ThreadCreateParams"),
+            "ThreadUpdateParams": (".thread_update_params", "ThreadUpdateParams"),
+            "VectorStoreDeleted": (".vector_store_deleted", "VectorStoreDeleted"),
+            "AssistantListParams": (".assistant_list_params", "AssistantListParams"),
+            "AssistantToolChoice": (".assistant_tool_choice", "AssistantToolChoice"),
+            "CodeInterpreterTool": (".code_interpreter_tool", "CodeInterpreterTool"),
+            "AssistantStreamEvent": (".assistant_stream_event", "AssistantStreamEvent"),
+            "FileChunkingStrategy": (".file_chunking_strategy", "FileChunkingStrategy"),
+            "FileSearchToolParam": (".file_search_tool_param", "FileSearchToolParam"),
+            "AssistantCreateParams": (".assistant_create_params", "AssistantCreateParams"),
+            "AssistantUpdateParams": (".assistant_update_params", "AssistantUpdateParams"),
+            "VectorStoreListParams": (".vector_store_list_params", "VectorStoreListParams"),
+            "VectorStoreCreateParams": (".vector_store_create_params", "VectorStoreCreateParams"),
+            "VectorStoreUpdateParams": (".vector_store_update_params", "VectorStoreUpdateParams"),
+            "AssistantToolChoiceParam": (".assistant_tool_choice_param", "AssistantToolChoiceParam"),
+            "CodeInterpreterToolParam": (".code_interpreter_tool_param", "CodeInterpreterToolParam"),
+            "AssistantToolChoiceOption": (".assistant_tool_choice_option", "AssistantToolChoiceOption"),
+            "FileChunkingStrategyParam": (".file_chunking_strategy_param", "FileChunkingStrategyParam"),
+            "ThreadCreateAndRunParams": (".thread_create_and_run_params", "ThreadCreateAndRunParams"),
+            "StaticFileChunkingStrategy": (".static_file_chunking_strategy", "StaticFileChunkingStrategy"),
+            "AssistantToolChoiceFunction": (".assistant_tool_choice_function", "AssistantToolChoiceFunction"),
+            "AssistantResponseFormatOption": (".assistant_response_format_option", "AssistantResponseFormatOption"),
+            "AutoFileChunkingStrategyParam": (".auto_file_chunking_strategy_param", "AutoFileChunkingStrategyParam"),
+            "AssistantToolChoiceOptionParam": (".assistant_tool_choice_option_param", "AssistantToolChoiceOptionParam"),
+            "OtherFileChunkingStrategyObject": (".other_file_chunking_strategy_object", "OtherFileChunkingStrategyObject"),
+            "StaticFileChunkingStrategyParam": (".static_file_chunking_strategy_param", "StaticFileChunkingStrategyParam"),
+            "AssistantToolChoiceFunctionParam": (".assistant_tool_choice_function_param", "AssistantToolChoiceFunctionParam"),
+            "StaticFileChunkingStrategyObject": (".static_file_chunking_strategy_object", "StaticFileChunkingStrategyObject"),
+            "AssistantResponseFormatOptionParam": (".assistant_response_format_option_param", "AssistantResponseFormatOptionParam"),
+            "StaticFileChunkingStrategyObjectParam": (".static_file_chunking_strategy_object_param", "StaticFileChunkingStrategyObjectParam"),
+        },
+    )
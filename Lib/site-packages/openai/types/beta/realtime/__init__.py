@@ -2,83 +2,157 @@
 
 from __future__ import annotations
 
-from .session import Session as Session
-from .error_event import ErrorEvent as ErrorEvent
-from .conversation_item import ConversationItem as ConversationItem
-from .realtime_response import RealtimeResponse as RealtimeResponse
-from .response_done_event import ResponseDoneEvent as ResponseDoneEvent
-from .session_update_event import SessionUpdateEvent as SessionUpdateEvent
-from .realtime_client_event import RealtimeClientEvent as RealtimeClientEvent
-from .realtime_server_event import RealtimeServerEvent as RealtimeServerEvent
-from .response_cancel_event import ResponseCancelEvent as ResponseCancelEvent
-from .response_create_event import ResponseCreateEvent as ResponseCreateEvent
-from .session_create_params import SessionCreateParams as SessionCreateParams
-from .session_created_event import SessionCreatedEvent as SessionCreatedEvent
-from .session_updated_event import SessionUpdatedEvent as SessionUpdatedEvent
-from .response_created_event import ResponseCreatedEvent as ResponseCreatedEvent
-from .conversation_item_param import ConversationItemParam as ConversationItemParam
-from .realtime_connect_params import RealtimeConnectParams as RealtimeConnectParams
-from .realtime_response_usage import RealtimeResponseUsage as RealtimeResponseUsage
-from .session_create_response import SessionCreateResponse as SessionCreateResponse
-from .realtime_response_status import RealtimeResponseStatus as RealtimeResponseStatus
-from .response_text_done_event import ResponseTextDoneEvent as ResponseTextDoneEvent
-from .conversation_item_content import ConversationItemContent as ConversationItemContent
-from .rate_limits_updated_event import RateLimitsUpdatedEvent as RateLimitsUpdatedEvent
-from .response_audio_done_event import ResponseAudioDoneEvent as ResponseAudioDoneEvent
-from .response_text_delta_event import ResponseTextDeltaEvent as ResponseTextDeltaEvent
-from .conversation_created_event import ConversationCreatedEvent as ConversationCreatedEvent
-from .response_audio_delta_event import ResponseAudioDeltaEvent as ResponseAudioDeltaEvent
-from .session_update_event_param import SessionUpdateEventParam as SessionUpdateEventParam
-from .realtime_client_event_param import RealtimeClientEventParam as RealtimeClientEventParam
-from .response_cancel_event_param import ResponseCancelEventParam as ResponseCancelEventParam
-from .response_create_event_param import ResponseCreateEventParam as ResponseCreateEventParam
-from .conversation_item_create_event import ConversationItemCreateEvent as ConversationItemCreateEvent
-from .conversation_item_delete_event import ConversationItemDeleteEvent as ConversationItemDeleteEvent
-from .input_audio_buffer_clear_event import InputAudioBufferClearEvent as InputAudioBufferClearEvent
-from .conversation_item_content_param import ConversationItemContentParam as ConversationItemContentParam
-from .conversation_item_created_event import ConversationItemCreatedEvent as ConversationItemCreatedEvent
-from .conversation_item_deleted_event import ConversationItemDeletedEvent as ConversationItemDeletedEvent
-from .input_audio_buffer_append_event import InputAudioBufferAppendEvent as InputAudioBufferAppendEvent
-from .input_audio_buffer_commit_event import InputAudioBufferCommitEvent as InputAudioBufferCommitEvent
-from .response_output_item_done_event import ResponseOutputItemDoneEvent as ResponseOutputItemDoneEvent
-from .conversation_item_truncate_event import ConversationItemTruncateEvent as ConversationItemTruncateEvent
-from .conversation_item_with_reference import ConversationItemWithReference as ConversationItemWithReference
-from .input_audio_buffer_cleared_event import InputAudioBufferClearedEvent as InputAudioBufferClearedEvent
-from .response_content_part_done_event import ResponseContentPartDoneEvent as ResponseContentPartDoneEvent
-from .response_output_item_added_event import ResponseOutputItemAddedEvent as ResponseOutputItemAddedEvent
-from .conversation_item_truncated_event import ConversationItemTruncatedEvent as ConversationItemTruncatedEvent
-from .response_content_part_added_event import ResponseContentPartAddedEvent as ResponseContentPartAddedEvent
-from .input_audio_buffer_committed_event import InputAudioBufferCommittedEvent as InputAudioBufferCommittedEvent
-from .conversation_item_create_event_param import ConversationItemCreateEventParam as ConversationItemCreateEventParam
-from .conversation_item_delete_event_param import ConversationItemDeleteEventParam as ConversationItemDeleteEventParam
-from .input_audio_buffer_clear_event_param import InputAudioBufferClearEventParam as InputAudioBufferClearEventParam
-from .response_audio_transcript_done_event import ResponseAudioTranscriptDoneEvent as ResponseAudioTranscriptDoneEvent
-from .input_audio_buffer_append_event_param import InputAudioBufferAppendEventParam as InputAudioBufferAppendEventParam
-from .input_audio_buffer_commit_event_param import InputAudioBufferCommitEventParam as InputAudioBufferCommitEventParam
-from .response_audio_transcript_delta_event import (
-    ResponseAudioTranscriptDeltaEvent as ResponseAudioTranscriptDeltaEvent,
-)
-from .conversation_item_truncate_event_param import (
-    ConversationItemTruncateEventParam as ConversationItemTruncateEventParam,
-)
-from .conversation_item_with_reference_param import (
-    ConversationItemWithReferenceParam as ConversationItemWithReferenceParam,
-)
-from .input_audio_buffer_speech_started_event import (
-    InputAudioBufferSpeechStartedEvent as InputAudioBufferSpeechStartedEvent,
-)
-from .input_audio_buffer_speech_stopped_event import (
-    InputAudioBufferSpeechStoppedEvent as InputAudioBufferSpeechStoppedEvent,
-)
-from .response_function_call_arguments_done_event import (
-    ResponseFunctionCallArgumentsDoneEvent as ResponseFunctionCallArgumentsDoneEvent,
-)
-from .response_function_call_arguments_delta_event import (
-    ResponseFunctionCallArgumentsDeltaEvent as ResponseFunctionCallArgumentsDeltaEvent,
-)
-from .conversation_item_input_audio_transcription_failed_event import (
-    ConversationItemInputAudioTranscriptionFailedEvent as ConversationItemInputAudioTranscriptionFailedEvent,
-)
-from .conversation_item_input_audio_transcription_completed_event import (
-    ConversationItemInputAudioTranscriptionCompletedEvent as ConversationItemInputAudioTranscriptionCompletedEvent,
-)
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+from ...._lazy import lazy_exports as _lazy_exports
+
+if _TYPE_CHECKING:
+    from .session import Session as Session
+    from .error_event import ErrorEvent as ErrorEvent
+    from .conversation_item import ConversationItem as ConversationItem
+    from .realtime_response import RealtimeResponse as RealtimeResponse
+    from .response_done_event import ResponseDoneEvent as ResponseDoneEvent
+    from .session_update_event import SessionUpdateEvent as SessionUpdateEvent
+    from .realtime_client_event import RealtimeClientEvent as RealtimeClientEvent
+    from .realtime_server_event import RealtimeServerEvent as RealtimeServerEvent
+    from .response_cancel_event import ResponseCancelEvent as ResponseCancelEvent
+    from .response_create_event import ResponseCreateEvent as ResponseCreateEvent
+    from .session_create_params import SessionCreateParams as SessionCreateParams
+    from .session_created_event import SessionCreatedEvent as SessionCreatedEvent
+    from .session_updated_event import SessionUpdatedEvent as SessionUpdatedEvent
+    from .response_created_event import ResponseCreatedEvent as ResponseCreatedEvent
+    from .conversation_item_param import ConversationItemParam as ConversationItemParam
+    from .realtime_connect_params import RealtimeConnectParams as RealtimeConnectParams
+    from .realtime_response_usage import RealtimeResponseUsage as RealtimeResponseUsage
+    from .session_create_response import SessionCreateResponse as SessionCreateResponse
+    from .realtime_response_status import RealtimeResponseStatus as RealtimeResponseStatus
+    from .response_text_done_event import ResponseTextDoneEvent as ResponseTextDoneEvent
+    from .conversation_item_content import ConversationItemContent as ConversationItemContent
+    from .rate_limits_updated_event import RateLimitsUpdatedEvent as RateLimitsUpdatedEvent
+    from .response_audio_done_event import ResponseAudioDoneEvent as ResponseAudioDoneEvent
+    from .response_text_delta_event import ResponseTextDeltaEvent as ResponseTextDeltaEvent
+    from .conversation_created_event import ConversationCreatedEvent as ConversationCreatedEvent
+    from .response_audio_delta_event import ResponseAudioDeltaEvent as ResponseAudioDeltaEvent
+    from .session_update_event_param import SessionUpdateEventParam as SessionUpdateEventParam
+    from .realtime_client_event_param import RealtimeClientEventParam as RealtimeClientEventParam
+    from .response_cancel_event_param import ResponseCancelEventParam as ResponseCancelEventParam
+    from .response_create_event_param import ResponseCreateEventParam as ResponseCreateEventParam
+    from .conversation_item_create_event import ConversationItemCreateEvent as ConversationItemCreateEvent
+    from .conversation_item_delete_event import ConversationItemDeleteEvent as ConversationItemDeleteEvent
+    from .input_audio_buffer_clear_event import InputAudioBufferClearEvent as InputAudioBufferClearEvent
+    from .conversation_item_content_param import ConversationItemContentParam as ConversationItemContentParam
+    from .conversation_item_created_event import ConversationItemCreatedEvent as ConversationItemCreatedEvent
+    from .conversation_item_deleted_event import ConversationItemDeletedEvent as ConversationItemDeletedEvent
+    from .input_audio_buffer_append_event import InputAudioBufferAppendEvent as InputAudioBufferAppendEvent
+    from .input_audio_buffer_commit_event import InputAudioBufferCommitEvent as InputAudioBufferCommitEvent
+    from .response_output_item_done_event import ResponseOutputItemDoneEvent as ResponseOutputItemDoneEvent
+    from .conversation_item_truncate_event import ConversationItemTruncateEvent as ConversationItemTruncateEvent
+    from .conversation_item_with_reference import ConversationItemWithReference as ConversationItemWithReference
+    from .input_audio_buffer_cleared_event import InputAudioBufferClearedEvent as InputAudioBufferClearedEvent
+    from .response_content_part_done_event import ResponseContentPartDoneEvent as ResponseContentPartDoneEvent
+    from .response_output_item_added_event import ResponseOutputItemAddedEvent as ResponseOutputItemAddedEvent
+    from .conversation_item_truncated_event import ConversationItemTruncatedEvent as ConversationItemTruncatedEvent
+    from .response_content_part_added_event import ResponseContentPartAddedEvent as ResponseContentPartAddedEvent
+    from .input_audio_buffer_committed_event import InputAudioBufferCommittedEvent as InputAudioBufferCommittedEvent
+    from .conversation_item_create_event_param import ConversationItemCreateEventParam as ConversationItemCreateEventParam
+    from .conversation_item_delete_event_param import ConversationItemDeleteEventParam as ConversationItemDeleteEventParam
+    from .input_audio_buffer_clear_event_param import InputAudioBufferClearEventParam as InputAudioBufferClearEventParam
+    from .response_audio_transcript_done_event import ResponseAudioTranscriptDoneEvent as ResponseAudioTranscriptDoneEvent
+    from .input_audio_buffer_append_event_param import InputAudioBufferAppendEventParam as InputAudioBufferAppendEventParam
+    from .input_audio_buffer_commit_event_param import InputAudioBufferCommitEventParam as InputAudioBufferCommitEventParam
+    from .response_audio_transcript_delta_event import (
+        ResponseAudioTranscriptDeltaEvent as ResponseAudioTranscriptDeltaEvent,
+    )
+    from .conversation_item_truncate_event_param import (
+        ConversationItemTruncateEventParam as ConversationItemTruncateEventParam,
+    )
+    from .conversation_item_with_reference_param import (
+        ConversationItemWithReferenceParam as ConversationItemWithReferenceParam,
+    )
+    from .input_audio_buffer_speech_started_event import (
+        InputAudioBufferSpeechStartedEvent as InputAudioBufferSpeechStartedEvent,
+    )
+    from .input_audio_buffer_speech_stopped_event import (
+        InputAudioBufferSpeechStoppedEvent as InputAudioBufferSpeechStoppedEvent,
+    )
+    from .response_function_call_arguments_done_event import (
+        ResponseFunctionCallArgumentsDoneEvent as ResponseFunctionCallArgumentsDoneEvent,
+    )
+    from .response_function_call_arguments_delta_event import (
+        ResponseFunctionCallArgumentsDeltaEvent as ResponseFunctionCallArgumentsDeltaEvent,
+    )
+    from .conversation_item_input_audio_transcription_failed_event import (
+        ConversationItemInputAudioTranscriptionFailedEvent as ConversationItemInputAudioTranscriptionFailedEvent,
+    )
+    from .conversation_item_input_audio_transcription_completed_event import (
+        ConversationItemInputAudioTranscriptionCompletedEvent as ConversationItemInputAudioTranscriptionCompletedEvent,
+    )
+else:
+    __getattr__, __dir__ = _lazy_exports(
+        __name__,
+        globals(),
+        {
+            "Session": (".session", "Session"),
+            "ErrorEvent": (".error_event", "ErrorEvent"),
+            "ConversationItem": (".conversation_item", "ConversationItem"),
+            "RealtimeResponse": (".realtime_response", "RealtimeResponse"),
+            "ResponseDoneEvent": (".response_done_event", "ResponseDoneEvent"),
+            "SessionUpdateEvent": (".session_update_event", "SessionUpdateEvent"),
+            "RealtimeClientEvent": (".realtime_client_event", "RealtimeClientEvent"),
+            "RealtimeServerEvent": (".realtime_server_event", "RealtimeServerEvent"),
+            "ResponseCancelEvent": (".response_cancel_event", "ResponseCancelEvent"),
+            "ResponseCreateEvent": (".response_create_event", "ResponseCreateEvent"),
+            "SessionCreateParams": (".session_create_params", "SessionCreateParams"),
+            "SessionCreatedEvent": (".session_created_event", "SessionCreatedEvent"),
+            "SessionUpdatedEvent": (".session_updated_event", "SessionUpdatedEvent"),
+            "ResponseCreatedEvent": (".response_created_event", "ResponseCreatedEvent"),
+            "ConversationItemParam": (".conversation_item_param", "ConversationItemParam"),
+            "RealtimeConnectParams": (".realtime_connect_params", "RealtimeConnectParams"),
+            "RealtimeResponseUsage": (".realtime_response_usage", "RealtimeResponseUsage"),
+            "SessionCreateResponse": (".session_create_response", "SessionCreateResponse"),
+            "RealtimeResponseStatus": (".realtime_response_status", "RealtimeResponseStatus"),
+            "ResponseTextDoneEvent": (".response_text_done_event", "ResponseTextDoneEvent"),
+            "ConversationItemContent": (".conversation_item_content", "ConversationItemContent"),
+            "RateLimitsUpdatedEvent": (".rate_limits_updated_event", "RateLimitsUpdatedEvent"),
+            "ResponseAudioDoneEvent": (".response_audio_done_event", "ResponseAudioDoneEvent"),
+            "ResponseTextDeltaEvent": (".response_text_delta_event", "ResponseTextDeltaEvent"),
+            "ConversationCreatedEvent": (".conversation_created_event", "ConversationCreatedEvent"),
+            "ResponseAudioDeltaEvent": (".response_audio_delta_event", "ResponseAudioDeltaEvent"),
+            "SessionUpdateEventParam": (".session_update_event_param", "SessionUpdateEventParam"),
+            "RealtimeClientEventParam": (".realtime_client_event_param", "RealtimeClientEventParam"),
+            "ResponseCancelEventParam": (".response_cancel_event_param", "ResponseCancelEventParam"),
+            "ResponseCreateEventParam": (".response_create_event_param", "ResponseCreateEventParam"),
+            "ConversationItemCreateEvent": (".conversation_item_create_event", "ConversationItemCreateEvent"),
+            "ConversationItemDeleteEvent": (".conversation_item_delete_event", "ConversationItemDeleteEvent"),
+            "InputAudioBufferClearEvent": (".input_audio_buffer_clear_event", "InputAudioBufferClearEvent"),
+            "ConversationItemContentParam": (".conversation_item_content_param", "ConversationItemContentParam"),
+            "ConversationItemCreatedEvent": (".conversation_item_created_event", "ConversationItemCreatedEvent"),
+            "ConversationItemDeletedEvent": (".conversation_item_deleted_event", "ConversationItemDeletedEvent"),
+            "InputAudioBufferAppendEvent": (".input_audio_buffer_append_event", "InputAudioBufferAppendEvent"),
+            "InputAudioBufferCommitEvent": (".input_audio_buffer_commit_event", "InputAudioBufferCommitEvent"),
+            "ResponseOutputItemDoneEvent": (".response_output_item_done_event", "ResponseOutputItemDoneEvent"),
+            "ConversationItemTruncateEvent": (".conversation_item_truncate_event", "ConversationItemTruncateEvent"),
+            "ConversationItemWithReference": (".conversation_item_with_reference", "ConversationItemWithReference"),
+            "InputAudioBufferClearedEvent": (".input_audio_buffer_cleared_event", "InputAudioBufferClearedEvent"),
+            "ResponseContentPartDoneEvent": (".response_content_part_done_event", "ResponseContentPartDoneEvent"),
+            "ResponseOutputItemAddedEvent": (".response_output_item_added_event", "ResponseOutputItemAddedEvent"),
+            "ConversationItemTruncatedEvent": (".conversation_item_truncated_event", "ConversationItemTruncatedEvent"),
+            "ResponseContentPartAddedEvent": (".response_content_part_added_event", "ResponseContentPartAddedEvent"),
+            "InputAudioBufferCommittedEvent": (".input_audio_buffer_committed_event", "InputAudioBufferCommittedEvent"),
+            "ConversationItemCreateEventParam": (".conversation_item_create_event_param", "ConversationItemCreateEventParam"),
+            "ConversationItemDeleteEventParam": (".conversation_item_delete_event_param", "ConversationItemDeleteEventParam"),
+            "InputAudioBufferClearEventParam": (".input_audio_buffer_clear_event_param", "InputAudioBufferClearEventParam"),
+            "ResponseAudioTranscriptDoneEvent": (".response_audio_transcript_done_event", "ResponseAudioTranscriptDoneEvent"),
+            "InputAudioBufferAppendEventParam": (".input_audio_buffer_append_event_param", "InputAudioBufferAppendEventParam"),
+            "InputAudioBufferCommitEventParam": (".input_audio_buffer_commit_event_param", "InputAudioBufferCommitEventParam"),
+            "ResponseAudioTranscriptDeltaEvent": (".response_audio_transcript_delta_event", "ResponseAudioTranscriptDeltaEvent"),
+            "ConversationItemTruncateEventParam": (".conversation_item_truncate_event_param", "ConversationItemTruncateEventParam"),
+            "ConversationItemWithReferenceParam": (".conversation_item_with_reference_param", "ConversationItemWithReferenceParam"),
+            "InputAudioBufferSpeechStartedEvent": (".input_audio_buffer_speech_started_event", "InputAudioBufferSpeechStartedEvent"),
+            "InputAudioBufferSpeechStoppedEvent": (".input_audio_buffer_speech_stopped_event", "InputAudioBufferSpeechStoppedEvent"),
+            "ResponseFunctionCallArgumentsDoneEvent": (".response_function_call_arguments_done_event", "ResponseFunctionCallArgumentsDoneEvent"),
+            "ResponseFunctionCallArgumentsDeltaEvent": (".response_function_call_arguments_delta_event", "ResponseFunctionCallArgumentsDeltaEvent"),
+            "ConversationItemInputAudioTranscriptionFailedEvent": (".conversation_item_input_audio_transcription_failed_event", "ConversationItemInputAudioTranscriptionFailedEvent"),
+            "ConversationItemInputAudioTranscriptionCompletedEvent": (".conversation_item_input_audio_transcription_completed_event", "ConversationItemInputAudioTranscriptionCompletedEvent"),
+        },
+    )
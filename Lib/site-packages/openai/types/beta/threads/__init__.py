@@ -2,45 +2,99 @@
 
 from __future__ import annotations
 
-from .run import Run as Run
-from .text import Text as Text
-from .message import Message as Message
-from .image_url import ImageURL as ImageURL
-from .annotation import Annotation as Annotation
-from .image_file import ImageFile as ImageFile
-from .run_status import RunStatus as RunStatus
-from .text_delta import TextDelta as TextDelta
-from .message_delta import MessageDelta as MessageDelta
-from .image_url_delta import ImageURLDelta as ImageURLDelta
-from .image_url_param import ImageURLParam as ImageURLParam
-from .message_content import MessageContent as MessageContent
-from .message_deleted import MessageDeleted as MessageDeleted
-from .run_list_params import RunListParams as RunListParams
-from .annotation_delta import AnnotationDelta as AnnotationDelta
-from .image_file_delta import ImageFileDelta as ImageFileDelta
-from .image_file_param import ImageFileParam as ImageFileParam
-from .text_delta_block import TextDeltaBlock as TextDeltaBlock
-from .run_create_params import RunCreateParams as RunCreateParams
-from .run_update_params import RunUpdateParams as RunUpdateParams
-from .text_content_block import TextContentBlock as TextContentBlock
-from .message_delta_event import MessageDeltaEvent as MessageDeltaEvent
-from .message_list_params import MessageListParams as MessageListParams
-from .refusal_delta_block import RefusalDeltaBlock as RefusalDeltaBlock
-from .file_path_annotation import FilePathAnnotation as FilePathAnnotation
-from .image_url_delta_block import ImageURLDeltaBlock as ImageURLDeltaBlock
-from .message_content_delta import MessageContentDelta as MessageContentDelta
-from .message_create_params import MessageCreateParams as MessageCreateParams
-from .message_update_params import MessageUpdateParams as MessageUpdateParams
-from .refusal_content_block import RefusalContentBlock as RefusalContentBlock
-from .image_file_delta_block import ImageFileDeltaBlock as ImageFileDeltaBlock
-from .image_url_content_block import ImageURLContentBlock as ImageURLContentBlock
-from .file_citation_annotation import FileCitationAnnotation as FileCitationAnnotation
-from .image_file_content_block import ImageFileContentBlock as ImageFileContentBlock
-from .text_content_block_param import TextContentBlockParam as TextContentBlockParam
-from .file_path_delta_annotation import FilePathDeltaAnnotation as FilePathDeltaAnnotation
-from .message_content_part_param import MessageContentPartParam as MessageContentPartParam
-from .image_url_content_block_param import ImageURLContentBlockParam as ImageURLContentBlockParam
-from .file_citation_delta_annotation import FileCitationDeltaAnnotation as FileCitationDeltaAnnotation
-from .image_file_content_block_param import ImageFileContentBlockParam as ImageFileContentBlockParam
-from .run_submit_tool_outputs_params import RunSubmitToolOutputsParams as RunSubmitToolOutputsParams
-from .required_action_function_tool_call import RequiredActionFunctionToolCall as RequiredActionFunctionToolCall
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+from ...._lazy import lazy_exports as _lazy_exports
+
+if _TYPE_CHECKING:
+    from .run import Run as Run
+    from .text import Text as Text
+    from .message import Message as Message
+    from .image_url import ImageURL as ImageURL
+    from .annotation import Annotation as Annotation
+    from .image_file import ImageFile as ImageFile
+    from .run_status import RunStatus as RunStatus
+    from .text_delta import TextDelta as TextDelta
+    from .message_delta import MessageDelta as MessageDelta
+    from .image_url_delta import ImageURLDelta as ImageURLDelta
+    from .image_url_param import ImageURLParam as ImageURLParam
+    from .message_content import MessageContent as MessageContent
+    from .message_deleted import MessageDeleted as MessageDeleted
+    from .run_list_params import RunListParams as RunListParams
+    from .annotation_delta import AnnotationDelta as AnnotationDelta
+    from .image_file_delta import ImageFileDelta as ImageFileDelta
+    from .image_file_param import ImageFileParam as ImageFileParam
+    from .text_delta_block import TextDeltaBlock as TextDeltaBlock
+    from .run_create_params import RunCreateParams as RunCreateParams
+    from .run_update_params import RunUpdateParams as RunUpdateParams
+    from .text_content_block import TextContentBlock as TextContentBlock
+    from .message_delta_event import MessageDeltaEvent as MessageDeltaEvent
+    from .message_list_params import MessageListParams as MessageListParams
+    from .refusal_delta_block import RefusalDeltaBlock as RefusalDeltaBlock
+    from .file_path_annotation import FilePathAnnotation as FilePathAnnotation
+    from .image_url_delta_block import ImageURLDeltaBlock as ImageURLDeltaBlock
+    from .message_content_delta import MessageContentDelta as MessageContentDelta
+    from .message_create_params import MessageCreateParams as MessageCreateParams
+    from .message_update_params import MessageUpdateParams as MessageUpdateParams
+    from .refusal_content_block import RefusalContentBlock as RefusalContentBlock
+    from .image_file_delta_block import ImageFileDeltaBlock as ImageFileDeltaBlock
+    from .image_url_content_block import ImageURLContentBlock as ImageURLContentBlock
+    from .file_citation_annotation import FileCitationAnnotation as FileCitationAnnotation
+    from .image_file_content_block import ImageFileContentBlock as ImageFileContentBlock
+    from .text_content_block_param import TextContentBlockParam as TextContentBlockParam
+    from .file_path_delta_annotation import FilePathDeltaAnnotation as FilePathDeltaAnnotation
+    from .message_content_part_param import MessageContentPartParam as MessageContentPartParam
+    from .image_url_content_block_param import ImageURLContentBlockParam as ImageURLContentBlockParam
+    from .file_citation_delta_annotation import FileCitationDeltaAnnotation as FileCitationDeltaAnnotation
+    from .image_file_content_block_param import ImageFileContentBlockParam as ImageFileContentBlockParam
+    from .run_submit_tool_outputs_params import RunSubmitToolOutputsParams as RunSubmitToolOutputsParams
+    from .required_action_function_tool_call import RequiredActionFunctionToolCall as RequiredActionFunctionToolCall
+else:
+    __getattr__, __dir__ = _lazy_exports(
+        __name__,
+        globals(),
+        {
+            "Run": (".run", "Run"),
+            "Text": (".text", "Text"),
+            "Message": (".message", "Message"),
+            "ImageURL": (".image_url", "ImageURL"),
+            "Annotation": (".annotation", "Annotation"),
+            "ImageFile": (".image_file", "ImageFile"),
+            "RunStatus": (".run_status", "RunStatus"),
+            "TextDelta": (".text_delta", "TextDelta"),
+            "MessageDelta": (".message_delta", "MessageDelta"),
+            "ImageURLDelta": (".image_url_delta", "ImageURLDelta"),
+            "ImageURLParam": (".image_url_param", "ImageURLParam"),
+            "MessageContent": (".message_content", "MessageContent"),
+            "MessageDeleted": (".message_deleted", "MessageDeleted"),
+            "RunListParams": (".run_list_params", "RunListParams"),
+            "AnnotationDelta": (".annotation_delta", "AnnotationDelta"),
+            "ImageFileDelta": (".image_file_delta", "ImageFileDelta"),
+            "ImageFileParam": (".image_file_param", "ImageFileParam"),
+            "TextDeltaBlock": (".text_delta_block", "TextDeltaBlock"),
+            "RunCreateParams": (".run_create_params", "RunCreateParams"),
+            "RunUpdateParams": (".run_update_params", "RunUpdateParams"),
+            "TextContentBlock": (".text_content_block", "TextContentBlock"),
+            "MessageDeltaEvent": (".message_delta_event", "MessageDeltaEvent"),
+            "MessageListParams": (".message_list_params", "MessageListParams"),
+            "RefusalDeltaBlock": (".refusal_delta_block", "RefusalDeltaBlock"),
+            "FilePathAnnotation": (".file_path_annotation", "FilePathAnnotation"),
+            "ImageURLDeltaBlock": (".image_url_delta_block", "ImageURLDeltaBlock"),
+            "MessageContentDelta": (".message_content_delta", "MessageContentDelta"),
+            "MessageCreateParams": (".message_create_params", "MessageCreateParams"),
+            "MessageUpdateParams": (".message_update_params", "MessageUpdateParams"),
+            "RefusalContentBlock": (".refusal_content_block", "RefusalContentBlock"),
+            "ImageFileDeltaBlock": (".image_file_delta_block", "ImageFileDeltaBlock"),
+            "ImageURLContentBlock": (".image_url_content_block", "ImageURLContentBlock"),
+            "FileCitationAnnotation": (".file_citation_annotation", "FileCitationAnnotation"),
+            "ImageFileContentBlock": (".image_file_content_block", "ImageFileContentBlock"),
+            "TextContentBlockParam": (".text_content_block_param", "TextContentBlockParam"),
+            "FilePathDeltaAnnotation": (".file_path_delta_annotation", "FilePathDeltaAnnotation"),
+            "MessageContentPartParam": (".message_content_part_param", "MessageContentPartParam"),
+            "ImageURLContentBlockParam": (".image_url_content_block_param", "ImageURLContentBlockParam"),
+            "FileCitationDeltaAnnotation": (".file_citation_delta_annotation", "FileCitationDeltaAnnotation"),
+            "ImageFileContentBlockParam": (".image_file_content_block_param", "ImageFileContentBlockParam"),
+            "RunSubmitToolOutputsParams": (".run_submit_tool_outputs_params", "RunSubmitToolOutputsParams"),
+            "RequiredActionFunctionToolCall": (".required_action_function_tool_call", "RequiredActionFunctionToolCall"),
+        },
+    )
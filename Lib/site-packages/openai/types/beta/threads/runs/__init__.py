@@ -2,23 +2,55 @@
 
 from __future__ import annotations
 
-from .run_step import RunStep as RunStep
-from .tool_call import ToolCall as ToolCall
-from .run_step_delta import RunStepDelta as RunStepDelta
-from .tool_call_delta import ToolCallDelta as ToolCallDelta
-from .run_step_include import RunStepInclude as RunStepInclude
-from .step_list_params import StepListParams as StepListParams
-from .function_tool_call import FunctionToolCall as FunctionToolCall
-from .run_step_delta_event import RunStepDeltaEvent as RunStepDeltaEvent
-from .step_retrieve_params import StepRetrieveParams as StepRetrieveParams
-from .code_interpreter_logs import CodeInterpreterLogs as CodeInterpreterLogs
-from .file_search_tool_call import FileSearchToolCall as FileSearchToolCall
-from .tool_call_delta_object import ToolCallDeltaObject as ToolCallDeltaObject
-from .tool_calls_step_details import ToolCallsStepDetails as ToolCallsStepDetails
-from .function_tool_call_delta import FunctionToolCallDelta as FunctionToolCallDelta
-from .code_interpreter_tool_call import CodeInterpreterToolCall as CodeInterpreterToolCall
-from .file_search_tool_call_delta import FileSearchToolCallDelta as FileSearchToolCallDelta
-from .run_step_delta_message_delta import RunStepDeltaMessageDelta as RunStepDeltaMessageDelta
-from .code_interpreter_output_image import CodeInterpreterOutputImage as CodeInterpreterOutputImage
-from .message_creation_step_details import MessageCreationStepDetails as MessageCreationStepDetails
-from .code_interpreter_tool_call_delta import CodeInterpreterToolCallDelta as CodeInterpreterToolCallDelta
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+from ....._lazy import lazy_exports as _lazy_exports
+
+if _TYPE_CHECKING:
+    from .run_step import RunStep as RunStep
+    from .tool_call import ToolCall as ToolCall
+    from .run_step_delta import RunStepDelta as RunStepDelta
+    from .tool_call_delta import ToolCallDelta as ToolCallDelta
+    from .run_step_include import RunStepInclude as RunStepInclude
+    from .step_list_params import StepListParams as StepListParams
+    from .function_tool_call import FunctionToolCall as FunctionToolCall
+    from .run_step_delta_event import RunStepDeltaEvent as RunStepDeltaEvent
+    from .step_retrieve_params import StepRetrieveParams as StepRetrieveParams
+    from .code_interpreter_logs import CodeInterpreterLogs as CodeInterpreterLogs
+    from .file_search_tool_call import FileSearchToolCall as FileSearchToolCall
+    from .tool_call_delta_object import ToolCallDeltaObject as ToolCallDeltaObject
+    from .tool_calls_step_details import ToolCallsStepDetails as ToolCallsStepDetails
+    from .function_tool_call_delta import FunctionToolCallDelta as FunctionToolCallDelta
+    from .code_interpreter_tool_call import CodeInterpreterToolCall as CodeInterpreterToolCall
+    from .file_search_tool_call_delta import FileSearchToolCallDelta as FileSearchToolCallDelta
+    from .run_step_delta_message_delta import RunStepDeltaMessageDelta as RunStepDeltaMessageDelta
+    from .code_interpreter_output_image import CodeInterpreterOutputImage as CodeInterpreterOutputImage
+    from .message_creation_step_details import MessageCreationStepDetails as MessageCreationStepDetails
+    from .code_interpreter_tool_call_delta import CodeInterpreterToolCallDelta as CodeInterpreterToolCallDelta
+else:
+    __getattr__, __dir__ = _lazy_exports(
+        __name__,
+        globals(),
+        {
+            "RunStep": (".run_step", "RunStep"),
+            "ToolCall": (".tool_call", "ToolCall"),
+            "RunStepDelta": (".run_step_delta", "RunStepDelta"),
+            "ToolCallDelta": (".tool_call_delta", "ToolCallDelta"),
+            "RunStepInclude": (".run_step_include", "RunStepInclude"),
+            "StepListParams": (".step_list_params", "StepListParams"),
+            "FunctionToolCall": (".function_tool_call", "FunctionToolCall"),
+            "RunStepDeltaEvent": (".run_step_delta_event", "RunStepDeltaEvent"),
+            "StepRetrieveParams": (".step_retrieve_params", "StepRetrieveParams"),
+            "CodeInterpreterLogs": (".code_interpreter_logs", "CodeInterpreterLogs"),
+            "FileSearchToolCall": (".file_search_tool_call", "FileSearchToolCall"),
+            "ToolCallDeltaObject": (".tool_call_delta_object", "ToolCallDeltaObject"),
+            "ToolCallsStepDetails": (".tool_calls_step_details", "ToolCallsStepDetails"),
+            "FunctionToolCallDelta": (".function_tool_call_delta", "FunctionToolCallDelta"),
+            "CodeInterpreterToolCall": (".code_interpreter_tool_call", "CodeInterpreterToolCall"),
+            "FileSearchToolCallDelta": (".file_search_tool_call_delta", "FileSearchToolCallDelta"),
+            "RunStepDeltaMessageDelta": (".run_step_delta_message_delta", "RunStepDeltaMessageDelta"),
+            "CodeInterpreterOutputImage": (".code_interpreter_output_image", "CodeInterpreterOutputImage"),
+            "MessageCreationStepDetails": (".message_creation_step_details", "MessageCreationStepDetails"),
+            "CodeInterpreterToolCallDelta": (".code_interpreter_tool_call_delta", "CodeInterpreterToolCallDelta"),
+        },
+    )
@@ -2,10 +2,29 @@
 
 from __future__ import annotations
 
-from .file_list_params import FileListParams as FileListParams
-from .vector_store_file import VectorStoreFile as VectorStoreFile
-from .file_create_params import FileCreateParams as FileCreateParams
-from .vector_store_file_batch import VectorStoreFileBatch as VectorStoreFileBatch
-from .file_batch_create_params import FileBatchCreateParams as FileBatchCreateParams
-from .vector_store_file_deleted import VectorStoreFileDeleted as VectorStoreFileDeleted
-from .file_batch_list_files_params import FileBatchListFilesParams as FileBatchListFilesParams
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+from ...._lazy import lazy_exports as _lazy_exports
+
+if _TYPE_CHECKING:
+    from .file_list_params import FileListParams as FileListParams
+    from .vector_store_file import VectorStoreFile as VectorStoreFile
+    from .file_create_params import FileCreateParams as FileCreateParams
+    from .vector_store_file_batch import VectorStoreFileBatch as VectorStoreFileBatch
+    from .file_batch_create_params import FileBatchCreateParams as FileBatchCreateParams
+    from .vector_store_file_deleted import VectorStoreFileDeleted as VectorStoreFileDeleted
+    from .file_batch_list_files_params import FileBatchListFilesParams as FileBatchListFilesParams
+else:
+    __getattr__, __dir__ = _lazy_exports(
+        __name__,
+        globals(),
+        {
+            "FileListParams": (".file_list_params", "FileListParams"),
+            "VectorStoreFile": (".vector_store_file", "VectorStoreFile"),
+            "FileCreateParams": (".file_create_params", "FileCreateParams"),
+            "VectorStoreFileBatch": (".vector_store_file_batch", "VectorStoreFileBatch"),
+            "FileBatchCreateParams": (".file_batch_create_params", "FileBatchCreateParams"),
+            "VectorStoreFileDeleted": (".vector_store_file_deleted", "VectorStoreFileDeleted"),
+            "FileBatchListFilesParams": (".file_batch_list_files_params", "FileBatchListFilesParams"),
+        },
+    )
@@ -2,66 +2,113 @@
 
 from __future__ import annotations
 
-from .chat_completion import ChatCompletion as ChatCompletion
-from .chat_completion_role import ChatCompletionRole as ChatCompletionRole
-from .chat_completion_audio import ChatCompletionAudio as ChatCompletionAudio
-from .chat_completion_chunk import ChatCompletionChunk as ChatCompletionChunk
-from .parsed_chat_completion import (
-    ParsedChoice as ParsedChoice,
-    ParsedChatCompletion as ParsedChatCompletion,
-    ParsedChatCompletionMessage as ParsedChatCompletionMessage,
-)
-from .chat_completion_message import ChatCompletionMessage as ChatCompletionMessage
-from .chat_completion_modality import ChatCompletionModality as ChatCompletionModality
-from .completion_create_params import CompletionCreateParams as CompletionCreateParams
-from .parsed_function_tool_call import (
-    ParsedFunction as ParsedFunction,
-    ParsedFunctionToolCall as ParsedFunctionToolCall,
-)
-from .chat_completion_tool_param import ChatCompletionToolParam as ChatCompletionToolParam
-from .chat_completion_audio_param import ChatCompletionAudioParam as ChatCompletionAudioParam
-from .chat_completion_message_param import ChatCompletionMessageParam as ChatCompletionMessageParam
-from .chat_completion_token_logprob import ChatCompletionTokenLogprob as ChatCompletionTokenLogprob
-from .chat_completion_reasoning_effort import ChatCompletionReasoningEffort as ChatCompletionReasoningEffort
-from .chat_completion_message_tool_call import ChatCompletionMessageToolCall as ChatCompletionMessageToolCall
-from .chat_completion_content_part_param import ChatCompletionContentPartParam as ChatCompletionContentPartParam
-from .chat_completion_tool_message_param import ChatCompletionToolMessageParam as ChatCompletionToolMessageParam
-from .chat_completion_user_message_param import ChatCompletionUserMessageParam as ChatCompletionUserMessageParam
-from .chat_completion_stream_options_param import ChatCompletionStreamOptionsParam as ChatCompletionStreamOptionsParam
-from .chat_completion_system_message_param import ChatCompletionSystemMessageParam as ChatCompletionSystemMessageParam
-from .chat_completion_function_message_param import (
-    ChatCompletionFunctionMessageParam as ChatCompletionFunctionMessageParam,
-)
-from .chat_completion_assistant_message_param import (
-    ChatCompletionAssistantMessageParam as ChatCompletionAssistantMessageParam,
-)
-from .chat_completion_content_part_text_param import (
-    ChatCompletionContentPartTextParam as ChatCompletionContentPartTextParam,
-)
-from .chat_completion_developer_message_param import (
-    ChatCompletionDeveloperMessageParam as ChatCompletionDeveloperMessageParam,
-)
-from .chat_completion_message_tool_call_param import (
-    ChatCompletionMessageToolCallParam as ChatCompletionMessageToolCallParam,
-)
-from .chat_completion_named_tool_choice_param import (
-    ChatCompletionNamedToolChoiceParam as ChatCompletionNamedToolChoiceParam,
-)
-from .chat_completion_content_part_image_param import (
-    ChatCompletionContentPartImageParam as ChatCompletionContentPartImageParam,
-)
-from .chat_completion_prediction_content_param import (
-    ChatCompletionPredictionContentParam as ChatCompletionPredictionContentParam,
-)
-from .chat_completion_tool_choice_option_param import (
-    ChatCompletionToolChoiceOptionParam as ChatCompletionToolChoiceOptionParam,
-)
-from .chat_completion_content_part_refusal_param import (
-    ChatCompletionContentPartRefusalParam as ChatCompletionContentPartRefusalParam,
-)
-from .chat_completion_function_call_option_param import (
-    ChatCompletionFunctionCallOptionParam as ChatCompletionFunctionCallOptionParam,
-)
-from .chat_completion_content_part_input_audio_param import (
-    ChatCompletionContentPartInputAudioParam as ChatCompletionContentPartInputAudioParam,
-)
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+from ..._lazy import lazy_exports as _lazy_exports
+
+if _TYPE_CHECKING:
+    from .chat_completion import ChatCompletion as ChatCompletion
+    from .chat_completion_role import ChatCompletionRole as ChatCompletionRole
+    from .chat_completion_audio import ChatCompletionAudio as ChatCompletionAudio
+    from .chat_completion_chunk import ChatCompletionChunk as ChatCompletionChunk
+    from .parsed_chat_completion import (
+        ParsedChoice as ParsedChoice,
+        ParsedChatCompletion as ParsedChatCompletion,
+        ParsedChatCompletionMessage as ParsedChatCompletionMessage,
+    )
+    from .chat_completion_message import ChatCompletionMessage as ChatCompletionMessage
+    from .chat_completion_modality import ChatCompletionModality as ChatCompletionModality
+    from .completion_create_params import CompletionCreateParams as CompletionCreateParams
+    from .parsed_function_tool_call import (
+        ParsedFunction as ParsedFunction,
+        ParsedFunctionToolCall as ParsedFunctionToolCall,
+    )
+    from .chat_completion_tool_param import ChatCompletionToolParam as ChatCompletionToolParam
+    from .chat_completion_audio_param import ChatCompletionAudioParam as ChatCompletionAudioParam
+    from .chat_completion_message_param import ChatCompletionMessageParam as ChatCompletionMessageParam
+    from .chat_completion_token_logprob import ChatCompletionTokenLogprob as ChatCompletionTokenLogprob
+    from .chat_completion_reasoning_effort import ChatCompletionReasoningEffort as ChatCompletionReasoningEffort
+    from .chat_completion_message_tool_call import ChatCompletionMessageToolCall as ChatCompletionMessageToolCall
+    from .chat_completion_content_part_param import ChatCompletionContentPartParam as ChatCompletionContentPartParam
+    from .chat_completion_tool_message_param import ChatCompletionToolMessageParam as ChatCompletionToolMessageParam
+    from .chat_completion_user_message_param import ChatCompletionUserMessageParam as ChatCompletionUserMessageParam
+    from .chat_completion_stream_options_param import ChatCompletionStreamOptionsParam as ChatCompletionStreamOptionsParam
+    from .chat_completion_system_message_param import ChatCompletionSystemMessageParam as ChatCompletionSystemMessageParam
+    from .chat_completion_function_message_param import (
+        ChatCompletionFunctionMessageParam as ChatCompletionFunctionMessageParam,
+    )
+    from .chat_completion_assistant_message_param import (
+        ChatCompletionAssistantMessageParam as ChatCompletionAssistantMessageParam,
+    )
+    from .chat_completion_content_part_text_param import (
+        ChatCompletionContentPartTextParam as ChatCompletionContentPartTextParam,
+    )
+    from .chat_completion_developer_message_param import (
+        ChatCompletionDeveloperMessageParam as ChatCompletionDeveloperMessageParam,
+    )
+    from .chat_completion_message_tool_call_param import (
+        ChatCompletionMessageToolCallParam as ChatCompletionMessageToolCallParam,
+    )
+    from .chat_completion_named_tool_choice_param import (
+        ChatCompletionNamedToolChoiceParam as ChatCompletionNamedToolChoiceParam,
+    )
+    from .chat_completion_content_part_image_param import (
+        ChatCompletionContentPartImageParam as ChatCompletionContentPartImageParam,
+    )
+    from .chat_completion_prediction_content_param import (
+        ChatCompletionPredictionContentParam as ChatCompletionPredictionContentParam,
+    )
+    from .chat_completion_tool_choice_option_param import (
+        ChatCompletionToolChoiceOptionParam as ChatCompletionToolChoiceOptionParam,
+    )
+    from .chat_completion_content_part_refusal_param import (
+        ChatCompletionContentPartRefusalParam as ChatCompletionContentPartRefusalParam,
+    )
+    from .chat_completion_function_call_option_param import (
+        ChatCompletionFunctionCallOptionParam as ChatCompletionFunctionCallOptionParam,
+    )
+    from .chat_completion_content_part_input_audio_param import (
+        ChatCompletionContentPartInputAudioParam as ChatCompletionContentPartInputAudioParam,
+    )
+else:
+    __getattr__, __dir__ = _lazy_exports(
+        __name__,
+        globals(),
+        {
+            "ChatCompletion": (".chat_completion", "ChatCompletion"),
+            "ChatCompletionRole": (".chat_completion_role", "ChatCompletionRole"),
+            "ChatCompletionAudio": (".chat_completion_audio", "ChatCompletionAudio"),
+            "ChatCompletionChunk": (".chat_completion_chunk", "ChatCompletionChunk"),
+            "ParsedChoice": (".parsed_chat_completion", "ParsedChoice"),
+            "ParsedChatCompletion": (".parsed_chat_completion", "ParsedChatCompletion"),
+            "ParsedChatCompletionMessage": (".parsed_chat_completion", "ParsedChatCompletionMessage"),
+            "ChatCompletionMessage": (".chat_completion_message", "ChatCompletionMessage"),
+            "ChatCompletionModality": (".chat_completion_modality", "ChatCompletionModality"),
+            "CompletionCreateParams": (".completion_create_params", "CompletionCreateParams"),
+            "ParsedFunction": (".parsed_function_tool_call", "ParsedFunction"),
+            "ParsedFunctionToolCall": (".parsed_function_tool_call", "ParsedFunctionToolCall"),
+            "ChatCompletionToolParam": (".chat_completion_tool_param", "ChatCompletionToolParam"),
+            "ChatCompletionAudioParam": (".chat_completion_audio_param", "ChatCompletionAudioParam"),
+            "ChatCompletionMessageParam": (".chat_completion_message_param", "ChatCompletionMessageParam"),
+            "ChatCompletionTokenLogprob": (".chat_completion_token_logprob", "ChatCompletionTokenLogprob"),
+            "ChatCompletionReasoningEffort": (".chat_completion_reasoning_effort", "ChatCompletionReasoningEffort"),
+            "ChatCompletionMessageToolCall": (".chat_completion_message_tool_call", "ChatCompletionMessageToolCall"),
+            "ChatCompletionContentPartParam": (".chat_completion_content_part_param", "ChatCompletionContentPartParam"),
+            "ChatCompletionToolMessageParam": (".chat_completion_tool_message_param", "ChatCompletionToolMessageParam"),
+            "ChatCompletionUserMessageParam": (".chat_completion_user_message_param", "ChatCompletionUserMessageParam"),
+            "ChatCompletionStreamOptionsParam": (".chat_completion_stream_options_param", "ChatCompletionStreamOptionsParam"),
+            "ChatCompletionSystemMessageParam": (".chat_completion_system_message_param", "ChatCompletionSystemMessageParam"),
+            "ChatCompletionFunctionMessageParam": (".chat_completion_function_message_param", "ChatCompletionFunctionMessageParam"),
+            "ChatCompletionAssistantMessageParam": (".chat_completion_assistant_message_param", "ChatCompletionAssistantMessageParam"),
+            "ChatCompletionContentPartTextParam": (".chat_completion_content_part_text_param", "ChatCompletionContentPartTextParam"),
+            "ChatCompletionDeveloperMessageParam": (".chat_completion_developer_message_param", "ChatCompletionDeveloperMessageParam"),
+            "ChatCompletionMessageToolCallParam": (".chat_completion_message_tool_call_param", "ChatCompletionMessageToolCallParam"),
+            "ChatCompletionNamedToolChoiceParam": (".chat_completion_named_tool_choice_param", "ChatCompletionNamedToolChoiceParam"),
+            "ChatCompletionContentPartImageParam": (".chat_completion_content_part_image_param", "ChatCompletionContentPartImageParam"),
+            "ChatCompletionPredictionContentParam": (".chat_completion_prediction_content_param", "ChatCompletionPredictionContentParam"),
+            "ChatCompletionToolChoiceOptionParam": (".chat_completion_tool_choice_option_param", "ChatCompletionToolChoiceOptionParam"),
+            "ChatCompletionContentPartRefusalParam": (".chat_completion_content_part_refusal_param", "ChatCompletionContentPartRefusalParam"),
+            "ChatCompletionFunctionCallOptionParam": (".chat_completion_function_call_option_param", "ChatCompletionFunctionCallOptionParam"),
+            "ChatCompletionContentPartInputAudioParam": (".chat_completion_content_part_input_audio_param", "ChatCompletionContentPartInputAudioParam"),
+        },
+    )
@@ -2,13 +2,33 @@
 
 from __future__ import annotations
 
-from .fine_tuning_job import FineTuningJob as FineTuningJob
-from .job_list_params import JobListParams as JobListParams
-from .job_create_params import JobCreateParams as JobCreateParams
-from .fine_tuning_job_event import FineTuningJobEvent as FineTuningJobEvent
-from .job_list_events_params import JobListEventsParams as JobListEventsParams
-from .fine_tuning_job_integration import FineTuningJobIntegration as FineTuningJobIntegration
-from .fine_tuning_job_wandb_integration import FineTuningJobWandbIntegration as FineTuningJobWandbIntegration
-from .fine_tuning_job_wandb_integration_object import (
-    FineTuningJobWandbIntegrationObject as FineTuningJobWandbIntegrationObject,
-)
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+from ..._lazy import lazy_exports as _lazy_exports
+
+if _TYPE_CHECKING:
+    from .fine_tuning_job import FineTuningJob as FineTuningJob
+    from .job_list_params import JobListParams as JobListParams
+    from .job_create_params import JobCreateParams as JobCreateParams
+    from .fine_tuning_job_event import FineTuningJobEvent as FineTuningJobEvent
+    from .job_list_events_params import JobListEventsParams as JobListEventsParams
+    from .fine_tuning_job_integration import FineTuningJobIntegration as FineTuningJobIntegration
+    from .fine_tuning_job_wandb_integration import FineTuningJobWandbIntegration as FineTuningJobWandbIntegration
+    from .fine_tuning_job_wandb_integration_object import (
+        FineTuningJobWandbIntegrationObject as FineTuningJobWandbIntegrationObject,
+    )
+else:
+    __getattr__, __dir__ = _lazy_exports(
+        __name__,
+        globals(),
+        {
+            "FineTuningJob": (".fine_tuning_job", "FineTuningJob"),
+            "JobListParams": (".job_list_params", "JobListParams"),
+            "JobCreateParams": (".job_create_params", "JobCreateParams"),
+            "FineTuningJobEvent": (".fine_tuning_job_event", "FineTuningJobEvent"),
+            "JobListEventsParams": (".job_list_events_params", "JobListEventsParams"),
+            "FineTuningJobIntegration": (".fine_tuning_job_integration", "FineTuningJobIntegration"),
+            "FineTuningJobWandbIntegration": (".fine_tuning_job_wandb_integration", "FineTuningJobWandbIntegration"),
+            "FineTuningJobWandbIntegrationObject": (".fine_tuning_job_wandb_integration_object", "FineTuningJobWandbIntegrationObject"),
+        },
+    )
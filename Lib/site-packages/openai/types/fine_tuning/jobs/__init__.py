@@ -2,5 +2,19 @@
 
 from __future__ import annotations
 
-from .checkpoint_list_params import CheckpointListParams as CheckpointListParams
-from .fine_tuning_job_checkpoint import FineTuningJobCheckpoint as FineTuningJobCheckpoint
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+from ...._lazy import lazy_exports as _lazy_exports
+
+if _TYPE_CHECKING:
+    from .checkpoint_list_params import CheckpointListParams as CheckpointListParams
+    from .fine_tuning_job_checkpoint import FineTuningJobCheckpoint as FineTuningJobCheckpoint
+else:
+    __getattr__, __dir__ = _lazy_exports(
+        __name__,
+        globals(),
+        {
+            "CheckpointListParams": (".checkpoint_list_params", "CheckpointListParams"),
+            "FineTuningJobCheckpoint": (".fine_tuning_job_checkpoint", "FineTuningJobCheckpoint"),
+        },
+    )
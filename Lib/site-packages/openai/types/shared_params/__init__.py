@@ -1,8 +1,28 @@
 # File generated from our OpenAPI spec by Stainless. See CONTRIBUTING.md for details.
 
-from .metadata import Metadata as Metadata
-from .function_definition import FunctionDefinition as FunctionDefinition
-from .function_parameters import FunctionParameters as FunctionParameters
-from .response_format_text import ResponseFormatText as ResponseFormatText
-from .response_format_json_object import ResponseFormatJSONObject as ResponseFormatJSONObject
-from .response_format_json_schema import ResponseFormatJSONSchema as ResponseFormatJSONSchema
+from __future__ import annotations
+
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+from ..._lazy import lazy_exports as _lazy_exports
+
+if _TYPE_CHECKING:
+    from .metadata import Metadata as Metadata
+    from .function_definition import FunctionDefinition as FunctionDefinition
+    from .function_parameters import FunctionParameters as FunctionParameters
+    from .response_format_text import ResponseFormatText as ResponseFormatText
+    from .response_format_json_object import ResponseFormatJSONObject as ResponseFormatJSONObject
+    from .response_format_json_schema import ResponseFormatJSONSchema as ResponseFormatJSONSchema
+else:
+    __getattr__, __dir__ = _lazy_exports(
+        __name__,
+        globals(),
+        {
+            "Metadata": (".metadata", "Metadata"),
+            "FunctionDefinition": (".function_definition", "FunctionDefinition"),
+            "FunctionParameters": (".function_parameters", "FunctionParameters"),
+            "ResponseFormatText": (".response_format_text", "ResponseFormatText"),
+            "ResponseFormatJSONObject": (".response_format_json_object", "ResponseFormatJSONObject"),
+            "ResponseFormatJSONSchema": (".response_format_json_schema", "ResponseFormatJSONSchema"),
+        },
+    )
@@ -2,5 +2,19 @@
 
 from __future__ import annotations
 
-from .upload_part import UploadPart as UploadPart
-from .part_create_params import PartCreateParams as PartCreateParams
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+from ..._lazy import lazy_exports as _lazy_exports
+
+if _TYPE_CHECKING:
+    from .upload_part import UploadPart as UploadPart
+    from .part_create_params import PartCreateParams as PartCreateParams
+else:
+    __getattr__, __dir__ = _lazy_exports(
+        __name__,
+        globals(),
+        {
+            "UploadPart": (".upload_part", "UploadPart"),
+            "PartCreateParams": (".part_create_params", "PartCreateParams"),
+        },
+    )
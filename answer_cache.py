@@ -0,0 +1,198 @@
+"""Answer cache in front of Azure OpenAI.
+
+Completions run at ``temperature`` 0.0, so the same question asked against
+the same prompt files and the same retrieved documents gets the same answer.
+:class:`AnswerCache` keeps those answers in an in-process LRU and, when a
+``redis.asyncio`` client is given, in Redis so that every worker shares them.
+"""
+import hashlib
+import logging
+import os
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+# zero-width characters Thai input methods often insert between words
+_INVISIBLE = dict.fromkeys(map(ord, "\u200b\u200c\u200d\u2060\ufeff"))
+_SPACES = re.compile(r"\s+")
+# polite particles and punctuation at the end of a question do not change its meaning
+_PARTICLES = ("ครับ", "คับ", "ค่ะ", "คะ", "ค่า", "นะ", "จ้า", "จ้ะ")
+# these also end ordinary words ("ชนะ", "ตั้งค่า", "เจ้า"), so they are only
+# stripped after whitespace or another particle
+_WORD_ENDINGS = ("คับ", "คะ", "ค่า", "นะ", "จ้า", "จ้ะ")
+_PUNCTUATION = "?!.~"
+
+
+def normalize_query(text):
+    """Normalize a user question for use in a cache key."""
+    text = unicodedata.normalize("NFC", text).translate(_INVISIBLE)
+    text = _SPACES.sub(" ", text).strip().casefold()
+    return _strip_trailing(text) or text
+
+
+def _strip_trailing(text):
+    while text:
+        if text[-1] in _PUNCTUATION:
+            text = text[:-1].rstrip()
+            continue
+        particle = next((it for it in _PARTICLES if text.endswith(it)), None)
+        if particle is None:
+            break
+        rest = text[:-len(particle)]
+        if particle in _WORD_ENDINGS and rest and not rest[-1].isspace() and not rest.endswith(_PARTICLES):
+            break
+        text = rest.rstrip()
+    return text
+
+
+class PromptFiles:
+    """Prompt files loaded once and reloaded when their modification time changes."""
+
+    def __init__(self, paths, loader, check_interval=5.0):
+        """
+        :param paths: mapping of name to file path, e.g. ``{"system": "system.txt"}``
+        :param loader: function reading a path into text
+        :param check_interval: minimum seconds between ``os.stat`` checks
+        """
+        self.paths = paths
+        self.loader = loader
+        self.check_interval = check_interval
+        self.text = {}
+        self.fingerprint = ""
+        self._mtimes = None
+        self._checked = 0.0
+        self.refresh(force=True)
+
+    def refresh(self, force=False):
+        """Reload the files if any of them changed; return True when they did."""
+        now = time.monotonic()
+        if not force and now - self._checked < self.check_interval:
+            return False
+        self._checked = now
+        mtimes = tuple(_mtime(path) for path in self.paths.values())
+        if mtimes == self._mtimes:
+            return False
+        self._mtimes = mtimes
+        self.text = {name: self.loader(path) for name, path in self.paths.items()}
+        digest = hashlib.sha256()
+        for name in sorted(self.text):
+            digest.update(self.text[name].encode("utf-8"))
+            digest.update(b"\0")
+        self.fingerprint = digest.hexdigest()[:16]
+        return True
+
+
+class TTLCache:
+    """Size-bounded LRU whose entries also expire after ``ttl`` seconds."""
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key, value):
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def discard(self, key):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class AnswerCache:
+    """In-process LRU with TTL, backed by an optional Redis tier."""
+
+    def __init__(self, maxsize=1024, ttl=3600, redis=None, redis_ttl=None, prefix="linebot:answer"):
+        """
+        :param maxsize: maximum number of answers kept in process
+        :param ttl: seconds an answer stays valid in process
+        :param redis: optional ``redis.asyncio`` client for the shared tier
+        :param redis_ttl: seconds an answer stays in Redis, default ``ttl``
+        :param prefix: Redis key prefix
+        """
+        self.redis = redis
+        self.redis_ttl = redis_ttl or ttl
+        self.prefix = prefix
+        self._local = TTLCache(maxsize, ttl)
+        self.stats = {"hits": 0, "redis_hits": 0, "misses": 0, "errors": 0}
+
+    @staticmethod
+    def key(query, prompt_fingerprint, documents):
+        """Build the cache key from the question, the prompt files and the retrieved documents."""
+        digest = hashlib.sha256(normalize_query(query).encode("utf-8"))
+        digest.update(b"\0" + prompt_fingerprint.encode("ascii"))
+        for document in documents:
+            digest.update(b"\0" + document.encode("utf-8"))
+        return digest.hexdigest()
+
+    async def get(self, key):
+        value = self._local.get(key)
+        if value is not None:
+            self.stats["hits"] += 1
+            return value
+
+        if self.redis is not None:
+            try:
+                value = await self.redis.get(f"{self.prefix}:{key}")
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning("Answer cache Redis lookup failed: %s", e)
+                value = None
+            if value is not None:
+                value = value.decode("utf-8") if isinstance(value, bytes) else value
+                self._local.set(key, value)
+                self.stats["redis_hits"] += 1
+                return value
+
+        self.stats["misses"] += 1
+        return None
+
+    async def set(self, key, value):
+        self._local.set(key, value)
+        if self.redis is not None:
+            try:
+                await self.redis.set(f"{self.prefix}:{key}", value, ex=int(self.redis_ttl))
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning("Answer cache Redis store failed: %s", e)
+
+    def clear(self):
+        """Drop every in-process answer; Redis entries under the old key expire by TTL."""
+        self._local.clear()
+
+    @property
+    def evictions(self):
+        return self._local.evictions
+
+    def __len__(self):
+        return len(self._local)
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
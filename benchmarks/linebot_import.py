@@ -0,0 +1,88 @@
+"""Cold-start import benchmark for the ``linebot.v3`` API packages.
+
+Every sample runs in a fresh interpreter, so nothing is cached in
+``sys.modules``. For each scenario it reports the median and best wall time
+of the statement and how many ``linebot.v3.messaging.models`` and
+``linebot.v3.webhooks.models`` modules it left loaded. ``--importtime`` also
+prints the slowest modules from ``python -X importtime`` for the first
+scenario.
+
+Examples::
+
+    python benchmarks/linebot_import.py
+    python benchmarks/linebot_import.py --runs 30 --importtime 15
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = [
+    ("import messaging", "import linebot.v3.messaging"),
+    ("import webhooks", "import linebot.v3.webhooks"),
+    ("WebhookParser", "from linebot.v3 import WebhookParser"),
+    ("reply client", "from linebot.v3.messaging import ApiClient, Configuration, MessagingApi, "
+                     "ReplyMessageRequest, TextMessage"),
+    ("messaging models *", "from linebot.v3.messaging.models import *"),
+]
+
+PROBE = """
+import sys, time, json
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "seconds": elapsed,
+    "messaging": sum(name.startswith("linebot.v3.messaging.models.") for name in sys.modules),
+    "webhooks": sum(name.startswith("linebot.v3.webhooks.models.") for name in sys.modules),
+}}))
+"""
+
+
+def sample(statement):
+    output = subprocess.run([sys.executable, "-c", PROBE.format(statement=statement)],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def import_time(statement, top):
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            check=True, capture_output=True, text=True).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(cumulative), int(own), name.rstrip()))
+    rows.sort(reverse=True)
+    print(f"\nslowest imports for {statement!r} (microseconds)")
+    print(f"{'cumulative':>12}{'self':>10}  module")
+    for cumulative, own, name in rows[:top]:
+        print(f"{cumulative:>12}{own:>10}  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=10, help="fresh interpreters per scenario")
+    parser.add_argument("--importtime", type=int, default=0, metavar="N",
+                        help="print the N slowest imports of the first scenario")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<20}{'median ms':>11}{'best ms':>10}{'messaging':>11}{'webhooks':>10}")
+    for label, statement in SCENARIOS:
+        try:
+            samples = [sample(statement) for _ in range(args.runs)]
+        except subprocess.CalledProcessError as e:
+            print(f"{label:<20}  failed: {e.stderr.strip().splitlines()[-1]}")
+            continue
+        seconds = [s["seconds"] * 1000 for s in samples]
+        last = samples[-1]
+        print(f"{label:<20}{statistics.median(seconds):>11.1f}{min(seconds):>10.1f}"
+              f"{last['messaging']:>11}{last['webhooks']:>10}")
+    if args.importtime:
+        import_time(SCENARIOS[0][1], args.importtime)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Micro-benchmark for linebot.models serialization.
+
+Times a JSON round trip (``new_from_json_dict`` then ``as_json_dict``) of a
+``TextSendMessage`` with a ``QuickReply``, a ``QuickReply`` on its own and a
+``MessageEvent``. Each one runs through the models as they are now and through
+a reference copy of the previous implementation, which converted every key
+with the ``@deprecated`` ``linebot.utils`` helpers on every call (nested
+models are still parsed by the current code, so the gap is understated). Allocations
+are measured with ``tracemalloc`` for one round trip.
+
+Examples::
+
+    python benchmarks/linebot_models.py
+    python benchmarks/linebot_models.py --number 20000
+"""
+import argparse
+import timeit
+import tracemalloc
+import warnings
+
+from linebot import utils
+from linebot.models import (
+    MessageAction, MessageEvent, QuickReply, QuickReplyButton, TextSendMessage,
+)
+
+QUICK_REPLY = {
+    "items": [
+        {"type": "action", "action": {"type": "message", "label": f"รุ่น {n}", "text": f"สเปครุ่น {n}"}}
+        for n in range(4)
+    ],
+}
+
+TEXT_SEND_MESSAGE = {"type": "text", "text": "ข้อมูลสินค้า " * 20, "quickReply": QUICK_REPLY}
+
+MESSAGE_EVENT = {
+    "type": "message",
+    "mode": "active",
+    "timestamp": 1700000000000,
+    "webhookEventId": "01HABCDEF",
+    "deliveryContext": {"isRedelivery": False},
+    "replyToken": "0f3779fba3b349968c5d07db31eab56f",
+    "source": {"type": "user", "userId": "U4af4980629"},
+    "message": {"type": "text", "id": "444573844083572737", "quoteToken": "q3Plxr4AgKd", "text": "สอบถามสเปค"},
+}
+
+CASES = [
+    ("TextSendMessage", TextSendMessage, TEXT_SEND_MESSAGE),
+    ("QuickReply", QuickReply, QUICK_REPLY),
+    ("MessageEvent", MessageEvent, MESSAGE_EVENT),
+]
+
+
+def legacy_as_json_dict(obj):
+    """``Base.as_json_dict`` before the per-class key maps."""
+    data = {}
+    for key, value in obj.__dict__.items():
+        camel_key = utils.to_camel_case(key)
+        if isinstance(value, (list, tuple, set)):
+            data[camel_key] = list()
+            for item in value:
+                if hasattr(item, 'as_json_dict'):
+                    data[camel_key].append(legacy_as_json_dict(item))
+                else:
+                    data[camel_key].append(item)
+        elif hasattr(value, 'as_json_dict'):
+            data[camel_key] = legacy_as_json_dict(value)
+        elif value is not None:
+            data[camel_key] = value
+    return data
+
+
+def legacy_new_from_json_dict(cls, data):
+    """``Base.new_from_json_dict`` before the per-class key maps (top level only)."""
+    return cls(**{utils.to_snake_case(key): value for key, value in data.items()})
+
+
+def current_round_trip(cls, data):
+    return cls.new_from_json_dict(data).as_json_dict()
+
+
+def legacy_round_trip(cls, data):
+    return legacy_as_json_dict(legacy_new_from_json_dict(cls, data))
+
+
+def allocations(func, cls, data):
+    func(cls, data)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    func(cls, data)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    return sum(stat.count_diff for stat in stats if stat.count_diff > 0), \
+        sum(stat.size_diff for stat in stats if stat.size_diff > 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--number", type=int, default=5000, help="round trips per timing run")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs; the best one is reported")
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    # sanity check: both implementations must produce the same JSON
+    for label, cls, data in CASES:
+        assert current_round_trip(cls, data) == legacy_round_trip(cls, data), label
+    assert TextSendMessage(text="x", quick_reply=QuickReply(items=[
+        QuickReplyButton(action=MessageAction(label="a", text="b"))])).as_json_dict()
+
+    print(f"{'model':<18}{'impl':<9}{'us/round trip':>14}{'blocks':>8}{'bytes':>8}")
+    for label, cls, data in CASES:
+        for impl, func in (("legacy", legacy_round_trip), ("current", current_round_trip)):
+            best = min(timeit.repeat(lambda: func(cls, data), number=args.number, repeat=args.repeat))
+            blocks, size = allocations(func, cls, data)
+            print(f"{label:<18}{impl:<9}{best / args.number * 1e6:>14.1f}{blocks:>8}{size:>8}")
+
+
+if __name__ == "__main__":
+    main()
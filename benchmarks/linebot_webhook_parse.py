@@ -0,0 +1,99 @@
+"""Benchmark for linebot.v3 webhook parsing with and without validation.
+
+Parses signed webhook bodies with ``WebhookParser`` in its default mode
+(``Event.from_dict``, full pydantic validation) and with
+``skip_validation=True`` (``construct_model``, no validation after the
+signature check). The bodies mix text messages with mentions and emojis,
+stickers, images, postbacks and follows from user and group sources, as a
+busy group chat delivers them. A 1-event body and a 100-event body are timed.
+
+Examples::
+
+    python benchmarks/linebot_webhook_parse.py
+    python benchmarks/linebot_webhook_parse.py --number 200
+"""
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import random
+import timeit
+
+from linebot.v3.webhook import WebhookParser
+
+CHANNEL_SECRET = "benchmark-secret"
+
+
+def source(n):
+    if n % 3:
+        return {"type": "group", "groupId": "Ca56f94637c", "userId": f"U{n:032x}"}
+    return {"type": "user", "userId": f"U{n:032x}"}
+
+
+def event(n):
+    common = {
+        "timestamp": 1700000000000 + n,
+        "mode": "active",
+        "webhookEventId": f"01HBENCH{n:018d}",
+        "deliveryContext": {"isRedelivery": False},
+        "source": source(n),
+    }
+    kind = n % 6
+    if kind in (0, 1, 2):
+        message = {"type": "text", "id": str(468789577898262000 + n), "quoteToken": f"q{n}",
+                   "text": "@bot สอบถามสเปคสุขภัณฑ์รุ่น %d $" % n,
+                   "emojis": [{"index": 29, "length": 1, "productId": "5ac1bfd5040ab15980c9b435",
+                               "emojiId": "001"}],
+                   "mention": {"mentionees": [{"index": 0, "length": 4, "type": "user",
+                                               "userId": "Ubot", "isSelf": True}]}}
+        return dict(common, type="message", replyToken=f"r{n}", message=message)
+    if kind == 3:
+        message = {"type": "sticker", "id": str(n), "quoteToken": f"q{n}", "packageId": "446",
+                   "stickerId": "1988", "stickerResourceType": "STATIC", "keywords": ["ok", "thanks"]}
+        return dict(common, type="message", replyToken=f"r{n}", message=message)
+    if kind == 4:
+        message = {"type": "image", "id": str(n), "quoteToken": f"q{n}",
+                   "contentProvider": {"type": "line"},
+                   "imageSet": {"id": "E005D41A7288F41B", "index": 1, "total": 2}}
+        return dict(common, type="message", replyToken=f"r{n}", message=message)
+    if n % 2:
+        return dict(common, type="postback", replyToken=f"r{n}",
+                    postback={"data": f"action=spec&model={n}", "params": {"datetime": "2024-01-01T10:00"}})
+    return dict(common, type="follow", replyToken=f"r{n}", follow={"isUnblocked": False})
+
+
+def signed_body(count):
+    events = [event(n) for n in range(count)]
+    random.Random(count).shuffle(events)
+    body = json.dumps({"destination": "Ubenchmark", "events": events}, ensure_ascii=False).encode("utf-8")
+    signature = base64.b64encode(hmac.new(CHANNEL_SECRET.encode("utf-8"), body, hashlib.sha256).digest())
+    return body.decode("utf-8"), signature.decode("ascii")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--number", type=int, default=50, help="parses per timing run")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs; the best one is reported")
+    args = parser.parse_args()
+
+    validating = WebhookParser(CHANNEL_SECRET)
+    trusting = WebhookParser(CHANNEL_SECRET, skip_validation=True)
+
+    print(f"{'events':>6}  {'mode':<12}{'ms/body':>10}{'us/event':>10}")
+    for count in (1, 100):
+        body, signature = signed_body(count)
+        # both modes must build the same objects
+        expected = validating.parse(body, signature)
+        actual = trusting.parse(body, signature)
+        assert [e.__class__ for e in actual] == [e.__class__ for e in expected]
+        assert [e.to_dict() for e in actual] == [e.to_dict() for e in expected]
+
+        for mode, webhook_parser in (("validated", validating), ("trusted", trusting)):
+            best = min(timeit.repeat(lambda: webhook_parser.parse(body, signature),
+                                     number=args.number, repeat=args.repeat)) / args.number
+            print(f"{count:>6}  {mode:<12}{best * 1e3:>10.3f}{best / count * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
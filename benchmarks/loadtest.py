@@ -0,0 +1,299 @@
+"""Offline load test for main.py.
+
+Runs the bot against local stand-ins for the LINE Messaging API
+(``/v2/bot/message/reply``), Azure AI Search (``docs/search.post.search``)
+and Azure OpenAI (chat completions), replays signed webhook bodies at a
+target rate and reports p50/p95/p99 latency per stage. No cloud service or
+credential is needed.
+
+Stages reported:
+
+* ``ack``: webhook POST until ``/callback`` answers
+* ``search``, ``llm``, ``reply``: calls received by the stand-ins, from
+  request arrival until the response is sent
+* ``end_to_end``: webhook POST until the reply for that event reaches the
+  LINE stand-in
+
+Examples::
+
+    python benchmarks/loadtest.py --rps 50 --duration 20
+    python benchmarks/loadtest.py --rps 200 --questions 20 --llm-latency lognormal:2.0:0.5
+    python benchmarks/loadtest.py --uvicorn --workers 2
+
+Latency specs are ``const:SECONDS``, ``uniform:LOW:HIGH`` or
+``lognormal:MEDIAN:SIGMA``.
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+import httpx
+from aiohttp import web
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CHANNEL_SECRET = "loadtest-secret"
+INDEX_NAME = "loadtest"
+DEPLOYMENT = "loadtest"
+
+
+def parse_latency(spec):
+    """Turn a latency spec into a function returning a delay in seconds."""
+    kind, *args = spec.split(":")
+    args = [float(arg) for arg in args]
+    if kind == "const":
+        return lambda: args[0]
+    if kind == "uniform":
+        return lambda: random.uniform(args[0], args[1])
+    if kind == "lognormal":
+        mu = math.log(args[0])
+        return lambda: random.lognormvariate(mu, args[1])
+    raise argparse.ArgumentTypeError(f"unknown latency spec: {spec}")
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))]
+
+
+class StandIns:
+    """aiohttp application emulating the three upstream services."""
+
+    def __init__(self, search_latency, llm_latency, reply_latency, documents=5):
+        self.search_latency = search_latency
+        self.llm_latency = llm_latency
+        self.reply_latency = reply_latency
+        self.documents = documents
+        self.timings = defaultdict(list)
+        self.replies = {}
+        self._runner = None
+
+    async def start(self, port=0):
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._route)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", port)
+        await site.start()
+        return "http://127.0.0.1:%d" % self._runner.addresses[0][1]
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+    async def _route(self, request):
+        path = request.path
+        if path == "/v2/bot/message/reply":
+            return await self._timed("reply", self.reply_latency, self._reply(request))
+        if path.endswith("/docs/search.post.search"):
+            return await self._timed("search", self.search_latency, self._search(request))
+        if path.endswith("/docs/$count"):
+            return web.json_response(self.documents)
+        if path.endswith("/chat/completions"):
+            return await self._timed("llm", self.llm_latency, self._completion(request))
+        return web.json_response({"message": "not emulated"}, status=404)
+
+    async def _timed(self, stage, latency, response):
+        started = time.perf_counter()
+        await asyncio.sleep(latency())
+        result = await response
+        self.timings[stage].append(time.perf_counter() - started)
+        return result
+
+    async def _reply(self, request):
+        body = await request.json()
+        self.replies[body["replyToken"]] = time.perf_counter()
+        return web.json_response({})
+
+    async def _search(self, request):
+        body = await request.json()
+        query = body.get("search") or ""
+        value = [{
+            "@search.score": 1.0 / (rank + 1),
+            "title": f"Product {rank}",
+            "chunk": f"ข้อมูลสินค้า {query} รายการที่ {rank} " * 20,
+        } for rank in range(body.get("top") or self.documents)]
+        return web.json_response({"value": value})
+
+    async def _completion(self, request):
+        body = await request.json()
+        question = next((m["content"] for m in body["messages"] if m["role"] == "user"), "")
+        return web.json_response({
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": f"คำตอบสำหรับ {question}"}}],
+            "usage": {"prompt_tokens": 2000, "completion_tokens": 120, "total_tokens": 2120},
+        })
+
+
+def bot_environment(base_url, redis_url=""):
+    return {
+        "LINE_CHANNEL_SECRET": CHANNEL_SECRET,
+        "LINE_CHANNEL_ACCESS_TOKEN": "loadtest-token",
+        "LINE_API_ENDPOINT": base_url,
+        "AZURE_OPENAI_ENDPOINT": f"{base_url}/openai/deployments/{DEPLOYMENT}/chat/completions"
+                                 "?api-version=2024-08-01-preview",
+        "AZURE_OPENAI_API_KEY": "loadtest-key",
+        "AZURE_OAI_DEPLOYMENT": DEPLOYMENT,
+        "AZURE_SEARCH_ENDPOINT": base_url,
+        "AZURE_SEARCH_KEY": "loadtest-key",
+        "AZURE_SEARCH_INDEX": INDEX_NAME,
+        "REDIS_URL": redis_url,
+    }
+
+
+def signed_webhook(seq, question, users):
+    reply_token = f"loadtest-reply-{seq}"
+    body = json.dumps({
+        "destination": "Uloadtest",
+        "events": [{
+            "type": "message",
+            "mode": "active",
+            "timestamp": int(time.time() * 1000),
+            "webhookEventId": f"loadtest-{seq}-{random.getrandbits(32):08x}",
+            "deliveryContext": {"isRedelivery": False},
+            "replyToken": reply_token,
+            "source": {"type": "user", "userId": f"Uloadtest{seq % users}"},
+            "message": {"type": "text", "id": str(seq), "quoteToken": "q", "text": question},
+        }],
+    }, ensure_ascii=False)
+    signature = base64.b64encode(
+        hmac.new(CHANNEL_SECRET.encode("utf-8"), body.encode("utf-8"), hashlib.sha256).digest()).decode("ascii")
+    return reply_token, body, signature
+
+
+async def generate_load(client, args, stand_ins):
+    questions = [f"สอบถามสเปคสุขภัณฑ์รุ่น {n}" for n in range(args.questions)] if args.questions else None
+    sent = {}
+    ack = []
+    errors = defaultdict(int)
+
+    async def send(seq):
+        question = random.choice(questions) if questions else f"สอบถามสเปคสุขภัณฑ์รุ่น {seq}"
+        reply_token, body, signature = signed_webhook(seq, question, args.users)
+        started = time.perf_counter()
+        sent[reply_token] = started
+        try:
+            response = await client.post("/callback", content=body.encode("utf-8"),
+                                         headers={"X-Line-Signature": signature,
+                                                  "Content-Type": "application/json"})
+        except httpx.HTTPError as e:
+            errors[type(e).__name__] += 1
+            return
+        ack.append(time.perf_counter() - started)
+        if response.status_code != 200:
+            errors[f"HTTP {response.status_code}"] += 1
+
+    total = int(args.rps * args.duration)
+    start = time.perf_counter()
+    tasks = []
+    for seq in range(total):
+        delay = start + seq / args.rps - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(send(seq)))
+    await asyncio.gather(*tasks)
+
+    # wait for the replies still being processed behind the acknowledged webhooks
+    drain_until = time.perf_counter() + args.drain
+    while len(stand_ins.replies) < len(sent) and time.perf_counter() < drain_until:
+        await asyncio.sleep(0.1)
+    elapsed = time.perf_counter() - start
+
+    end_to_end = [stand_ins.replies[token] - started for token, started in sent.items()
+                  if token in stand_ins.replies]
+    missing = len(sent) - len(end_to_end)
+    if missing:
+        errors["no reply"] += missing
+    return total, elapsed, ack, end_to_end, errors
+
+
+def report(total, elapsed, ack, end_to_end, errors, stand_ins):
+    rows = [("ack", ack)] + [(stage, stand_ins.timings[stage]) for stage in ("search", "llm", "reply")]
+    rows.append(("end_to_end", end_to_end))
+    print(f"\n{total} webhooks in {elapsed:.1f}s ({total / elapsed:.1f}/s)")
+    print(f"{'stage':<12}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for stage, values in rows:
+        if not values:
+            print(f"{stage:<12}{0:>8}")
+            continue
+        cells = [percentile(values, pct) * 1000 for pct in (50, 95, 99)] + [max(values) * 1000]
+        print(f"{stage:<12}{len(values):>8}" + "".join(f"{cell:>10.1f}" for cell in cells))
+    for error, count in sorted(errors.items()):
+        print(f"error: {error} x{count}")
+
+
+async def run_in_process(args, base_url, stand_ins):
+    os.environ.update(bot_environment(base_url, args.redis_url))
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    import main
+
+    async with main.lifespan(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bot", timeout=60) as client:
+            return await generate_load(client, args, stand_ins)
+
+
+async def run_uvicorn(args, base_url, stand_ins):
+    env = dict(os.environ, **bot_environment(base_url, args.redis_url))
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(args.port),
+         "--workers", str(args.workers), "--log-level", "warning"],
+        cwd=ROOT, env=env)
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{args.port}", timeout=60,
+                                     limits=httpx.Limits(max_connections=args.connections)) as client:
+            for _ in range(100):
+                try:
+                    await client.get("/")
+                    break
+                except httpx.HTTPError:
+                    await asyncio.sleep(0.2)
+            else:
+                raise RuntimeError("uvicorn did not start")
+            return await generate_load(client, args, stand_ins)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+async def run(args):
+    stand_ins = StandIns(args.search_latency, args.llm_latency, args.reply_latency)
+    base_url = await stand_ins.start()
+    try:
+        runner = run_uvicorn if args.uvicorn else run_in_process
+        results = await runner(args, base_url, stand_ins)
+    finally:
+        await stand_ins.stop()
+    report(*results, stand_ins)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rps", type=float, default=20, help="webhooks sent per second")
+    parser.add_argument("--duration", type=float, default=10, help="seconds of load")
+    parser.add_argument("--users", type=int, default=1000, help="distinct LINE users")
+    parser.add_argument("--questions", type=int, default=0,
+                        help="distinct questions to cycle through; 0 makes every question unique")
+    parser.add_argument("--search-latency", type=parse_latency, default="lognormal:0.08:0.4")
+    parser.add_argument("--llm-latency", type=parse_latency, default="lognormal:1.5:0.4")
+    parser.add_argument("--reply-latency", type=parse_latency, default="lognormal:0.05:0.3")
+    parser.add_argument("--drain", type=float, default=60, help="seconds to wait for outstanding replies")
+    parser.add_argument("--redis-url", default="", help="run the bot with this REDIS_URL")
+    parser.add_argument("--uvicorn", action="store_true", help="run the bot under uvicorn instead of in-process")
+    parser.add_argument("--port", type=int, default=8765, help="uvicorn port")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers")
+    parser.add_argument("--connections", type=int, default=200, help="client connections to uvicorn")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
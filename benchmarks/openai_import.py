@@ -0,0 +1,102 @@
+"""Cold-start import benchmark for the ``openai`` package.
+
+Every sample runs in a fresh interpreter, so nothing is cached in
+``sys.modules``. For each scenario it reports the median and best wall time
+of the statement and how many ``openai`` and ``openai.types`` modules it left
+loaded. ``--importtime`` also prints the slowest modules from
+``python -X importtime`` for the first scenario.
+
+Examples::
+
+    python benchmarks/openai_import.py
+    python benchmarks/openai_import.py --runs 30 --importtime 15
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = [
+    ("import openai", "import openai"),
+    ("module config", "import openai; openai.api_type = 'azure'; openai.api_key = 'k'"),
+    ("AzureOpenAI", "import openai; openai.AzureOpenAI"),
+    ("ChatCompletion type", "import openai; openai.types.chat.ChatCompletion"),
+    ("openai.types *", "from openai.types import *"),
+]
+
+# Statements that must run without error, checked once before timing
+CHECKS = [
+    # importing the openai._client submodule must not replace the module-level client
+    ("module client after OpenAI",
+     "import openai; openai.api_key = 'sk-x'; openai.OpenAI; openai.chat.completions; "
+     "assert isinstance(openai._load_client(), openai.OpenAI)"),
+]
+
+PROBE = """
+import sys, time, json
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+names = [name for name in sys.modules if name == "openai" or name.startswith("openai.")]
+print(json.dumps({{
+    "seconds": elapsed,
+    "openai": len(names),
+    "types": sum(name.startswith("openai.types.") for name in names),
+    "pydantic": "pydantic" in sys.modules,
+}}))
+"""
+
+
+def sample(statement):
+    output = subprocess.run([sys.executable, "-c", PROBE.format(statement=statement)],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def import_time(statement, top):
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            check=True, capture_output=True, text=True).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(cumulative), int(own), name.rstrip()))
+    rows.sort(reverse=True)
+    print(f"\nslowest imports for {statement!r} (microseconds)")
+    print(f"{'cumulative':>12}{'self':>10}  module")
+    for cumulative, own, name in rows[:top]:
+        print(f"{cumulative:>12}{own:>10}  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=10, help="fresh interpreters per scenario")
+    parser.add_argument("--importtime", type=int, default=0, metavar="N",
+                        help="print the N slowest imports of the first scenario")
+    args = parser.parse_args()
+
+    for label, statement in CHECKS:
+        check = subprocess.run([sys.executable, "-c", statement], capture_output=True, text=True)
+        if check.returncode:
+            sys.exit(f"check failed: {label}: {check.stderr.strip().splitlines()[-1]}")
+        print(f"check ok: {label}")
+
+    print(f"{'scenario':<22}{'median ms':>11}{'best ms':>10}{'openai':>8}{'types':>7}  pydantic")
+    for label, statement in SCENARIOS:
+        try:
+            samples = [sample(statement) for _ in range(args.runs)]
+        except subprocess.CalledProcessError as e:
+            print(f"{label:<22}  failed: {e.stderr.strip().splitlines()[-1]}")
+            continue
+        seconds = [s["seconds"] * 1000 for s in samples]
+        last = samples[-1]
+        print(f"{label:<22}{statistics.median(seconds):>11.1f}{min(seconds):>10.1f}"
+              f"{last['openai']:>8}{last['types']:>7}  {'yes' if last['pydantic'] else 'no'}")
+    if args.importtime:
+        import_time(SCENARIOS[0][1], args.importtime)
+
+
+if __name__ == "__main__":
+    main()
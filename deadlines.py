@@ -0,0 +1,68 @@
+"""Per-event deadline budget for the search, LLM and reply stages.
+
+A LINE reply token is only valid for a short time after the event, so each
+event gets a fixed budget counted from the event's own timestamp (time spent
+in the webhook queue counts too). :class:`Deadline` gives every stage the
+time left minus what the later stages have reserved, cancels a stage that
+overruns and returns its fallback instead. A stage recorder such as
+:class:`metrics.StageMetrics` counts how often that happens so the budget
+and shares can be tuned.
+"""
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class Deadline:
+    """Time budget for one event, split across ordered stages by share."""
+
+    def __init__(self, budget, shares, start=None, stats=None):
+        """
+        :param budget: seconds from ``start`` until the reply must have been sent
+        :param shares: ordered mapping of stage name to its share of the budget
+        :param start: wall-clock start time (``time.time()``), default now;
+            pass the event timestamp so queueing delay is accounted for
+        :param stats: optional recorder, e.g. :class:`metrics.StageMetrics`, whose
+            ``record(stage, outcome, elapsed)`` receives every outcome
+        """
+        now = time.time()
+        start = now if start is None else min(start, now)
+        self.expires = time.monotonic() + budget - (now - start)
+        self.budget = budget
+        self.stages = list(shares)
+        self.shares = shares
+        self.stats = stats
+
+    def remaining(self):
+        return self.expires - time.monotonic()
+
+    def timeout_for(self, stage):
+        """Seconds ``stage`` may use: time left minus the shares of the stages after it."""
+        later = self.stages[self.stages.index(stage) + 1:]
+        reserved = sum(self.shares[name] for name in later) * self.budget
+        return self.remaining() - reserved
+
+    async def run(self, stage, awaitable, fallback=None):
+        """Await ``awaitable`` within the stage's time; return ``fallback`` if it cannot finish."""
+        timeout = self.timeout_for(stage)
+        started = time.monotonic()
+        if timeout <= 0:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            self._record(stage, "skipped", 0.0)
+            logger.warning("Skipped stage %s: deadline already passed", stage)
+            return fallback
+        try:
+            result = await asyncio.wait_for(awaitable, timeout)
+        except asyncio.TimeoutError:
+            self._record(stage, "timeout", time.monotonic() - started)
+            logger.warning("Stage %s timed out after %.2fs", stage, timeout)
+            return fallback
+        self._record(stage, "ok", time.monotonic() - started)
+        return result
+
+    def _record(self, stage, outcome, elapsed):
+        if self.stats is not None:
+            self.stats.record(stage, outcome, elapsed)
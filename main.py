@@ -1,19 +1,27 @@
 import os
+from contextlib import asynccontextmanager
+import aiohttp
 from fastapi import FastAPI, Request, HTTPException
-from linebot import LineBotApi, WebhookHandler
-from linebot.exceptions import InvalidSignatureError
+from fastapi.responses import PlainTextResponse
+from linebot import AsyncLineBotApi
+from linebot.aiohttp_async_http_client import AiohttpAsyncHttpClient
+from linebot.exceptions import InvalidSignatureError, LineBotApiError
 from linebot.models import MessageEvent, TextMessage, TextSendMessage, QuickReply, QuickReplyButton, MessageAction, FollowEvent
-import requests
 from dotenv import load_dotenv
 import openai
-from azure.search.documents import SearchClient
 from azure.core.credentials import AzureKeyCredential
+from search_clients import AsyncSearchClientRegistry, RAW_RESULTS_SUPPORTED
+from webhook_handler import AsyncWebhookHandler
+from webhook_queue import WebhookQueue, MemoryBackend, RedisBackend, QueueFullError
+from answer_cache import AnswerCache, PromptFiles
+from profile_cache import ProfileCache
+from retrieval_cache import RetrievalCache, redis_index_version
+from prompt_assembly import build_context
+from deadlines import Deadline
+from metrics import Registry, StageMetrics
 
 load_dotenv()
 
-# สร้าง FastAPI instance
-app = FastAPI()
-
 # ดึงค่าจาก Environment Variables
 LINE_CHANNEL_SECRET = os.getenv("LINE_CHANNEL_SECRET")
 LINE_CHANNEL_ACCESS_TOKEN = os.getenv("LINE_CHANNEL_ACCESS_TOKEN")
@@ -23,6 +31,24 @@ AZURE_SEARCH_ENDPOINT = os.getenv("AZURE_SEARCH_ENDPOINT")
 AZURE_SEARCH_KEY = os.getenv("AZURE_SEARCH_KEY")
 AZURE_SEARCH_INDEX = os.getenv("AZURE_SEARCH_INDEX")
 AZURE_OAI_DEPLOYMENT = os.getenv("AZURE_OAI_DEPLOYMENT")
+LINE_API_ENDPOINT = os.getenv("LINE_API_ENDPOINT", AsyncLineBotApi.DEFAULT_API_ENDPOINT)
+REDIS_URL = os.getenv("REDIS_URL")
+WEBHOOK_WORKERS = int(os.getenv("WEBHOOK_WORKERS", "8"))
+WEBHOOK_QUEUE_SIZE = int(os.getenv("WEBHOOK_QUEUE_SIZE", "1000"))
+SEARCH_POOL_SIZE = int(os.getenv("SEARCH_POOL_SIZE", "100"))
+SEARCH_WARM_CONNECTIONS = int(os.getenv("SEARCH_WARM_CONNECTIONS", "2"))
+SEARCH_WARM_TIMEOUT = float(os.getenv("SEARCH_WARM_TIMEOUT", "5"))
+ANSWER_CACHE_SIZE = int(os.getenv("ANSWER_CACHE_SIZE", "1024"))
+ANSWER_CACHE_TTL = int(os.getenv("ANSWER_CACHE_TTL", "3600"))
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "2048"))
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", "300"))
+PROFILE_CACHE_SIZE = int(os.getenv("PROFILE_CACHE_SIZE", "4096"))
+PROFILE_CACHE_TTL = int(os.getenv("PROFILE_CACHE_TTL", "600"))
+CONTEXT_TOKEN_BUDGET = int(os.getenv("CONTEXT_TOKEN_BUDGET", "2000"))
+EVENT_DEADLINE = float(os.getenv("EVENT_DEADLINE", "25"))
+# สัดส่วนเวลาของแต่ละขั้นตอน (search -> llm -> reply)
+STAGE_SHARES = {"search": 0.2, "llm": 0.65, "reply": 0.15}
+SLOW_REPLY_MESSAGE = "ขออภัย ขณะนี้ระบบตอบช้ากว่าปกติ รบกวนคุณลูกค้าลองถามใหม่อีกครั้งค่ะ"
 
 # ตรวจสอบว่าค่าถูกตั้งไว้
 if not all([
@@ -45,57 +71,152 @@ def read_file(filename):
             return file.read().strip()
     return ""
 
-# โหลดข้อความจาก system.txt และ grounding.txt
-system_message = read_file("system.txt")
-grounding_text = read_file("grounding.txt")
+# โหลดข้อความจาก system.txt และ grounding.txt (โหลดใหม่อัตโนมัติเมื่อไฟล์ถูกแก้ไข)
+prompt_files = PromptFiles({"system": "system.txt", "grounding": "grounding.txt"}, loader=read_file)
+
+# metrics สำหรับ /metrics (Prometheus)
+metrics = Registry()
+stage_metrics = StageMetrics(metrics)
+upstream_responses = metrics.counter("bot_upstream_responses_total", "Responses from upstream services by status code.", ("upstream", "status"))
+upstream_retries = metrics.counter("bot_upstream_retries_total", "Requests retried by the upstream SDK.", ("upstream",))
+openai_tokens = metrics.counter("bot_openai_tokens_total", "Azure OpenAI token usage.", ("kind",))
+
+# ตั้งค่า Line Messaging API (session และ client จะถูกสร้างตอน startup เพราะต้องอยู่ใน event loop)
+handler = AsyncWebhookHandler(LINE_CHANNEL_SECRET)
+http_session = None
+line_bot_api = None
+# cache โปรไฟล์ผู้ใช้ (สร้างพร้อม line_bot_api) ใช้ profile_cache.get(user_id) แทน line_bot_api.get_profile
+profile_cache = None
+
+# Redis (ถ้ากำหนด REDIS_URL) ใช้ร่วมกันระหว่างคิวและ cache
+if REDIS_URL:
+    import redis.asyncio
+    redis_client = redis.asyncio.from_url(REDIS_URL)
+else:
+    redis_client = None
+
+# คิวรับ event: ตอบ LINE ทันทีแล้วให้ worker ประมวลผลทีหลัง
+if redis_client is not None:
+    queue_backend = RedisBackend(redis_client, maxsize=WEBHOOK_QUEUE_SIZE)
+else:
+    queue_backend = MemoryBackend(maxsize=WEBHOOK_QUEUE_SIZE)
+webhook_queue = WebhookQueue(handler, workers=WEBHOOK_WORKERS, backend=queue_backend,
+                             observe=lambda stage, seconds: stage_metrics.seconds.observe(seconds, stage))
+
+# cache คำตอบจาก Azure OpenAI สำหรับคำถามซ้ำ
+answer_cache = AnswerCache(maxsize=ANSWER_CACHE_SIZE, ttl=ANSWER_CACHE_TTL, redis=redis_client)
+
+# cache ผลการค้นหา ล้างเมื่อหมดอายุหรือเมื่อ ingestion job เพิ่ม index version ใน Redis
+search_cache = RetrievalCache(
+    maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL,
+    index_version=redis_index_version(redis_client, AZURE_SEARCH_INDEX) if redis_client is not None else None
+)
+
+metrics.gauge_callback("bot_webhook_queue_depth", "Events waiting in the in-memory webhook queue.", webhook_queue.depth)
+metrics.gauge_callback("bot_cache_requests_total", "Cache lookups by result.",
+                       lambda: {("answer", result): count for result, count in answer_cache.stats.items()}
+                       | {("search", result): count for result, count in search_cache.stats.items()}
+                       | {("profile", result): count for result, count in (profile_cache.stats if profile_cache else {}).items()},
+                       ("cache", "result"), kind="counter")
+metrics.gauge_callback("bot_cache_entries", "Entries held in process by each cache.",
+                       lambda: {("answer",): len(answer_cache), ("search",): len(search_cache),
+                                ("profile",): len(profile_cache) if profile_cache else 0}, ("cache",))
+
+# SearchClient ที่เปิดค้างไว้ตลอดอายุของ app (ไม่ต้อง handshake ใหม่ทุกข้อความ)
+search_clients = AsyncSearchClientRegistry(
+    AZURE_SEARCH_ENDPOINT, AzureKeyCredential(AZURE_SEARCH_KEY),
+    pool_size=SEARCH_POOL_SIZE, warm_connections=SEARCH_WARM_CONNECTIONS, warm_timeout=SEARCH_WARM_TIMEOUT
+)
 
-# ตั้งค่า Line Messaging API
-line_bot_api = LineBotApi(LINE_CHANNEL_ACCESS_TOKEN)
-handler = WebhookHandler(LINE_CHANNEL_SECRET)
+@asynccontextmanager
+async def lifespan(app):
+    global http_session, line_bot_api, profile_cache
+    http_session = aiohttp.ClientSession()
+    line_bot_api = AsyncLineBotApi(LINE_CHANNEL_ACCESS_TOKEN, AiohttpAsyncHttpClient(http_session),
+                                   endpoint=LINE_API_ENDPOINT)
+    profile_cache = ProfileCache.for_line_bot_api(line_bot_api, maxsize=PROFILE_CACHE_SIZE, ttl=PROFILE_CACHE_TTL,
+                                                  redis=redis_client)
+    await search_clients.start([AZURE_SEARCH_INDEX])
+    await webhook_queue.start()
+    try:
+        yield
+    finally:
+        await webhook_queue.stop()
+        await search_clients.close()
+        await http_session.close()
+        if redis_client is not None:
+            await redis_client.aclose()
+
+# สร้าง FastAPI instance
+app = FastAPI(lifespan=lifespan)
 
 @app.get("/")
 async def read_root():
     return {"message": "Hello, world!"}
 
+@app.get("/metrics")
+async def read_metrics():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
 @app.post("/callback")
 async def callback(request: Request):
     signature = request.headers["X-Line-Signature"]
     body = await request.body()
     
     try:
-        handler.handle(body.decode("utf-8"), signature)
+        await webhook_queue.submit(body, signature)
     except InvalidSignatureError:
         raise HTTPException(status_code=400, detail="Invalid signature")
+    except QueueFullError:
+        raise HTTPException(status_code=503, detail="Busy, please retry")
 
     return "OK"
 
 @handler.add(FollowEvent)
-def handle_follow(event):
+async def handle_follow(event):
     """ ตอบกลับเมื่อผู้ใช้เพิ่ม Bot ใหม่ หลังจากลบการสนทนา """
+    # ผู้ใช้ที่เคย block อาจถูก cache ไว้ว่าไม่มีโปรไฟล์ ล้างทิ้งเมื่อกลับมาเพิ่มเพื่อน
+    profile_cache.forget(event.source.user_id)
+
+    # ทักทายด้วยชื่อผู้ใช้ (ถ้าดึงโปรไฟล์ไม่ได้ก็ทักทายแบบไม่มีชื่อ)
+    try:
+        profile = await profile_cache.get(event.source.user_id)
+    except LineBotApiError as e:
+        upstream_responses.inc("line", str(e.status_code))
+        profile = None
+    name = f"คุณ{profile.display_name} " if profile is not None else ""
+
     welcome_message = (
-        "ขอบคุณที่เพิ่มเราเป็นเพื่อนอีกครั้ง! 😊\n"
+        f"{name}ขอบคุณที่เพิ่มเราเป็นเพื่อนอีกครั้ง! 😊\n"
         "หากต้องการสอบถามข้อมูลหรือเริ่มต้นสนทนาใหม่ พิมพ์ 'เริ่มการสนทนาใหม่' ได้เลยค่ะ"
     )
 
-    line_bot_api.reply_message(
-        event.reply_token,
-        TextSendMessage(text=welcome_message)
-    )
+    await reply_line(event.reply_token, TextSendMessage(text=welcome_message))
 
 
 @handler.add(MessageEvent, message=TextMessage)
-def handle_message(event):
+async def handle_message(event):
     user_message = event.message.text
 
     if user_message == "เริ่มการสนทนาใหม่":
         # ตอบกลับข้อความพิเศษ
         reply_message = "รบกวนคุณลูกค้าแจ้งว่าต้องการทราบข้อมูลสินค้า หรือบริการใดเพิ่มเติมค่ะ"
     else:
-        # ค้นหาเอกสารจาก Azure Cognitive Search
-        search_results = search_documents(user_message)
+        # เวลาเริ่มนับจาก timestamp ของ event เพราะ reply token มีอายุจำกัด
+        deadline = Deadline(EVENT_DEADLINE, STAGE_SHARES, start=event.timestamp / 1000, stats=stage_metrics)
+
+        # ค้นหาเอกสารจาก Azure Cognitive Search (ถ้าช้าเกินไปจะใช้ grounding.txt แทน)
+        hits = await deadline.run("search", search_documents(user_message), fallback=[])
+
+        # ไฟล์ prompt เปลี่ยน = คำตอบเดิมใน cache ใช้ไม่ได้แล้ว
+        if prompt_files.refresh():
+            answer_cache.clear()
+        system_message = prompt_files.text["system"]
+        grounding_text = prompt_files.text["grounding"]
 
-        # หากไม่มีผลลัพธ์ ให้ใช้ข้อความจาก grounding.txt
-        grounding_message = grounding_text if not search_results or "Error" in search_results[0] else "\n\n".join(search_results)
+        # รวมเอกสารตามคะแนน ตัดซ้ำ และจำกัดจำนวน token; หากไม่มีผลลัพธ์ ให้ใช้ข้อความจาก grounding.txt
+        with stage_metrics.seconds.time("prompt"):
+            grounding_message = build_context(hits, CONTEXT_TOKEN_BUDGET) or grounding_text
 
         # ส่งข้อความไปยัง Azure OpenAI
         headers = {
@@ -119,13 +240,11 @@ def handle_message(event):
         }
 
         
-        response = requests.post(AZURE_OPENAI_ENDPOINT, headers=headers, json=payload)
-        
-        if response.status_code == 200:
-            openai_response = response.json()
-            reply_message = openai_response["choices"][0]["message"]["content"]
-        else:
-            reply_message = "ขออภัย ระบบมีปัญหาในการเชื่อมต่อกับ Azure OpenAI"
+        cache_key = AnswerCache.key(user_message, prompt_files.fingerprint, [grounding_message])
+        reply_message = await answer_cache.get(cache_key)
+        if reply_message is None:
+            # ถ้า Azure OpenAI ตอบไม่ทันเวลา ให้ส่งข้อความแจ้งแทน
+            reply_message = await deadline.run("llm", ask_openai(headers, payload, cache_key), fallback=SLOW_REPLY_MESSAGE)
 
         # สร้างปุ่ม Quick Reply
         quick_reply_buttons = QuickReply(items=[
@@ -135,35 +254,94 @@ def handle_message(event):
         ])
 
         # ส่งข้อความกลับไปยัง Line พร้อม Quick Reply
-        line_bot_api.reply_message(
+        await deadline.run("reply", reply_line(
             event.reply_token,
             TextSendMessage(text=reply_message, quick_reply=quick_reply_buttons)
-        )
+        ))
+
+
+async def reply_line(reply_token, message):
+    """Send a reply through the LINE Messaging API and count the outcome."""
+    try:
+        await line_bot_api.reply_message(reply_token, message)
+    except LineBotApiError as e:
+        upstream_responses.inc("line", str(e.status_code))
+        raise
+    except aiohttp.ClientError:
+        upstream_responses.inc("line", "error")
+        raise
+    upstream_responses.inc("line", "200")
+
 
+async def ask_openai(headers, payload, cache_key):
+    """Send the chat completion request and cache a successful answer."""
+    try:
+        async with http_session.post(AZURE_OPENAI_ENDPOINT, headers=headers, json=payload) as response:
+            upstream_responses.inc("openai", str(response.status))
+            if response.status == 200:
+                openai_response = await response.json()
+                record_token_usage(openai_response.get("usage") or {})
+                reply_message = openai_response["choices"][0]["message"]["content"]
+                await answer_cache.set(cache_key, reply_message)
+                return reply_message
+    except aiohttp.ClientError as e:
+        upstream_responses.inc("openai", "error")
+        print(f"Error occurred during Azure OpenAI request: {e}")
+    return "ขออภัย ระบบมีปัญหาในการเชื่อมต่อกับ Azure OpenAI"
+
+
+def record_token_usage(usage):
+    openai_tokens.inc("prompt", amount=usage.get("prompt_tokens", 0))
+    openai_tokens.inc("completion", amount=usage.get("completion_tokens", 0))
+    cached = (usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+    if cached:
+        openai_tokens.inc("cached_prompt", amount=cached)
 
-def search_documents(query, top=5):
+
+async def search_documents(query, top=5, select=None, filter=None):
     """Search for relevant documents in Azure Cognitive Search."""
     try:
-        print(f"Querying Azure Search with: {query}")
-        search_client = SearchClient(
-            endpoint=AZURE_SEARCH_ENDPOINT,
-            index_name=AZURE_SEARCH_INDEX,
-            credential=AzureKeyCredential(AZURE_SEARCH_KEY)
-        )
-        results = search_client.search(search_text=query, top=top)
-        
-        documents = []
-        for result in results:
-            title = result.get("title", "No Title")
-            chunk = result.get("chunk", "No Content")
-            documents.append(f"Title: {title}\nContent: {chunk}")
-        
-        print(f"Documents fetched: {documents}")
-        
-        return documents if documents else ["ไม่พบข้อมูลที่เกี่ยวข้องค่ะ"]
+        cache_key = RetrievalCache.key(query, top, select, filter)
+        hits = await search_cache.get(cache_key)
+        if hits is None:
+            print(f"Querying Azure Search with: {query}")
+            search_client = search_clients.get(AZURE_SEARCH_INDEX)
+            # raw_results + result_fields: ใช้ dict จาก JSON ตรง ๆ เก็บไว้แค่ field ที่ใช้ ไม่ต้องแปลงเป็น model ทั้งหน้า
+            # (มีเฉพาะใน SDK ที่แก้ไว้ ถ้าเป็น SDK ปกติก็ได้ dict เหมือนกันแต่ช้ากว่า)
+            raw = {"raw_results": True, "result_fields": ["title", "chunk", "@search.score"]} \
+                if RAW_RESULTS_SUPPORTED else {}
+            results = await search_client.search(search_text=query, top=top, select=select, filter=filter,
+                                                 raw_response_hook=count_search_response(), **raw)
+
+            hits = []
+            async for result in results:
+                hits.append((result.get("title", "No Title"), result.get("chunk", "No Content"),
+                             result.get("@search.score")))
+            search_cache.set(cache_key, hits)
+
+        print(f"Documents fetched: {hits}")
+
+        return hits
     except Exception as e:
         print(f"Error occurred during Azure Search: {e}")
-        return ["ขออภัย ไม่สามารถเรียกข้อมูลได้ค่ะ"]
+        if getattr(e, "status_code", None) is None:
+            upstream_responses.inc("search", "error")
+        return []
+
+
+def count_search_response():
+    """Build a raw_response_hook counting status codes and retried requests of one search."""
+    requests_seen = set()
+
+    def hook(pipeline_response):
+        upstream_responses.inc("search", str(pipeline_response.http_response.status_code))
+        # azure-core resends the same HttpRequest object when it retries
+        request = pipeline_response.http_request
+        if request in requests_seen:
+            upstream_retries.inc("search")
+        requests_seen.add(request)
+
+    return hook
     
   
 if __name__ == "__main__":
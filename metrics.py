@@ -0,0 +1,157 @@
+"""Counters and histograms exposed in Prometheus text format on ``/metrics``.
+
+Collectors are plain dicts keyed by label values. Updates happen on the
+event-loop thread without locks: an increment is one dict lookup and one
+addition, and a histogram observation adds a ``bisect`` over the bucket
+bounds. Values owned by other objects (queue depth, cache statistics) are
+read through callbacks at scrape time, so they cost nothing on the hot path.
+"""
+import bisect
+import time
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _format_labels(names, values, extra=""):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+
+    def inc(self, *labelvalues, amount=1):
+        self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def samples(self):
+        for labelvalues, value in list(self._values.items()):
+            yield self.name + _format_labels(self.labelnames, labelvalues), value
+
+
+class Histogram:
+    """Cumulative-bucket histogram with optional labels."""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._values = {}
+
+    def observe(self, value, *labelvalues):
+        series = self._values.get(labelvalues)
+        if series is None:
+            # per-bucket counts (last one is +Inf), then sum
+            series = self._values[labelvalues] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect.bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def time(self, *labelvalues):
+        return _Timer(self, labelvalues)
+
+    def samples(self):
+        for labelvalues, series in list(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                yield self.name + "_bucket" + _format_labels(self.labelnames, labelvalues, f'le="{le}"'), cumulative
+            labels = _format_labels(self.labelnames, labelvalues)
+            yield self.name + "_sum" + labels, series[-1]
+            yield self.name + "_count" + labels, cumulative
+
+
+class CallbackGauge:
+    """Gauge (or counter) whose samples are read from a callback at scrape time.
+
+    The callback returns a number, or a dict mapping label-value tuples to numbers.
+    """
+
+    def __init__(self, name, documentation, callback, labelnames=(), kind="gauge"):
+        self.name = name
+        self.documentation = documentation
+        self.callback = callback
+        self.labelnames = tuple(labelnames)
+        self.kind = kind
+
+    def samples(self):
+        values = self.callback()
+        if values is None:
+            return
+        if not isinstance(values, dict):
+            values = {(): values}
+        for labelvalues, value in values.items():
+            yield self.name + _format_labels(self.labelnames, labelvalues), value
+
+
+class _Timer:
+    __slots__ = ("histogram", "labelvalues", "started")
+
+    def __init__(self, histogram, labelvalues):
+        self.histogram = histogram
+        self.labelvalues = labelvalues
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.started, *self.labelvalues)
+
+
+class Registry:
+    """Ordered set of collectors rendered together."""
+
+    def __init__(self):
+        self._collectors = []
+
+    def register(self, collector):
+        self._collectors.append(collector)
+        return collector
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge_callback(self, name, documentation, callback, labelnames=(), kind="gauge"):
+        return self.register(CallbackGauge(name, documentation, callback, labelnames, kind))
+
+    def render(self):
+        lines = []
+        for collector in self._collectors:
+            lines.append(f"# HELP {collector.name} {collector.documentation}")
+            lines.append(f"# TYPE {collector.name} {collector.kind}")
+            lines.extend(f"{name} {value}" for name, value in collector.samples())
+        return "\n".join(lines) + "\n"
+
+
+class StageMetrics:
+    """Stage recorder for :class:`deadlines.Deadline` backed by a histogram and a counter."""
+
+    def __init__(self, registry, prefix="bot_stage"):
+        self.seconds = registry.histogram(f"{prefix}_seconds", "Time spent per processing stage.", ("stage",))
+        self.outcomes = registry.counter(f"{prefix}_total", "Stage outcomes (ok, timeout, skipped).",
+                                         ("stage", "outcome"))
+
+    def record(self, stage, outcome, elapsed):
+        self.outcomes.inc(stage, outcome)
+        if outcome != "skipped":
+            self.seconds.observe(elapsed, stage)
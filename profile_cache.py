@@ -0,0 +1,203 @@
+"""Cache of LINE user profiles for personalised replies.
+
+A user who sends several messages in a row would otherwise cost one
+``get_profile`` round trip per message. :class:`ProfileCache` keeps profiles
+in an in-process LRU with TTL and, when a ``redis.asyncio`` client is given,
+in Redis so that every worker shares them. Concurrent misses for the same
+user wait for a single request, and users without a profile (they blocked
+the bot or never added it) are remembered for a shorter TTL, so they do not
+cause a failed request on every message either.
+"""
+import asyncio
+import json
+import logging
+
+from answer_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Redis value marking a user without a profile
+_NOT_FOUND = ""
+
+
+class ProfileCache:
+    """In-process LRU with TTL and single-flight loading, backed by an optional Redis tier."""
+
+    def __init__(self, fetch, dumps=None, loads=None, is_not_found=None, maxsize=4096, ttl=600,
+                 negative_ttl=60, redis=None, redis_ttl=None, prefix="linebot:profile"):
+        """
+        :param fetch: coroutine function taking a user ID and returning the profile
+        :param dumps: function serializing a profile to a string, required with ``redis``
+        :param loads: function parsing a string from ``dumps`` back into a profile
+        :param is_not_found: function telling whether an exception raised by ``fetch``
+            means the user has no profile; such users are cached as ``None``
+        :param maxsize: maximum number of profiles kept in process
+        :param ttl: seconds a profile stays valid
+        :param negative_ttl: seconds a missing profile is remembered
+        :param redis: optional ``redis.asyncio`` client for the shared tier
+        :param redis_ttl: seconds a profile stays in Redis, default ``ttl``
+        :param prefix: Redis key prefix
+        """
+        if redis is not None and (dumps is None or loads is None):
+            raise ValueError("dumps and loads are required with redis")
+        self.fetch = fetch
+        self.dumps = dumps
+        self.loads = loads
+        self.is_not_found = is_not_found or (lambda error: False)
+        self.negative_ttl = negative_ttl
+        self.redis = redis
+        self.redis_ttl = redis_ttl or ttl
+        self.prefix = prefix
+        self._local = TTLCache(maxsize, ttl)
+        self._missing = TTLCache(maxsize, negative_ttl)
+        self._loading = {}
+        # Redis deletes started by forget(): all of them, referenced until they
+        # finish, and the latest per user, which loads of that user wait for
+        self._tasks = set()
+        self._deleting = {}
+        self.stats = {"hits": 0, "redis_hits": 0, "misses": 0, "coalesced": 0, "not_found": 0, "errors": 0}
+
+    @classmethod
+    def for_line_bot_api(cls, line_bot_api, **kwargs):
+        """Cache ``get_profile`` of a legacy ``linebot.AsyncLineBotApi``."""
+        from linebot.exceptions import LineBotApiError
+        from linebot.models import Profile
+
+        return cls(
+            line_bot_api.get_profile,
+            dumps=lambda profile: profile.as_json_string(),
+            loads=lambda text: Profile.new_from_json_dict(json.loads(text)),
+            is_not_found=lambda error: isinstance(error, LineBotApiError) and error.status_code == 404,
+            **kwargs
+        )
+
+    @classmethod
+    def for_messaging_api(cls, messaging_api, **kwargs):
+        """Cache ``get_profile`` of a ``linebot.v3.messaging.AsyncMessagingApi``."""
+        from linebot.v3.messaging import ApiException, UserProfileResponse
+
+        return cls(
+            messaging_api.get_profile,
+            dumps=lambda profile: profile.to_json(),
+            loads=UserProfileResponse.from_json,
+            is_not_found=lambda error: isinstance(error, ApiException) and error.status == 404,
+            **kwargs
+        )
+
+    async def get(self, user_id):
+        """Return the profile of ``user_id``, or ``None`` if the user has none.
+
+        Errors other than a missing profile are raised and not cached.
+        """
+        profile = self._local.get(user_id)
+        if profile is not None:
+            self.stats["hits"] += 1
+            return profile
+        if self._missing.get(user_id) is not None:
+            self.stats["hits"] += 1
+            return None
+
+        loading = self._loading.get(user_id)
+        if loading is not None:
+            self.stats["coalesced"] += 1
+        else:
+            loading = self._loading[user_id] = asyncio.ensure_future(self._load(user_id))
+            loading.add_done_callback(lambda task: self._loaded(user_id, task))
+        # shield: one cancelled caller must not cancel the request the others wait for
+        return await asyncio.shield(loading)
+
+    def forget(self, user_id):
+        """Drop the cached profile of ``user_id``, e.g. when the user follows the bot again.
+
+        A load already in flight for the user still answers its waiters but no
+        longer stores its result, so it cannot bring the old profile back.
+        """
+        self._local.discard(user_id)
+        self._missing.discard(user_id)
+        self._loading.pop(user_id, None)
+        if self.redis is not None:
+            task = asyncio.ensure_future(self.redis.delete(self._redis_key(user_id)))
+            self._tasks.add(task)
+            self._deleting[user_id] = task
+            task.add_done_callback(lambda task: self._deleted(user_id, task))
+
+    def clear(self):
+        """Drop every in-process profile; Redis entries expire by TTL."""
+        self._local.clear()
+        self._missing.clear()
+
+    @property
+    def evictions(self):
+        return self._local.evictions + self._missing.evictions
+
+    def __len__(self):
+        return len(self._local) + len(self._missing)
+
+    async def _load(self, user_id):
+        if self.redis is not None:
+            deleting = self._deleting.get(user_id)
+            if deleting is not None:
+                # do not read back the entry forget() is deleting
+                await asyncio.wait([deleting])
+            try:
+                value = await self.redis.get(self._redis_key(user_id))
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning("Profile cache Redis lookup failed: %s", e)
+                value = None
+            if value is not None:
+                value = value.decode("utf-8") if isinstance(value, bytes) else value
+                self.stats["redis_hits"] += 1
+                if value == _NOT_FOUND:
+                    if self._current(user_id):
+                        self._missing.set(user_id, True)
+                    return None
+                profile = self.loads(value)
+                if self._current(user_id):
+                    self._local.set(user_id, profile)
+                return profile
+
+        self.stats["misses"] += 1
+        try:
+            profile = await self.fetch(user_id)
+        except Exception as e:
+            if not self.is_not_found(e):
+                raise
+            self.stats["not_found"] += 1
+            if self._current(user_id):
+                self._missing.set(user_id, True)
+                await self._store(user_id, _NOT_FOUND, self.negative_ttl)
+            return None
+        if self._current(user_id):
+            self._local.set(user_id, profile)
+            if self.redis is not None:
+                await self._store(user_id, self.dumps(profile), self.redis_ttl)
+        return profile
+
+    async def _store(self, user_id, value, ttl):
+        if self.redis is None:
+            return
+        try:
+            await self.redis.set(self._redis_key(user_id), value, ex=int(ttl))
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning("Profile cache Redis store failed: %s", e)
+
+    def _current(self, user_id):
+        # False once forget() dropped the load running in this task
+        return self._loading.get(user_id) is asyncio.current_task()
+
+    def _loaded(self, user_id, task):
+        if self._loading.get(user_id) is task:
+            del self._loading[user_id]
+
+    def _redis_key(self, user_id):
+        return f"{self.prefix}:{user_id}"
+
+    def _deleted(self, user_id, task):
+        self._tasks.discard(task)
+        if self._deleting.get(user_id) is task:
+            del self._deleting[user_id]
+        if not task.cancelled() and task.exception() is not None:
+            self.stats["errors"] += 1
+            logger.warning("Profile cache Redis delete failed: %s", task.exception())
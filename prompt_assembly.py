@@ -0,0 +1,90 @@
+"""Token-budgeted assembly of the grounding context sent to Azure OpenAI.
+
+Search hits are deduplicated, ordered by score and cut to a token budget
+estimated offline, without loading a tokenizer. Only this context varies
+between calls; the system message is sent unchanged and first, so the
+prompt prefix stays byte-identical and server-side prompt caching can hit.
+"""
+import math
+import re
+
+# Conservative per-character token costs. Thai has no spaces and BPE
+# vocabularies split it into far more tokens per character than English.
+THAI_TOKENS_PER_CHAR = 0.7
+ASCII_TOKENS_PER_CHAR = 0.25
+OTHER_TOKENS_PER_CHAR = 1.0
+
+_THAI = re.compile(r"[\u0e00-\u0e7f]")
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+_SPACES = re.compile(r"\s+")
+
+
+def estimate_tokens(text):
+    """Estimate the number of tokens in ``text`` (never underestimates by much)."""
+    if text.isascii():
+        return math.ceil(len(text) * ASCII_TOKENS_PER_CHAR)
+    thai = _THAI.subn("", text)[1]
+    other = _NON_ASCII.subn("", text)[1] - thai
+    ascii_chars = len(text) - thai - other
+    return math.ceil(thai * THAI_TOKENS_PER_CHAR + other * OTHER_TOKENS_PER_CHAR
+                     + ascii_chars * ASCII_TOKENS_PER_CHAR)
+
+
+def _shingles(text, size=5):
+    text = _SPACES.sub(" ", text).strip().casefold()
+    if len(text) <= size:
+        return {text}
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def dedupe(hits, similarity=0.9):
+    """Drop hits whose chunk is a near-duplicate of a higher-ranked one.
+
+    Chunks are compared by the Jaccard similarity of their character
+    5-gram sets, which works for Thai text without word segmentation.
+    """
+    kept = []
+    seen = []
+    for hit in hits:
+        shingles = _shingles(hit[1])
+        if any(len(shingles & other) >= similarity * len(shingles | other) for other in seen):
+            continue
+        seen.append(shingles)
+        kept.append(hit)
+    return kept
+
+
+def format_hit(title, chunk):
+    return f"Title: {title}\nContent: {chunk}"
+
+
+def build_context(hits, token_budget, similarity=0.9, min_tail_tokens=64, separator="\n\n"):
+    """Join the best ``(title, chunk, score)`` hits into a context of at most ``token_budget`` tokens.
+
+    Hits are ordered by score, near-duplicates are removed, and the last hit
+    that does not fit whole is truncated if at least ``min_tail_tokens`` of
+    the budget remain. Returns an empty string when there are no hits.
+    """
+    ordered = sorted(hits, key=lambda hit: hit[2] or 0.0, reverse=True)
+    parts = []
+    remaining = token_budget
+    separator_tokens = estimate_tokens(separator)
+    for title, chunk, _ in dedupe(ordered, similarity):
+        text = format_hit(title, chunk)
+        cost = estimate_tokens(text) + (separator_tokens if parts else 0)
+        if cost <= remaining:
+            parts.append(text)
+            remaining -= cost
+            continue
+        if remaining >= min_tail_tokens:
+            parts.append(_truncate(text, remaining - (separator_tokens if parts else 0)))
+        break
+    return separator.join(parts)
+
+
+def _truncate(text, token_budget):
+    # shrink proportionally, then trim until the estimate fits
+    end = int(len(text) * token_budget / max(estimate_tokens(text), 1))
+    while end > 0 and estimate_tokens(text[:end]) > token_budget:
+        end -= max(1, end // 20)
+    return text[:max(end, 0)]
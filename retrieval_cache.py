@@ -0,0 +1,96 @@
+"""Cache of Azure AI Search results for ``search_documents``.
+
+Results are stored as compact ``(title, chunk, score)`` tuples keyed by
+``(query, top, select, filter)``. Entries expire after a TTL and are all
+dropped when the index-version token changes; the ingestion job bumps that
+token with :func:`bump_index_version` after uploading documents.
+"""
+import logging
+import time
+
+from answer_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+def index_version_key(index_name):
+    return f"linebot:search:index-version:{index_name}"
+
+
+async def bump_index_version(redis, index_name):
+    """Invalidate every worker's cached results for ``index_name``; call after an upload."""
+    return await redis.incr(index_version_key(index_name))
+
+
+def redis_index_version(redis, index_name):
+    """Return a coroutine function reading the index-version token from Redis."""
+    key = index_version_key(index_name)
+
+    async def read():
+        return await redis.get(key)
+
+    return read
+
+
+class RetrievalCache:
+    """Bounded LRU of search results, invalidated by TTL or index version."""
+
+    def __init__(self, maxsize=2048, ttl=300, index_version=None, version_check_interval=5.0):
+        """
+        :param maxsize: maximum number of cached result lists
+        :param ttl: seconds a result list stays valid
+        :param index_version: optional coroutine function returning the current
+            index-version token, e.g. from :func:`redis_index_version`
+        :param version_check_interval: minimum seconds between version checks
+        """
+        self.index_version = index_version
+        self.version_check_interval = version_check_interval
+        self._local = TTLCache(maxsize, ttl)
+        self._version = None
+        self._checked = 0.0
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    @staticmethod
+    def key(query, top, select=None, filter=None):
+        return (query, top, tuple(select) if select else None, filter)
+
+    async def get(self, key):
+        await self._check_version()
+        results = self._local.get(key)
+        if results is None:
+            self.stats["misses"] += 1
+        else:
+            self.stats["hits"] += 1
+        return results
+
+    def set(self, key, results):
+        """Store ``results``, an iterable of ``(title, chunk, score)`` tuples."""
+        self._local.set(key, tuple(results))
+
+    def clear(self):
+        self._local.clear()
+
+    @property
+    def evictions(self):
+        return self._local.evictions
+
+    def __len__(self):
+        return len(self._local)
+
+    async def _check_version(self):
+        if self.index_version is None:
+            return
+        now = time.monotonic()
+        if now - self._checked < self.version_check_interval:
+            return
+        self._checked = now
+        try:
+            version = await self.index_version()
+        except Exception as e:
+            logger.warning("Could not read search index version: %s", e)
+            return
+        if version != self._version:
+            if self._version is not None or len(self._local):
+                self.stats["invalidations"] += 1
+            self._version = version
+            self._local.clear()
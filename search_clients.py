@@ -0,0 +1,160 @@
+"""Long-lived Azure AI Search clients shared across requests.
+
+Building a ``SearchClient`` per query means a new azure-core pipeline, a new
+HTTP session and a new TLS handshake every time. The registries here keep
+one client per index on top of one pooled session, are opened at application
+startup and closed at shutdown.
+"""
+import asyncio
+import inspect
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from azure.core.pipeline.transport import AioHttpTransport, RequestsTransport
+from azure.search.documents import SearchClient
+from azure.search.documents.aio import SearchClient as AsyncSearchClient
+
+logger = logging.getLogger(__name__)
+
+# raw_results/result_fields come from the azure-search-documents patched in this
+# environment; the released package passes unknown keywords on to the transport,
+# which rejects them on every query
+RAW_RESULTS_SUPPORTED = "raw_results" in inspect.signature(AsyncSearchClient.search).parameters
+
+
+class SearchClientRegistry:
+    """One synchronous ``SearchClient`` per index over a pooled ``requests`` session."""
+
+    def __init__(self, endpoint, credential, pool_size=20, warm_connections=2, warm_timeout=5.0):
+        """
+        :param endpoint: search service endpoint
+        :param credential: ``AzureKeyCredential`` or token credential
+        :param pool_size: maximum number of kept-alive connections to the service
+        :param warm_connections: connections opened per index by :meth:`start`
+        :param warm_timeout: seconds :meth:`start` waits for the warmup requests, which are
+            not retried; an unreachable service is logged and does not block startup
+        """
+        self.endpoint = endpoint
+        self.credential = credential
+        self.pool_size = pool_size
+        self.warm_connections = warm_connections
+        self.warm_timeout = warm_timeout
+        self._session = None
+        self._clients = {}
+
+    def start(self, index_names=()):
+        """Open the session, create a client for each index and warm its connections."""
+        self._session = requests.Session()
+        # retries are handled by the azure-core pipeline, as in RequestsTransport's own session
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size,
+                              max_retries=Retry(total=False, redirect=False, raise_on_status=False))
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # concurrent requests so that each one opens its own pooled connection
+        pool = ThreadPoolExecutor(max(1, self.warm_connections))
+        warmups = []
+        for index_name in index_names:
+            client = self.get(index_name)
+            warmups += [pool.submit(_warm, client.get_document_count, index_name, self.warm_timeout)
+                        for _ in range(self.warm_connections)]
+        _, not_done = wait(warmups, timeout=self.warm_timeout)
+        if not_done:
+            logger.warning("Search connection warmup not finished after %.1fs, continuing", self.warm_timeout)
+        # do not wait for stragglers; their own timeouts end them
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def get(self, index_name):
+        """Return the client for ``index_name``, creating it on first use."""
+        client = self._clients.get(index_name)
+        if client is None:
+            transport = RequestsTransport(session=self._session, session_owner=False)
+            client = SearchClient(self.endpoint, index_name, self.credential, transport=transport)
+            self._clients[index_name] = client
+        return client
+
+    def close(self):
+        for client in self._clients.values():
+            client.close()
+        self._clients = {}
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+class AsyncSearchClientRegistry:
+    """One ``aio.SearchClient`` per index over a pooled ``aiohttp`` session."""
+
+    def __init__(self, endpoint, credential, pool_size=100, warm_connections=2, keepalive_timeout=60,
+                 warm_timeout=5.0):
+        """
+        :param endpoint: search service endpoint
+        :param credential: ``AzureKeyCredential`` or async token credential
+        :param pool_size: maximum number of simultaneous connections to the service
+        :param warm_connections: connections opened per index by :meth:`start`
+        :param keepalive_timeout: seconds an idle connection is kept open
+        :param warm_timeout: seconds :meth:`start` waits for the warmup requests, which are
+            not retried; an unreachable service is logged and does not block startup
+        """
+        self.endpoint = endpoint
+        self.credential = credential
+        self.pool_size = pool_size
+        self.warm_connections = warm_connections
+        self.warm_timeout = warm_timeout
+        self.keepalive_timeout = keepalive_timeout
+        self._session = None
+        self._clients = {}
+
+    async def start(self, index_names=()):
+        """Open the session, create a client for each index and warm its connections.
+
+        Must be called from the running event loop, e.g. in the FastAPI lifespan.
+        """
+        connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=self.keepalive_timeout)
+        # same session options AioHttpTransport uses for the sessions it owns
+        self._session = aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar(),
+                                              auto_decompress=False, trust_env=True)
+        warmups = []
+        for index_name in index_names:
+            client = self.get(index_name)
+            warmups += [_warm_async(client.get_document_count, index_name, self.warm_timeout)
+                        for _ in range(self.warm_connections)]
+        try:
+            await asyncio.wait_for(asyncio.gather(*warmups), self.warm_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Search connection warmup not finished after %.1fs, continuing", self.warm_timeout)
+
+    def get(self, index_name):
+        """Return the client for ``index_name``, creating it on first use."""
+        client = self._clients.get(index_name)
+        if client is None:
+            transport = AioHttpTransport(session=self._session, session_owner=False)
+            client = AsyncSearchClient(self.endpoint, index_name, self.credential, transport=transport)
+            self._clients[index_name] = client
+        return client
+
+    async def close(self):
+        for client in self._clients.values():
+            await client.close()
+        self._clients = {}
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+def _warm(request, index_name, timeout):
+    try:
+        # one short attempt: a warmup must not hold startup through azure-core's retries
+        request(connection_timeout=timeout, read_timeout=timeout, retry_total=0)
+    except Exception as e:
+        logger.warning("Could not warm connection to search index %s: %s", index_name, e)
+
+
+async def _warm_async(request, index_name, timeout):
+    try:
+        await request(connection_timeout=timeout, read_timeout=timeout, retry_total=0)
+    except Exception as e:
+        logger.warning("Could not warm connection to search index %s: %s", index_name, e)
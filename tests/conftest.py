@@ -0,0 +1,101 @@
+import asyncio
+import time
+
+import pytest
+
+import webhook_queue
+
+
+class FakeRedis:
+    """The subset of ``redis.asyncio.Redis`` used by the app, in memory.
+
+    Lua scripts are not interpreted: ``register_script`` returns a Python
+    version of each script the app registers.
+    """
+
+    def __init__(self):
+        self.lists = {}
+        self.values = {}
+
+    def register_script(self, text):
+        scripts = {
+            webhook_queue._PUSH_BOUNDED: self._push_bounded,
+            webhook_queue._ACQUIRE_LEASE: self._acquire_lease,
+            webhook_queue._RELEASE_LEASE: self._release_lease,
+        }
+        return scripts[text]
+
+    async def _push_bounded(self, keys, args):
+        items = self.lists.setdefault(keys[0], [])
+        if len(items) >= int(args[0]):
+            return 0
+        items.append(args[1].encode("utf-8"))
+        return 1
+
+    async def _acquire_lease(self, keys, args):
+        owner = self._get(keys[0])
+        expires = time.monotonic() + int(args[1]) / 1000
+        if owner == args[0]:
+            self.values[keys[0]] = (owner, expires)
+            return 1
+        if owner is not None:
+            return 0
+        self.values[keys[0]] = (args[0], expires)
+        return 2
+
+    async def _release_lease(self, keys, args):
+        if self._get(keys[0]) == args[0]:
+            del self.values[keys[0]]
+            return 1
+        return 0
+
+    def _get(self, key):
+        value, expires = self.values.get(key, (None, None))
+        if expires is not None and expires <= time.monotonic():
+            del self.values[key]
+            return None
+        return value
+
+    async def get(self, key):
+        return self._get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and self._get(key) is not None:
+            return None
+        self.values[key] = (value, time.monotonic() + ex if ex else None)
+        return True
+
+    async def delete(self, key):
+        return 1 if self.values.pop(key, None) is not None else 0
+
+    async def lmove(self, source, destination, wherefrom, whereto):
+        items = self.lists.get(source)
+        if not items:
+            return None
+        value = items.pop() if wherefrom == "RIGHT" else items.pop(0)
+        target = self.lists.setdefault(destination, [])
+        if whereto == "LEFT":
+            target.insert(0, value)
+        else:
+            target.append(value)
+        return value
+
+    async def blmove(self, source, destination, timeout, wherefrom, whereto):
+        deadline = time.monotonic() + timeout
+        while True:
+            value = await self.lmove(source, destination, wherefrom, whereto)
+            if value is not None or time.monotonic() >= deadline:
+                return value
+            await asyncio.sleep(0.005)
+
+    async def lrem(self, key, count, value):
+        items = self.lists.get(key, [])
+        if value in items:
+            items.remove(value)
+            return 1
+        return 0
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
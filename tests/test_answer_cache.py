@@ -0,0 +1,23 @@
+import pytest
+
+from answer_cache import normalize_query
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("ราคาเท่าไหร่ครับ", "ราคาเท่าไหร่"),
+    ("ราคาเท่าไหร่ ค่ะ??", "ราคาเท่าไหร่"),
+    ("ราคา\u200bเท่าไหร่  คะ", "ราคาเท่าไหร่"),
+    ("ดีนะครับ", "ดีนะ"),
+    ("ขอบคุณ นะคะ!", "ขอบคุณ"),
+    ("Opening HOURS?", "opening hours"),
+    ("ครับ", "ครับ"),
+])
+def test_trailing_particles_and_punctuation_are_stripped(text, expected):
+    assert normalize_query(text) == expected
+
+
+@pytest.mark.parametrize("text", ["ชนะ", "วิธีตั้งค่า", "ใครเป็นเจ้า", "ทีมไหนชนะ"])
+def test_words_ending_like_a_particle_are_kept(text):
+    assert normalize_query(text) == text
+    assert normalize_query(text + "ครับ") == text
+    assert normalize_query(text + "นะ") == text
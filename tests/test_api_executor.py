@@ -0,0 +1,28 @@
+import threading
+
+from linebot.v3.executor import ApiExecutor
+from linebot.v3.messaging import ApiClient, Configuration
+
+
+def test_pool_keeps_apply_async():
+    results = []
+    called = threading.Event()
+    with ApiClient(Configuration(access_token="token"), pool_threads=2) as client:
+        future = client.pool.apply_async(lambda a, b=0: a + b, (1,), {"b": 2},
+                                         callback=lambda result: (results.append(result), called.set()))
+        assert future.get(timeout=5) == 3
+        assert called.wait(5)
+        assert future.ready() and future.successful()
+    assert results == [3]
+
+
+def test_apply_async_reports_errors():
+    errors = []
+    called = threading.Event()
+    executor = ApiExecutor(max_workers=1)
+    future = executor.apply_async(lambda: 1 / 0, error_callback=lambda error: (errors.append(error), called.set()))
+    future.wait(5)
+    assert called.wait(5)
+    assert not future.successful()
+    assert isinstance(errors[0], ZeroDivisionError)
+    executor.shutdown()
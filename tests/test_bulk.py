@@ -0,0 +1,132 @@
+import asyncio
+import json
+
+import pytest
+from linebot.v3.bulk import BulkProgress, MulticastSender
+from linebot.v3.messaging.exceptions import ApiException
+
+
+def api_error(status, **headers):
+    error = ApiException(status=status, reason="error")
+    error.headers = headers
+    return error
+
+
+class FakeMessagingApi:
+    """Records multicast requests; ``errors`` are raised by the first calls, in order."""
+
+    def __init__(self, errors=()):
+        self.errors = list(errors)
+        self.requests = []
+
+    async def multicast_json(self, body, x_line_retry_key=None):
+        self.requests.append((json.loads(body), x_line_retry_key))
+        if self.errors:
+            raise self.errors.pop(0)
+
+
+def send(api, user_ids, **kwargs):
+    sender = MulticastSender(api, rate=10000, backoff=0.001)
+    return asyncio.run(sender.send([{"type": "text", "text": "hello"}], user_ids, **kwargs))
+
+
+USERS = [f"U{n:04d}" for n in range(1234)]
+
+
+def test_recipients_are_chunked_by_500():
+    api = FakeMessagingApi()
+    progress = send(api, USERS, campaign_id="sale")
+    chunks = sorted((body["to"] for body, _ in api.requests), key=lambda to: to[0])
+    assert [len(to) for to in chunks] == [500, 500, 234]
+    assert sum(chunks, []) == USERS
+    assert all(body["messages"] == [{"type": "text", "text": "hello"}] for body, _ in api.requests)
+    assert (progress.chunks_sent, progress.recipients_sent) == (3, 1234)
+
+
+def test_async_iterable_of_recipients():
+    async def user_ids():
+        for user_id in USERS[:501]:
+            yield user_id
+
+    api = FakeMessagingApi()
+    send(api, user_ids())
+    assert sorted(len(body["to"]) for body, _ in api.requests) == [1, 500]
+
+
+def test_retry_key_is_stable_across_reruns():
+    def retry_keys(campaign_id):
+        api = FakeMessagingApi()
+        send(api, USERS, campaign_id=campaign_id)
+        return {tuple(body["to"]): key for body, key in api.requests}
+
+    first = retry_keys("sale")
+    assert retry_keys("sale") == first
+    assert len(set(first.values())) == 3
+    assert set(retry_keys("other sale").values()).isdisjoint(first.values())
+    assert set(retry_keys(None).values()).isdisjoint(first.values())
+
+
+def test_retry_reuses_the_retry_key():
+    api = FakeMessagingApi(errors=[api_error(500)])
+    progress = send(api, USERS[:10], campaign_id="sale")
+    assert len(api.requests) == 2
+    assert api.requests[0][1] == api.requests[1][1]
+    assert (progress.retries, progress.recipients_sent) == (1, 10)
+
+
+def test_conflict_with_accepted_request_id_counts_as_sent():
+    api = FakeMessagingApi(errors=[api_error(409, **{"x-line-accepted-request-id": "req-1"})])
+    progress = send(api, USERS[:10], campaign_id="sale")
+    assert len(api.requests) == 1
+    assert (progress.chunks_sent, progress.recipients_sent, progress.chunks_failed) == (1, 10, 0)
+
+
+def test_conflict_without_accepted_request_id_fails():
+    api = FakeMessagingApi(errors=[api_error(409)])
+    progress = send(api, USERS[:10])
+    assert (progress.chunks_sent, progress.chunks_failed) == (0, 1)
+
+
+def test_retry_after_is_honoured(monkeypatch):
+    delays = []
+    sleep = asyncio.sleep
+
+    async def recording_sleep(delay, *args, **kwargs):
+        delays.append(delay)
+        await sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", recording_sleep)
+    api = FakeMessagingApi(errors=[api_error(429, **{"Retry-After": "7"}), api_error(503)])
+    sender = MulticastSender(api, rate=10000, backoff=0.5, max_backoff=30.0)
+    progress = asyncio.run(sender.send([{"type": "text", "text": "hello"}], USERS[:10]))
+    # Retry-After for the 429, then exponential backoff (second attempt) for the 503
+    assert delays == [7.0, 1.0]
+    assert (progress.retries, progress.recipients_sent) == (2, 10)
+
+
+def test_retry_after_is_capped_by_max_backoff():
+    sender = MulticastSender(FakeMessagingApi(), max_backoff=5.0)
+    assert sender._retry_delay(0, {"Retry-After": "120"}) == 5.0
+    assert sender._retry_delay(0, {"Retry-After": "soon"}) == sender.backoff
+
+
+def test_failed_chunks_are_kept_in_progress():
+    errors = [api_error(500)] * 4 + [api_error(400)]
+    api = FakeMessagingApi(errors=errors)
+    sender = MulticastSender(api, rate=10000, concurrency=1, chunk_size=5, max_retries=3, backoff=0.001)
+    progress = asyncio.run(sender.send([{"type": "text", "text": "hello"}], USERS[:15], campaign_id="sale"))
+
+    assert isinstance(progress, BulkProgress)
+    assert (progress.chunks_sent, progress.recipients_sent) == (1, 5)
+    assert (progress.chunks_failed, progress.recipients_failed) == (2, 10)
+    assert progress.retries == 3
+    assert [failure.user_ids for failure in progress.failures] == [USERS[:5], USERS[5:10]]
+    assert [failure.error.status for failure in progress.failures] == [500, 400]
+    # a failure can be retried with the key of its first attempt
+    keys = {tuple(body["to"]): key for body, key in api.requests}
+    assert [failure.retry_key for failure in progress.failures] == [keys[tuple(USERS[:5])], keys[tuple(USERS[5:10])]]
+
+
+def test_chunk_size_is_limited_to_500():
+    with pytest.raises(ValueError):
+        MulticastSender(FakeMessagingApi(), chunk_size=501)
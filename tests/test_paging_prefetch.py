@@ -0,0 +1,291 @@
+import asyncio
+import gc
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from azure.core.async_paging import AsyncItemPaged, AsyncPrefetchPageIterator
+from azure.core.credentials import AzureKeyCredential
+from azure.core.exceptions import HttpResponseError
+from azure.core.paging import ItemPaged, PrefetchPageIterator
+from azure.search.documents import SearchClient
+from azure.search.documents.aio import SearchClient as AsyncSearchClient
+
+PAGES = 6
+PAGE_SIZE = 3
+
+
+class Pages:
+    """get_next/extract_data callbacks over PAGES pages, recording the fetches."""
+
+    def __init__(self, fail_at=None, delay=0.0):
+        self.fail_at = fail_at
+        self.delay = delay
+        self.fetched = 0
+
+    def get_next(self, token):
+        time.sleep(self.delay)
+        return self._fetch(token)
+
+    async def aget_next(self, token):
+        await asyncio.sleep(self.delay)
+        return self._fetch(token)
+
+    def _fetch(self, token):
+        page = int(token or 0)
+        if page == self.fail_at:
+            raise HttpResponseError(message=f"page {page} failed")
+        self.fetched += 1
+        return page
+
+    @staticmethod
+    def extract_data(page):
+        next_token = str(page + 1) if page + 1 < PAGES else None
+        return next_token, [page * PAGE_SIZE + i for i in range(PAGE_SIZE)]
+
+    async def aextract_data(self, page):
+        return self.extract_data(page)
+
+
+ALL_ITEMS = list(range(PAGES * PAGE_SIZE))
+
+
+def prefetch_threads():
+    return [thread for thread in threading.enumerate() if thread.name == "azure-core-prefetch"]
+
+
+def wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.mark.parametrize("prefetch_pages", [0, 1, 3, 10])
+def test_same_items_with_and_without_prefetch(prefetch_pages):
+    pages = Pages()
+    assert list(ItemPaged(pages.get_next, pages.extract_data, prefetch_pages=prefetch_pages)) == ALL_ITEMS
+
+
+@pytest.mark.parametrize("prefetch_pages", [1, 2])
+def test_at_most_prefetch_pages_fetched_ahead(prefetch_pages):
+    pages = Pages()
+    iterator = PrefetchPageIterator(
+        ItemPaged(pages.get_next, pages.extract_data).by_page(), prefetch_pages
+    )
+    for consumed in range(1, 3):
+        next(iterator)
+        assert wait_until(lambda: pages.fetched == consumed + prefetch_pages)
+        time.sleep(0.1)
+        assert pages.fetched == consumed + prefetch_pages
+    iterator.close()
+
+
+def test_error_is_raised_by_the_next_call_with_its_continuation_token():
+    pages = Pages(fail_at=3)
+    items = []
+    with pytest.raises(HttpResponseError) as error:
+        for item in ItemPaged(pages.get_next, pages.extract_data, prefetch_pages=2):
+            items.append(item)
+    assert items == ALL_ITEMS[:3 * PAGE_SIZE]
+    assert error.value.continuation_token == "3"
+
+
+def test_close_and_collection_stop_the_thread():
+    assert wait_until(lambda: not prefetch_threads())
+    pages = Pages(delay=0.01)
+    iterator = PrefetchPageIterator(ItemPaged(pages.get_next, pages.extract_data).by_page(), 1)
+    next(iterator)
+    assert len(prefetch_threads()) == 1
+    iterator.close()
+    assert wait_until(lambda: not prefetch_threads())
+    with pytest.raises(StopIteration):
+        next(iterator)
+
+    items = ItemPaged(pages.get_next, pages.extract_data, prefetch_pages=1)
+    next(items)
+    assert len(prefetch_threads()) == 1
+    del items
+    gc.collect()
+    assert wait_until(lambda: not prefetch_threads())
+
+
+@pytest.mark.parametrize("paged_class", [ItemPaged, AsyncItemPaged])
+def test_negative_prefetch_pages_is_rejected(paged_class):
+    pages = Pages()
+    with pytest.raises(ValueError):
+        paged_class(pages.get_next, pages.extract_data, prefetch_pages=-1)
+
+
+@pytest.mark.parametrize("prefetch_pages", [0, 1, 3, 10])
+def test_async_same_items_with_and_without_prefetch(prefetch_pages):
+    async def main():
+        pages = Pages()
+        return [item async for item in AsyncItemPaged(
+            pages.aget_next, pages.aextract_data, prefetch_pages=prefetch_pages)]
+
+    assert asyncio.run(main()) == ALL_ITEMS
+
+
+@pytest.mark.parametrize("prefetch_pages", [1, 2])
+def test_async_at_most_prefetch_pages_fetched_ahead(prefetch_pages):
+    async def main():
+        pages = Pages()
+        iterator = AsyncPrefetchPageIterator(
+            AsyncItemPaged(pages.aget_next, pages.aextract_data).by_page(), prefetch_pages
+        )
+        for consumed in range(1, 3):
+            await iterator.__anext__()
+            await asyncio.sleep(0.05)
+            assert pages.fetched == consumed + prefetch_pages
+        await iterator.aclose()
+
+    asyncio.run(main())
+
+
+def test_async_error_is_raised_by_the_next_call_with_its_continuation_token():
+    async def main():
+        pages = Pages(fail_at=3)
+        items = []
+        with pytest.raises(HttpResponseError) as error:
+            async for item in AsyncItemPaged(pages.aget_next, pages.aextract_data, prefetch_pages=2):
+                items.append(item)
+        return items, error.value.continuation_token
+
+    assert asyncio.run(main()) == (ALL_ITEMS[:3 * PAGE_SIZE], "3")
+
+
+def test_async_base_exception_is_forwarded():
+    class Stop(BaseException):
+        pass
+
+    async def main():
+        async def get_next(token):
+            if token == "2":
+                raise Stop()
+            return int(token or 0)
+
+        items = []
+        with pytest.raises(Stop):
+            async for item in AsyncItemPaged(get_next, Pages().aextract_data, prefetch_pages=2):
+                items.append(item)
+        return items
+
+    assert asyncio.run(main()) == ALL_ITEMS[:2 * PAGE_SIZE]
+
+
+def test_async_aclose_and_collection_cancel_the_task():
+    async def main():
+        pages = Pages(delay=0.01)
+        iterator = AsyncPrefetchPageIterator(AsyncItemPaged(pages.aget_next, pages.aextract_data).by_page(), 1)
+        await iterator.__anext__()
+        task = iterator._task
+        await iterator.aclose()
+        assert task.cancelled()
+        with pytest.raises(StopAsyncIteration):
+            await iterator.__anext__()
+
+        items = AsyncItemPaged(pages.aget_next, pages.aextract_data, prefetch_pages=1)
+        await items.__anext__()
+        task = items._page_iterator._task
+        del items
+        gc.collect()
+        await asyncio.sleep(0.05)
+        assert task.cancelled()
+
+    asyncio.run(main())
+
+
+def test_async_dead_task_does_not_hang_the_consumer():
+    async def main():
+        async def get_next(token):
+            await asyncio.sleep(0 if token is None else 10)
+            return int(token or 0)
+
+        items = AsyncItemPaged(get_next, Pages().aextract_data, prefetch_pages=1)
+        await items.__anext__()
+        asyncio.get_running_loop().call_later(0.05, items._page_iterator._task.cancel)
+        for _ in range(PAGE_SIZE - 1):
+            await items.__anext__()
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(items.__anext__(), 2)
+
+    asyncio.run(main())
+
+
+class SearchHandler(BaseHTTPRequestHandler):
+    """Search endpoint returning PAGES pages of PAGE_SIZE results."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        skip = request.get("skip") or 0
+        time.sleep(0.005)
+        body = {
+            "@odata.count": PAGES * PAGE_SIZE,
+            "value": [{"@search.score": 1.0, "id": str(n)} for n in range(skip, skip + PAGE_SIZE)],
+        }
+        if skip == 0:
+            body["@search.facets"] = {"category": [{"count": 3, "value": "hotel"}]}
+        if skip + PAGE_SIZE < PAGES * PAGE_SIZE:
+            body["@odata.nextLink"] = "https://example/next"
+            body["@search.nextPageParameters"] = {"search": request.get("search"), "skip": skip + PAGE_SIZE}
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture(scope="module")
+def search_endpoint():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SearchHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+ALL_IDS = [str(n) for n in range(PAGES * PAGE_SIZE)]
+
+
+@pytest.mark.parametrize("raw_results", [False, True])
+@pytest.mark.parametrize("prefetch_pages", [0, 2])
+def test_search_same_results_with_and_without_prefetch(search_endpoint, raw_results, prefetch_pages):
+    client = SearchClient(search_endpoint, "hotels", AzureKeyCredential("key"))
+    results = client.search("hotel", raw_results=raw_results, prefetch_pages=prefetch_pages)
+    assert [result["id"] for result in results] == ALL_IDS
+
+
+@pytest.mark.parametrize("raw_results", [False, True])
+def test_search_getters_do_not_disturb_prefetch(search_endpoint, raw_results):
+    client = SearchClient(search_endpoint, "hotels", AzureKeyCredential("key"))
+    results = client.search("hotel", raw_results=raw_results, prefetch_pages=2)
+    first = next(results)
+    time.sleep(0.05)
+    assert results.get_count() == PAGES * PAGE_SIZE
+    assert results.get_facets() == {"category": [{"count": 3, "value": "hotel"}]}
+    assert [first["id"]] + [result["id"] for result in results] == ALL_IDS
+
+
+@pytest.mark.parametrize("raw_results", [False, True])
+def test_async_search_prefetch(search_endpoint, raw_results):
+    async def main():
+        async with AsyncSearchClient(search_endpoint, "hotels", AzureKeyCredential("key")) as client:
+            plain = [result["id"] async for result in await client.search("hotel", raw_results=raw_results)]
+            results = await client.search("hotel", raw_results=raw_results, prefetch_pages=2)
+            first = await results.__anext__()
+            await asyncio.sleep(0.05)
+            count = await results.get_count()
+            prefetched = [first["id"]] + [result["id"] async for result in results]
+            return plain, prefetched, count
+
+    plain, prefetched, count = asyncio.run(main())
+    assert plain == prefetched == ALL_IDS
+    assert count == PAGES * PAGE_SIZE
@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+
+from profile_cache import ProfileCache
+
+
+class NotFound(Exception):
+    pass
+
+
+class Loader:
+    """``fetch`` counting its calls; users in ``missing`` have no profile."""
+
+    def __init__(self, delay=0.0, missing=()):
+        self.delay = delay
+        self.missing = set(missing)
+        self.calls = 0
+
+    async def __call__(self, user_id):
+        self.calls += 1
+        call = self.calls
+        await asyncio.sleep(self.delay)
+        if user_id in self.missing:
+            raise NotFound(user_id)
+        return f"{user_id}#{call}"
+
+
+def profile_cache(loader, **kwargs):
+    return ProfileCache(loader, is_not_found=lambda error: isinstance(error, NotFound), **kwargs)
+
+
+def test_concurrent_gets_load_once():
+    async def main():
+        loader = Loader(delay=0.05)
+        cache = profile_cache(loader)
+        profiles = await asyncio.gather(*(cache.get("U1") for _ in range(10)))
+        return loader.calls, profiles, cache.stats
+
+    calls, profiles, stats = asyncio.run(main())
+    assert calls == 1
+    assert profiles == ["U1#1"] * 10
+    assert stats["coalesced"] == 9
+
+
+def test_cancelled_caller_does_not_cancel_the_load():
+    async def main():
+        loader = Loader(delay=0.05)
+        cache = profile_cache(loader)
+        first = asyncio.ensure_future(cache.get("U1"))
+        second = asyncio.ensure_future(cache.get("U1"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second, loader.calls
+
+    assert asyncio.run(main()) == ("U1#1", 1)
+
+
+def test_errors_are_raised_and_not_cached():
+    async def main():
+        calls = []
+
+        async def fetch(user_id):
+            calls.append(user_id)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            return "profile"
+
+        cache = ProfileCache(fetch)
+        with pytest.raises(RuntimeError):
+            await cache.get("U1")
+        return await cache.get("U1"), len(calls)
+
+    assert asyncio.run(main()) == ("profile", 2)
+
+
+def test_forget_during_load_does_not_repopulate(fake_redis):
+    async def main():
+        loader = Loader(delay=0.05)
+        cache = profile_cache(loader, redis=fake_redis, dumps=str, loads=str)
+        loading = asyncio.ensure_future(cache.get("U1"))
+        await asyncio.sleep(0.01)
+        cache.forget("U1")
+        # the waiter still gets an answer
+        assert await loading == "U1#1"
+        assert len(cache) == 0
+        assert await fake_redis.get("linebot:profile:U1") is None
+        # the next get loads the profile again
+        return await cache.get("U1"), loader.calls
+
+    assert asyncio.run(main()) == ("U1#2", 2)
+
+
+def test_get_after_forget_does_not_read_the_deleted_redis_entry(fake_redis):
+    delete = fake_redis.delete
+
+    async def slow_delete(key):
+        await asyncio.sleep(0.02)
+        return await delete(key)
+
+    fake_redis.delete = slow_delete
+
+    async def main():
+        cache = profile_cache(Loader(), redis=fake_redis, dumps=str, loads=str)
+        await fake_redis.set("linebot:profile:U1", "stale")
+        cache.forget("U1")
+        return await cache.get("U1")
+
+    assert asyncio.run(main()) == "U1#1"
+
+
+def test_missing_profile_is_cached_for_negative_ttl():
+    async def main():
+        loader = Loader(missing={"U1"})
+        cache = profile_cache(loader, ttl=60, negative_ttl=0.05)
+        results = [await cache.get("U1"), await cache.get("U1")]
+        calls_within_ttl = loader.calls
+        await asyncio.sleep(0.06)
+        results.append(await cache.get("U1"))
+        return results, calls_within_ttl, loader.calls
+
+    results, calls_within_ttl, calls = asyncio.run(main())
+    assert results == [None, None, None]
+    assert calls_within_ttl == 1
+    assert calls == 2
+
+
+def test_forget_clears_a_missing_profile():
+    async def main():
+        loader = Loader(missing={"U1"})
+        cache = profile_cache(loader)
+        assert await cache.get("U1") is None
+        loader.missing.clear()
+        cache.forget("U1")
+        return await cache.get("U1")
+
+    assert asyncio.run(main()) == "U1#2"
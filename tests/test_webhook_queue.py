@@ -0,0 +1,194 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+
+import pytest
+from linebot.models import MessageEvent, TextMessage
+
+from webhook_handler import AsyncWebhookHandler
+from webhook_queue import MemoryBackend, QueueFullError, RedisBackend, WebhookQueue
+
+SECRET = "secret"
+
+
+def webhook_body(*events):
+    body = json.dumps({"destination": "Ubot", "events": list(events)}).encode("utf-8")
+    signature = base64.b64encode(hmac.new(SECRET.encode("utf-8"), body, hashlib.sha256).digest()).decode("ascii")
+    return body, signature
+
+
+def text_event(text, user_id="U1", event_id=None, **source):
+    return {
+        "type": "message", "mode": "active", "timestamp": 1700000000000, "replyToken": "r",
+        "webhookEventId": event_id or f"{user_id}-{text}",
+        "source": {"type": "group" if "groupId" in source else "user", "userId": user_id, **source},
+        "message": {"type": "text", "id": "1", "text": text},
+    }
+
+
+def recording_handler(seen, delay=0.0, gate=None):
+    handler = AsyncWebhookHandler(SECRET)
+
+    @handler.add(MessageEvent, message=TextMessage)
+    async def handle(event):
+        if gate is not None:
+            await gate.wait()
+        await asyncio.sleep(delay)
+        seen.append((event.source.user_id, event.message.text))
+
+    return handler
+
+
+async def wait_for(condition, timeout=5.0):
+    async def poll():
+        while not condition():
+            await asyncio.sleep(0.01)
+    await asyncio.wait_for(poll(), timeout)
+
+
+def test_memory_backend_keeps_order_per_source():
+    async def main():
+        seen = []
+        queue = WebhookQueue(recording_handler(seen, delay=0.001), workers=4)
+        await queue.start()
+        for n in range(20):
+            await queue.submit(*webhook_body(text_event(str(n), "U1"), text_event(str(n), "U2")))
+        await queue.stop()
+        return seen
+
+    seen = asyncio.run(main())
+    for user_id in ("U1", "U2"):
+        assert [text for user, text in seen if user == user_id] == [str(n) for n in range(20)]
+
+
+def test_group_events_share_a_shard():
+    queue = WebhookQueue(recording_handler([]), workers=8)
+    shards = {queue._shard(text_event("hi", user_id, groupId="G1")) for user_id in ("U1", "U2", "U3", "U4")}
+    assert len(shards) == 1
+
+
+def test_redelivered_events_are_dropped():
+    async def main():
+        seen = []
+        queue = WebhookQueue(recording_handler(seen), workers=2)
+        await queue.start()
+        body, signature = webhook_body(text_event("hi", event_id="E1"), text_event("again", event_id="E2"))
+        first = await queue.submit(body, signature)
+        second = await queue.submit(*webhook_body(text_event("hi", event_id="E1")))
+        await queue.stop()
+        return first, second, seen
+
+    first, second, seen = asyncio.run(main())
+    assert (first, second) == (2, 0)
+    assert sorted(seen) == [("U1", "again"), ("U1", "hi")]
+
+
+def test_memory_dedup_expires():
+    async def main():
+        backend = MemoryBackend()
+        results = [await backend.mark_seen("E1", 0.05), await backend.mark_seen("E1", 0.05)]
+        await asyncio.sleep(0.06)
+        results.append(await backend.mark_seen("E1", 0.05))
+        return results
+
+    assert asyncio.run(main()) == [True, False, True]
+
+
+def test_queue_full_error_forgets_the_event():
+    async def main():
+        gate = asyncio.Event()
+        seen = []
+        queue = WebhookQueue(recording_handler(seen, gate=gate), workers=1,
+                             backend=MemoryBackend(maxsize=1), enqueue_timeout=0.05)
+        await queue.start()
+        await queue.submit(*webhook_body(text_event("1")))
+        await wait_for(lambda: queue.depth() == 0)
+        await queue.submit(*webhook_body(text_event("2")))
+        with pytest.raises(QueueFullError):
+            await queue.submit(*webhook_body(text_event("3")))
+        gate.set()
+        await wait_for(lambda: len(seen) == 2)
+        # the rejected event was not remembered, so LINE's retry is accepted
+        assert await queue.submit(*webhook_body(text_event("3"))) == 1
+        await queue.stop()
+        return seen
+
+    assert [text for _, text in asyncio.run(main())] == ["1", "2", "3"]
+
+
+def test_redis_put_applies_backpressure(fake_redis):
+    async def main():
+        backend = RedisBackend(fake_redis, maxsize=2)
+        await backend.put(0, {"n": 1}, 0.05)
+        await backend.put(0, {"n": 2}, 0.05)
+        with pytest.raises(QueueFullError):
+            await backend.put(0, {"n": 3}, 0.05)
+
+    asyncio.run(main())
+
+
+def test_redis_lease_expiry_hands_the_shard_over(fake_redis):
+    async def main():
+        crashed = RedisBackend(fake_redis, lease_ttl=0.3)
+        await crashed.open(1)
+        await crashed.put(0, {"n": 1}, 1)
+        await crashed.put(0, {"n": 2}, 1)
+        assert (await crashed.get(0))["n"] == 1
+
+        other = RedisBackend(fake_redis, lease_ttl=0.3)
+        await other.open(1)
+        # the lease is held: the other process must not take the shard
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(other.get(0), 0.15)
+
+        # crash: no more renewals, no release, the in-flight item is never done
+        crashed._heartbeat.cancel()
+        first = await asyncio.wait_for(other.get(0), 2)
+        second = await asyncio.wait_for(other.get(0), 2)
+        await other.close()
+        return first["n"], second["n"]
+
+    # the recovered in-flight item comes first
+    assert asyncio.run(main()) == (1, 2)
+
+
+def test_redis_lease_is_renewed_while_alive(fake_redis):
+    async def main():
+        owner = RedisBackend(fake_redis, lease_ttl=0.15)
+        await owner.open(1)
+        await owner.put(0, {"n": 1}, 1)
+        await owner.get(0)
+        other = RedisBackend(fake_redis, lease_ttl=0.15)
+        await other.open(1)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(other.get(0), 0.5)
+        await owner.close()
+        await other.close()
+
+    asyncio.run(main())
+
+
+def test_stop_leaves_in_flight_events_to_the_next_process(fake_redis):
+    async def main():
+        seen = []
+        gate = asyncio.Event()
+        first = WebhookQueue(recording_handler(seen, gate=gate), workers=2,
+                             backend=RedisBackend(fake_redis, lease_ttl=0.3))
+        await first.start()
+        await first.submit(*webhook_body(text_event("in flight")))
+        await wait_for(lambda: any(key.startswith("linebot:webhook:processing:") and items
+                                   for key, items in fake_redis.lists.items()))
+        await first.stop(drain_timeout=0.01)
+        assert seen == []
+
+        second = WebhookQueue(recording_handler(seen), workers=2, backend=RedisBackend(fake_redis, lease_ttl=0.3))
+        await second.start()
+        await wait_for(lambda: seen)
+        await second.stop()
+        return seen, fake_redis.lists
+
+    seen, lists = asyncio.run(main())
+    assert seen == [("U1", "in flight")]
+    assert not any(lists.values())
@@ -0,0 +1,330 @@
+"""Acknowledge-then-process stage for LINE webhook events.
+
+``/callback`` validates the signature, hands the events to a
+:class:`WebhookQueue` and returns immediately. A pool of asyncio workers
+drains the queue and runs the handlers, so a slow LLM answer never holds
+the webhook response past LINE's timeout.
+
+Events are sharded by source (group, room or user) so that one
+conversation is always processed by the same worker, in order. Redelivered
+events are dropped using their ``webhookEventId``.
+"""
+import asyncio
+import json
+import logging
+import time
+import uuid
+import zlib
+from collections import OrderedDict
+
+from linebot.exceptions import InvalidSignatureError
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(Exception):
+    """Raised when an event cannot be enqueued before the enqueue timeout."""
+
+
+class MemoryBackend:
+    """In-process backend: one bounded ``asyncio.Queue`` per shard."""
+
+    def __init__(self, maxsize=1000, dedup_size=10000):
+        self.maxsize = maxsize
+        self.dedup_size = dedup_size
+        self._queues = []
+        self._seen = OrderedDict()
+
+    async def open(self, shards):
+        self._queues = [asyncio.Queue(self.maxsize) for _ in range(shards)]
+
+    async def drain(self, timeout):
+        await asyncio.wait_for(asyncio.gather(*(queue.join() for queue in self._queues)), timeout)
+
+    async def close(self):
+        pass
+
+    async def put(self, shard, item, timeout):
+        try:
+            await asyncio.wait_for(self._queues[shard].put(item), timeout)
+        except asyncio.TimeoutError:
+            raise QueueFullError(f"shard {shard} is full")
+
+    async def get(self, shard):
+        return await self._queues[shard].get()
+
+    async def done(self, shard, item):
+        self._queues[shard].task_done()
+
+    async def mark_seen(self, event_id, ttl):
+        """Record ``event_id``; return False if it was already recorded within ``ttl``."""
+        now = time.monotonic()
+        expires = self._seen.get(event_id)
+        if expires is not None and expires > now:
+            return False
+        self._seen[event_id] = now + ttl
+        self._seen.move_to_end(event_id)
+        while len(self._seen) > self.dedup_size:
+            self._seen.popitem(last=False)
+        return True
+
+    async def forget(self, event_id):
+        self._seen.pop(event_id, None)
+
+    def depth(self):
+        return sum(queue.qsize() for queue in self._queues)
+
+
+# RPUSH only while the list is shorter than ARGV[1], atomically across producers
+_PUSH_BOUNDED = """
+if redis.call('LLEN', KEYS[1]) >= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('RPUSH', KEYS[1], ARGV[2])
+return 1
+"""
+
+# Renew the lease if ARGV[1] holds it (1), take it if nobody does (2), else 0
+_ACQUIRE_LEASE = """
+local owner = redis.call('GET', KEYS[1])
+if owner == ARGV[1] then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    return 1
+end
+if owner then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+return 2
+"""
+
+_RELEASE_LEASE = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisBackend:
+    """Durable backend on ``redis.asyncio``: one list per shard.
+
+    Several processes (workers of one server, or old and new ones during a
+    rolling deploy) may share the lists. Each shard is consumed by one
+    process at a time, the holder of the shard's lease, which it renews
+    every ``lease_ttl / 3`` seconds. Items being processed are parked in the
+    shard's ``processing`` list; when a lease expires (the holder crashed or
+    hung) or is released at shutdown, the next holder moves them back to
+    the pending list first, so events survive a worker crash or redeploy and
+    keep their order.
+    """
+
+    def __init__(self, client, prefix="linebot:webhook", maxsize=1000, poll_interval=0.05, lease_ttl=30.0):
+        self.client = client
+        self.prefix = prefix
+        self.maxsize = maxsize
+        self.poll_interval = poll_interval
+        self.lease_ttl = lease_ttl
+        self.consumer_id = uuid.uuid4().hex
+        self.shards = 0
+        self._leases = set()
+        self._heartbeat = None
+        self._push_bounded = client.register_script(_PUSH_BOUNDED)
+        self._acquire_lease = client.register_script(_ACQUIRE_LEASE)
+        self._release_lease = client.register_script(_RELEASE_LEASE)
+
+    def _pending(self, shard):
+        return f"{self.prefix}:pending:{shard}"
+
+    def _processing(self, shard):
+        return f"{self.prefix}:processing:{shard}"
+
+    def _lease(self, shard):
+        return f"{self.prefix}:lease:{shard}"
+
+    async def open(self, shards):
+        self.shards = shards
+        self._heartbeat = asyncio.create_task(self._renew_leases())
+
+    async def drain(self, timeout):
+        pass
+
+    async def close(self):
+        # the client is owned, and closed, by the caller
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            await asyncio.gather(self._heartbeat, return_exceptions=True)
+            self._heartbeat = None
+        # let the next process take over the shards, and their unfinished items, right away
+        for shard in list(self._leases):
+            try:
+                await self._release_lease(keys=[self._lease(shard)], args=[self.consumer_id])
+            except Exception as e:
+                logger.warning("Could not release webhook shard %d: %s", shard, e)
+        self._leases.clear()
+
+    async def put(self, shard, item, timeout):
+        deadline = time.monotonic() + timeout
+        raw = json.dumps(item)
+        while not await self._push_bounded(keys=[self._pending(shard)], args=[self.maxsize, raw]):
+            if time.monotonic() >= deadline:
+                raise QueueFullError(f"shard {shard} is full")
+            await asyncio.sleep(self.poll_interval)
+
+    async def get(self, shard):
+        while True:
+            if shard not in self._leases and not await self._acquire(shard):
+                await asyncio.sleep(self.lease_ttl / 3)
+                continue
+            raw = await self.client.blmove(self._pending(shard), self._processing(shard), 1, "LEFT", "RIGHT")
+            if raw is not None:
+                item = json.loads(raw)
+                item["_raw"] = raw
+                return item
+
+    async def _acquire(self, shard):
+        result = await self._acquire_lease(keys=[self._lease(shard)],
+                                           args=[self.consumer_id, int(self.lease_ttl * 1000)])
+        if not result:
+            return False
+        self._leases.add(shard)
+        if result == 2:
+            # the previous holder is gone: its unfinished items go first
+            recovered = 0
+            while await self.client.lmove(self._processing(shard), self._pending(shard), "RIGHT", "LEFT"):
+                recovered += 1
+            if recovered:
+                logger.info("Recovered %d unfinished webhook events of shard %d", recovered, shard)
+        return True
+
+    async def _renew_leases(self):
+        while True:
+            await asyncio.sleep(self.lease_ttl / 3)
+            for shard in list(self._leases):
+                try:
+                    renewed = await self._acquire_lease(keys=[self._lease(shard)],
+                                                        args=[self.consumer_id, int(self.lease_ttl * 1000)])
+                except Exception as e:
+                    logger.warning("Could not renew webhook shard %d: %s", shard, e)
+                    continue
+                if not renewed:
+                    # expired and taken over by another process, which recovers our in-flight item
+                    logger.warning("Lost the lease of webhook shard %d", shard)
+                    self._leases.discard(shard)
+
+    async def done(self, shard, item):
+        await self.client.lrem(self._processing(shard), 1, item["_raw"])
+
+    async def mark_seen(self, event_id, ttl):
+        return bool(await self.client.set(f"{self.prefix}:seen:{event_id}", 1, ex=int(ttl), nx=True))
+
+    async def forget(self, event_id):
+        await self.client.delete(f"{self.prefix}:seen:{event_id}")
+
+    def depth(self):
+        return None
+
+
+class WebhookQueue:
+    """Bounded, per-source ordered worker pool in front of an ``AsyncWebhookHandler``."""
+
+    def __init__(self, handler, workers=8, backend=None, enqueue_timeout=1.0, dedup_ttl=3600,
+                 use_raw_message=False, observe=None):
+        """
+        :param handler: ``webhook_handler.AsyncWebhookHandler`` with the event handlers registered
+        :param workers: number of shards / concurrent workers
+        :param backend: ``MemoryBackend`` (default) or ``RedisBackend``
+        :param enqueue_timeout: seconds to wait for room in a full shard before
+            :class:`QueueFullError` is raised
+        :param dedup_ttl: seconds a ``webhookEventId`` is remembered
+        :param observe: optional ``observe(stage, seconds)`` callback timing the
+            ``signature``, ``parse``, ``queue_wait`` and ``dispatch`` stages
+        """
+        self.handler = handler
+        self.workers = workers
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.enqueue_timeout = enqueue_timeout
+        self.dedup_ttl = dedup_ttl
+        self.use_raw_message = use_raw_message
+        self.observe = observe or _ignore
+        self._tasks = []
+
+    async def start(self):
+        await self.backend.open(self.workers)
+        self._tasks = [asyncio.create_task(self._worker(shard)) for shard in range(self.workers)]
+
+    async def stop(self, drain_timeout=10.0):
+        """Stop the workers, first waiting up to ``drain_timeout`` seconds for queued events."""
+        try:
+            await self.backend.drain(drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Webhook queue not drained after %.1fs", drain_timeout)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await self.backend.close()
+
+    async def submit(self, body, signature):
+        """Validate ``body`` and enqueue its events; return the number enqueued.
+
+        ``body`` may be the raw request bytes; the signature is checked over
+        them as received.
+
+        Raises ``InvalidSignatureError`` for a bad signature and
+        :class:`QueueFullError` when the queue applies backpressure.
+        """
+        started = time.perf_counter()
+        if not self.handler.validate(body, signature):
+            raise InvalidSignatureError("Invalid signature. signature=" + signature)
+        validated = time.perf_counter()
+        self.observe("signature", validated - started)
+
+        body_json = json.loads(body)
+        self.observe("parse", time.perf_counter() - validated)
+        destination = body_json.get("destination")
+        enqueued = 0
+        for event in body_json["events"]:
+            event_id = event.get("webhookEventId")
+            if event_id is not None and not await self.backend.mark_seen(event_id, self.dedup_ttl):
+                logger.info("Dropping duplicate webhook event %s", event_id)
+                continue
+            try:
+                item = {"destination": destination, "event": event, "enqueued": time.time()}
+                await self.backend.put(self._shard(event), item, self.enqueue_timeout)
+            except QueueFullError:
+                if event_id is not None:
+                    await self.backend.forget(event_id)
+                raise
+            enqueued += 1
+        return enqueued
+
+    def depth(self):
+        """Number of events waiting in memory, or None for external backends."""
+        return self.backend.depth()
+
+    def _shard(self, event):
+        source = event.get("source") or {}
+        key = source.get("groupId") or source.get("roomId") or source.get("userId") or event.get("webhookEventId", "")
+        return zlib.crc32(key.encode("utf-8")) % self.workers
+
+    async def _worker(self, shard):
+        parse_options = {"use_raw_message": True} if self.use_raw_message else {}
+        while True:
+            item = await self.backend.get(shard)
+            self.observe("queue_wait", max(0.0, time.time() - item.get("enqueued", time.time())))
+            try:
+                started = time.perf_counter()
+                event = self.handler.parse_event(item["event"], **parse_options)
+                await self.handler.dispatch(event, item["destination"])
+                self.observe("dispatch", time.perf_counter() - started)
+            except asyncio.CancelledError:
+                # stopped mid-dispatch: leave the item to be recovered, not removed
+                raise
+            except Exception:
+                logger.exception("Webhook event handler failed")
+            await self.backend.done(shard, item)
+
+
+def _ignore(stage, seconds):
+    pass